@@ -0,0 +1,111 @@
+from collections import Counter
+from contextlib import ExitStack
+from sys import getsizeof
+from tracemalloc import (
+    start,
+    stop,
+    take_snapshot,
+)
+from typing import (
+    Any,
+    Callable,
+    Counter as CounterType,
+    List,
+    Type,
+)
+from unittest.mock import patch
+
+from lpp.evaluator import evaluate
+from lpp.lexer import tokenize
+from lpp.object import (
+    Environment,
+    Error,
+    Function,
+    Integer,
+    Object,
+    Return,
+    String,
+)
+from lpp.parser import Parser
+
+
+# Un ciclo hecho con recursión, como los scripts que más se ejecutan
+_LOOP: str = '''
+    variable cuenta = procedimiento(n, total) {
+        si (n == 0) {
+            regresa total;
+        }
+        variable siguiente = n - 1;
+        regresa cuenta(siguiente, total + n * 2 - n);
+    };
+    cuenta(1000, 0);
+'''
+
+_CLASSES: List[Type[Any]] = [Integer, String, Return, Error, Function, Environment]
+
+
+class _WithDict:
+    # Cómo eran los objetos antes de __slots__, solo para comparar el tamaño
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+
+
+def _counting(cls: Type[Any], counts: CounterType[str]) -> Callable[..., None]:
+    original = cls.__init__
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        counts[cls.__name__] += 1
+        original(self, *args, **kwargs)
+
+    return __init__
+
+
+def _run(small_integers: bool) -> CounterType[str]:
+    program = Parser(tokenize(_LOOP)).parse_program()
+    counts: CounterType[str] = Counter()
+
+    with ExitStack() as stack:
+        for cls in _CLASSES:
+            stack.enter_context(patch.object(cls, '__init__', _counting(cls, counts)))
+
+        if not small_integers:
+            stack.enter_context(patch('lpp.evaluator.new_integer', Integer))
+
+        result = evaluate(program, Environment())
+
+    assert isinstance(result, Object)
+    return counts
+
+
+def _bytes_per_object(cls: Type[Any]) -> float:
+    count = 10000
+
+    start()
+    before = take_snapshot()
+    objects = [cls(value) for value in range(1000, 1000 + count)]
+    after = take_snapshot()
+    stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objects
+
+    # Sin contar la lista ni los int de Python, que son iguales en los dos casos
+    return (allocated - getsizeof([None] * count)) / count - 28
+
+
+def main() -> None:
+    before = _run(small_integers=False)
+    after = _run(small_integers=True)
+
+    print(f'{"objeto":>12} {"antes":>8} {"después":>8}')
+    for cls in _CLASSES:
+        print(f'{cls.__name__:>12} {before[cls.__name__]:>8} {after[cls.__name__]:>8}')
+    print(f'{"total":>12} {sum(before.values()):>8} {sum(after.values()):>8}')
+
+    print(f'Memoria por Integer: {_bytes_per_object(_WithDict):.0f} bytes con __dict__, '
+          f'{_bytes_per_object(Integer):.0f} bytes con __slots__')
+
+
+if __name__ == '__main__':
+    main()
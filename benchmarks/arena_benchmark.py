@@ -0,0 +1,58 @@
+from gc import collect
+from timeit import timeit
+from tracemalloc import (
+    get_traced_memory,
+    start,
+    stop,
+)
+
+from benchmarks.programs import generate_program
+from lpp.arena import Arena
+from lpp.cache import (
+    dump_program,
+    load_program,
+)
+from lpp.lexer import tokenize
+from lpp.parser import Parser
+
+
+def main() -> None:
+    buffer = tokenize(generate_program(2_000))
+    for index in range(len(buffer)):
+        buffer.literal(index)
+
+    collect()
+    start()
+    program = Parser(buffer).parse_program()
+    collect()
+    tree_memory, _ = get_traced_memory()
+    stop()
+
+    arena = Arena.from_program(program)
+    del program
+    collect()
+
+    start()
+    arena = Arena.from_bytes(arena.to_bytes())
+    collect()
+    arena_memory, _ = get_traced_memory()
+    stop()
+
+    nodes = len(arena)
+    print(f'Nodos: {nodes}')
+    print(f'Árbol: {tree_memory / 1024 / 1024:.2f} MB, {tree_memory / nodes:.1f} bytes/nodo')
+    print(f'Arena: {arena_memory / 1024 / 1024:.2f} MB, {arena_memory / nodes:.1f} bytes/nodo')
+
+    program = arena.to_program()
+    tree_data = dump_program(program)
+    arena_data = arena.to_bytes()
+    repetitions = 10
+
+    tree_load = timeit(lambda: load_program(tree_data), number=repetitions) / repetitions
+    arena_load = timeit(lambda: Arena.from_bytes(arena_data), number=repetitions) / repetitions
+    print(f'Cargar árbol: {len(tree_data)} bytes, {tree_load * 1000:.2f} ms')
+    print(f'Cargar arena: {len(arena_data)} bytes, {arena_load * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
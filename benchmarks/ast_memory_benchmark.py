@@ -0,0 +1,59 @@
+from gc import collect
+from tracemalloc import (
+    get_traced_memory,
+    start,
+    stop,
+)
+from typing import (
+    Any,
+    List,
+)
+
+from benchmarks.programs import generate_program
+from lpp.ast import (
+    ASTNode,
+    Program,
+)
+from lpp.lexer import tokenize
+from lpp.parser import Parser
+
+
+def _count_nodes(program: Program) -> int:
+    nodes = 0
+    pending: List[Any] = [program]
+
+    while pending:
+        node = pending.pop()
+        if type(node) == list:
+            pending.extend(node)
+        elif isinstance(node, ASTNode):
+            nodes += 1
+            for slot in ('statements', 'name', 'value', 'return_value', 'expression', 'right',
+                         'left', 'condition', 'consequence', 'alternative', 'parameters',
+                         'body', 'function', 'arguments'):
+                child = getattr(node, slot, None)
+                if isinstance(child, (ASTNode, list)):
+                    pending.append(child)
+
+    return nodes
+
+
+def main() -> None:
+    buffer = tokenize(generate_program(2_000))
+    for index in range(len(buffer)):
+        buffer.literal(index)
+
+    collect()
+    start()
+    program = Parser(buffer).parse_program()
+    collect()
+    memory, _ = get_traced_memory()
+    stop()
+
+    nodes = _count_nodes(program)
+    print(f'Nodos: {nodes}')
+    print(f'Memoria del árbol: {memory / 1024 / 1024:.2f} MB, {memory / nodes:.1f} bytes/nodo')
+
+
+if __name__ == '__main__':
+    main()
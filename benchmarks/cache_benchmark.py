@@ -0,0 +1,23 @@
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.programs import generate_program
+from lpp.cache import ASTCache
+
+
+def main() -> None:
+    source = generate_program(2_000)
+
+    with TemporaryDirectory() as directory:
+        cache = ASTCache(directory)
+
+        for run in ('frío', 'caliente'):
+            start = perf_counter()
+            cache.parse(source)
+            print(f'Arranque {run}: {perf_counter() - start:.3f}s')
+
+        print(f'Aciertos: {cache.hits}, fallos: {cache.misses}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+from contextlib import ExitStack
+from tracemalloc import (
+    start,
+    stop,
+    take_snapshot,
+)
+from typing import List
+from unittest.mock import patch
+
+from lpp.evaluator import (
+    apply_function,
+    evaluate,
+)
+from lpp.lexer import tokenize
+from lpp.object import (
+    Environment,
+    Integer,
+    Object,
+)
+from lpp.parser import Parser
+
+
+# Cada sumador se crea en una llamada que arma una cadena temporal, como los
+# procedimientos que preparan un mensaje antes de regresar una closure
+_ADDERS: str = '''
+    variable crea_sumador = procedimiento(n) {
+        variable prefijo = "sumador numero ";
+        variable mensaje = prefijo + prefijo + prefijo + prefijo + prefijo + prefijo;
+        variable doble = n * 2;
+        procedimiento(x) { x + doble };
+    };
+'''
+
+_CLOSURES: int = 5000
+
+
+def _retained_bytes(release: bool) -> int:
+    env = Environment()
+    evaluate(Parser(tokenize(_ADDERS)).parse_program(), env)
+    create = env['crea_sumador']
+
+    with ExitStack() as stack:
+        if not release:
+            # Como antes: la closure retiene todo el ambiente de la llamada
+            stack.enter_context(patch.object(Environment, 'release', lambda self: None))
+
+        start()
+        before = take_snapshot()
+        adders: List[Object] = [apply_function(create, [Integer(i)]) for i in range(_CLOSURES)]
+        after = take_snapshot()
+        stop()
+
+    assert len(adders) == _CLOSURES
+    return sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+
+
+def main() -> None:
+    retained = _retained_bytes(release=False)
+    minimized = _retained_bytes(release=True)
+
+    print(f'{_CLOSURES} sumadores')
+    print(f'Retenido con todo el ambiente: {retained / 1024:.0f} KiB ({retained / _CLOSURES:.0f} bytes por closure)')
+    print(f'Retenido solo con lo que usan: {minimized / 1024:.0f} KiB ({minimized / _CLOSURES:.0f} bytes por closure)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+from time import perf_counter
+from typing import (
+    Dict,
+    Optional,
+)
+
+from benchmarks.programs import FIBONACCI
+from lpp.engine import (
+    Engine,
+    execute,
+)
+from lpp.lexer import tokenize
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.parser import Parser
+
+
+def main() -> None:
+    program = Parser(tokenize(FIBONACCI)).parse_program()
+
+    times: Dict[Engine, float] = {}
+    for engine in Engine:
+        start = perf_counter()
+        result: Optional[Object] = execute(program, Environment(), engine)
+        times[engine] = perf_counter() - start
+
+        assert result is not None
+        print(f'{engine.value:>10}: fibonacci(20) = {result.inspect()} en {times[engine]:.3f}s '
+              f'({times[Engine.TREE] / times[engine]:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
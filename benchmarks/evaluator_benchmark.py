@@ -0,0 +1,100 @@
+from time import perf_counter
+from typing import (
+    cast,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import lpp.ast as ast
+import lpp.evaluator as evaluator
+from lpp.lexer import tokenize
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.parser import Parser
+
+
+# Cada caso: nombre, código previo y una sentencia que se repite muchas veces
+_CASES: List[Tuple[str, str, str]] = [
+    ('Integer', '', '1;'),
+    ('Boolean', '', 'verdadero;'),
+    ('StringLiteral', '', '"a";'),
+    ('Identifier', 'variable x = 1;', 'x;'),
+    ('Prefix', '', '-1;'),
+    ('Infix', '', '1 + 1;'),
+    ('If', '', 'si (verdadero) { 1 };'),
+    ('LetStatement', '', 'variable y = 1;'),
+    ('Function', '', 'procedimiento(x) { x };'),
+    ('Call', 'variable f = procedimiento(x) { x };', 'f(1);'),
+]
+
+_STATEMENTS: int = 20_000
+
+
+def _chain_evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
+    # La búsqueda lineal por tipo de nodo que usaba evaluate() antes de la tabla
+    node_type = type(node)
+
+    if node_type == ast.Program:
+        return evaluator._evaluate_program(cast(ast.Program, node), env)
+    elif node_type == ast.ExpressionStatement:
+        return evaluator._evaluate_expression_statement(cast(ast.ExpressionStatement, node), env)
+    elif node_type == ast.Integer:
+        return evaluator.evaluate_integer(cast(ast.Integer, node), env)
+    elif node_type == ast.Boolean:
+        return evaluator.evaluate_boolean(cast(ast.Boolean, node), env)
+    elif node_type == ast.Prefix:
+        return evaluator._evaluate_prefix(cast(ast.Prefix, node), env)
+    elif node_type == ast.Infix:
+        return evaluator._evaluate_infix(cast(ast.Infix, node), env)
+    elif node_type == ast.Block:
+        return evaluator._evaluate_block_statement(cast(ast.Block, node), env)
+    elif node_type == ast.If:
+        return evaluator._evaluate_if_expression(cast(ast.If, node), env)
+    elif node_type == ast.ReturnStatement:
+        return evaluator._evaluate_return_statement(cast(ast.ReturnStatement, node), env)
+    elif node_type == ast.LetStatement:
+        return evaluator._evaluate_let_statement(cast(ast.LetStatement, node), env)
+    elif node_type == ast.Identifier:
+        return evaluator.evaluate_identifier(cast(ast.Identifier, node), env)
+    elif node_type == ast.Function:
+        return evaluator.evaluate_function(cast(ast.Function, node), env)
+    elif node_type == ast.Call:
+        return evaluator._evaluate_call(cast(ast.Call, node), env)
+    elif node_type == ast.StringLiteral:
+        return evaluator.evaluate_string(cast(ast.StringLiteral, node), env)
+
+    return None
+
+
+def _time(evaluate: Callable[[ast.ASTNode, Environment], Optional[Object]],
+          program: ast.Program) -> float:
+    # Los evaluadores de cada nodo llaman a evaluator.evaluate para sus hijos, así que
+    # se reemplaza mientras se mide para que toda la evaluación use el mismo despacho
+    original = evaluator.evaluate
+    setattr(evaluator, 'evaluate', evaluate)
+    try:
+        start = perf_counter()
+        evaluate(program, Environment())
+
+        return perf_counter() - start
+    finally:
+        setattr(evaluator, 'evaluate', original)
+
+
+def main() -> None:
+    print(f'{"Nodo":>14} {"if/elif":>10} {"tabla":>10} {"aceleración":>12}  (µs por sentencia)')
+    for name, setup, statement in _CASES:
+        program = Parser(tokenize(setup + statement * _STATEMENTS)).parse_program()
+
+        chain = min(_time(_chain_evaluate, program) for _ in range(3)) / _STATEMENTS * 1e6
+        table = min(_time(evaluator.evaluate, program) for _ in range(3)) / _STATEMENTS * 1e6
+
+        print(f'{name:>14} {chain:>10.3f} {table:>10.3f} {chain / table:>11.2f}x')
+
+
+if __name__ == '__main__':
+    main()
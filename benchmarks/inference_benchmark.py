@@ -0,0 +1,89 @@
+from time import perf_counter
+from typing import (
+    List,
+    Tuple,
+)
+
+from benchmarks.allocation_benchmark import _LOOP
+from benchmarks.iterative_benchmark import _SUM
+from benchmarks.operator_benchmark import _ARITHMETIC
+from benchmarks.optimizer_benchmark import _TEMPLATE
+from benchmarks.programs import (
+    FIBONACCI,
+    generate_program,
+)
+from lpp.closures import compile_program
+from lpp.inference import infer_types
+from lpp.lexer import tokenize
+from lpp.object import Environment
+from lpp.parser import Parser
+
+
+# Concatenación de cadenas dentro de un ciclo hecho con recursión
+_GREETINGS: str = '''
+    variable saluda = procedimiento(nombre, veces, texto) {
+        si (veces < 1) {
+            regresa texto;
+        }
+        regresa saluda(nombre, veces - 1, texto + "hola " + nombre + "; ");
+    };
+    saluda("mundo", 100, "");
+'''
+
+# Aritmética sobre parámetros que siempre son enteros
+_POLYNOMIAL: str = '''
+    variable polinomio = procedimiento(x, n, total) {
+        si (n < 1) {
+            regresa total;
+        }
+        regresa polinomio(x, n - 1, total + (x * x * x - 3 * x * x + 2 * x - 7) * n);
+    };
+    polinomio(7, 150, 0);
+'''
+
+_PROGRAMS: List[Tuple[str, str]] = [
+    ('fibonacci', FIBONACCI),
+    ('plantilla', _TEMPLATE),
+    ('aritmética', _ARITHMETIC),
+    ('suma', _SUM.replace('N', '1000')),
+    ('cuenta', _LOOP),
+    ('saludos', _GREETINGS),
+    ('generado', generate_program(200)),
+    ('polinomio', _POLYNOMIAL),
+]
+
+
+def _time_closures(source: str, inferred: bool) -> float:
+    program = Parser(tokenize(source)).parse_program()
+    if inferred:
+        infer_types(program)
+    code = compile_program(program)
+
+    start = perf_counter()
+    for _ in range(50):
+        code(Environment())
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    for name, source in _PROGRAMS:
+        program = Parser(tokenize(source)).parse_program()
+
+        start = perf_counter()
+        report = infer_types(program)
+        inference = perf_counter() - start
+
+        print(f'{name}: {report} en {inference * 1000:.2f} ms')
+
+    # Las operaciones que no revisan tipos en el motor de closures
+    generic = min(_time_closures(_POLYNOMIAL, False) for _ in range(5))
+    exact = min(_time_closures(_POLYNOMIAL, True) for _ in range(5))
+
+    print(f'polinomio con closures: {generic:.3f}s sin inferencia, {exact:.3f}s con inferencia '
+          f'({generic / exact:.2f}x)')
+    assert exact < generic
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+from time import perf_counter
+
+from lpp.ast import Program
+from lpp.evaluator import evaluate
+from lpp.lexer import tokenize
+from lpp.object import Environment
+from lpp.optimizer import optimize
+from lpp.parser import Parser
+
+
+# Ayudantes de una línea llamados dentro de una recursión
+_HELPERS: str = '''
+    variable doble = procedimiento(x) { regresa x * 2; };
+    variable cuadrado = procedimiento(x) { x * x };
+    variable promedio = procedimiento(a, b) { (a + b) / 2 };
+    variable calcula = procedimiento(n) {
+        si (n < 1) {
+            regresa 0;
+        }
+        regresa promedio(doble(n), cuadrado(n)) + calcula(n - 1) - calcula(n - 2);
+    };
+    calcula(16);
+'''
+
+
+def _time(program: Program) -> float:
+    start = perf_counter()
+    evaluate(program, Environment())
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    program = Parser(tokenize(_HELPERS)).parse_program()
+
+    folded = optimize(program, inline_threshold=0)
+    inlined = optimize(program)
+
+    folded_time = min(_time(folded) for _ in range(3))
+    inlined_time = min(_time(inlined) for _ in range(3))
+
+    print(f'Sin expandir: {folded_time:.3f}s')
+    print(f'Expandido: {inlined_time:.3f}s ({folded_time / inlined_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
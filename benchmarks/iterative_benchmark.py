@@ -0,0 +1,60 @@
+from time import perf_counter
+from typing import (
+    Callable,
+    Optional,
+)
+
+from benchmarks.programs import FIBONACCI
+from lpp.ast import Program
+from lpp.evaluator import evaluate
+from lpp.iterative import evaluate_iterative
+from lpp.lexer import tokenize
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.parser import Parser
+
+
+# Recursión que no es de cola: cada llamada deja pendiente una suma
+_SUM: str = '''
+    variable suma = procedimiento(n) {
+        si (n == 0) {
+            regresa 0;
+        }
+        regresa n + suma(n - 1);
+    };
+    suma(N);
+'''
+
+Evaluator = Callable[[Program, Environment], Optional[Object]]
+
+
+def _time(evaluator: Evaluator, program: Program) -> str:
+    start = perf_counter()
+    try:
+        result = evaluator(program, Environment())
+    except RecursionError:
+        return 'RecursionError'
+
+    assert result is not None
+    return f'{result.inspect()} en {perf_counter() - start:.3f}s'
+
+
+def main() -> None:
+    programs = [
+        ('fibonacci(20)', FIBONACCI),
+        ('suma(60)', _SUM.replace('N', '60')),
+        ('suma(90000)', _SUM.replace('N', '90000')),
+    ]
+
+    for name, source in programs:
+        program = Parser(tokenize(source)).parse_program()
+
+        print(name)
+        print(f'   recursivo: {_time(evaluate, program)}')
+        print(f'   iterativo: {_time(evaluate_iterative, program)}')
+
+
+if __name__ == '__main__':
+    main()
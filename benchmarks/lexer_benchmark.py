@@ -0,0 +1,41 @@
+from time import perf_counter
+from typing import (
+    List,
+    Tuple,
+    Type,
+)
+
+from benchmarks.programs import generate_program
+from lpp.lexer import (
+    Lexer,
+    RegexLexer,
+)
+from lpp.token import TokenType
+
+
+def _tokens_per_second(lexer_class: Type[Lexer], source: str) -> Tuple[int, float]:
+    start = perf_counter()
+
+    lexer = lexer_class(source)
+    tokens = 1
+    while lexer.next_token().token_type != TokenType.EOF:
+        tokens += 1
+
+    return tokens, tokens / (perf_counter() - start)
+
+
+def main() -> None:
+    source = generate_program(2_000)
+    print(f'Fuente: {len(source)} caracteres')
+
+    results: List[Tuple[str, float]] = []
+    for lexer_class in (RegexLexer, Lexer):
+        tokens, rate = _tokens_per_second(lexer_class, source)
+        results.append((lexer_class.__name__, rate))
+        print(f'{lexer_class.__name__:>12}: {tokens} tokens, {rate:,.0f} tokens/s')
+
+    print(f'Aceleración: {results[1][1] / results[0][1]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+from time import perf_counter
+from typing import (
+    cast,
+    List,
+    Optional,
+    Tuple,
+)
+
+import lpp.ast as ast
+import lpp.evaluator as evaluator
+from lpp.evaluator import (
+    new_error,
+    to_boolean_object,
+    TYPE_MISMATCH,
+    UNKNOW_INFIX_OPERATION,
+)
+from lpp.lexer import tokenize
+from lpp.object import (
+    Environment,
+    Integer,
+    new_integer,
+    Object,
+    ObjectType,
+    String,
+)
+from lpp.parser import Parser
+
+
+# Cada caso: nombre y una sentencia que se repite muchas veces
+_CASES: List[Tuple[str, str]] = [
+    ('entero + entero', '1 + 2;'),
+    ('entero != entero', '1 != 2;'),
+    ('cadena + cadena', '"a" + "b";'),
+    ('cadena == cadena', '"a" == "b";'),
+    ('booleano == booleano', 'verdadero == falso;'),
+]
+
+_STATEMENTS: int = 20_000
+
+# Un programa con mucha aritmética
+_ARITHMETIC: str = '''
+    variable polinomio = procedimiento(x) {
+        x * x * x - 3 * x * x + 2 * x - 7 / (x + 1)
+    };
+    variable suma = procedimiento(n, total) {
+        si (n < 1) {
+            regresa total;
+        }
+        regresa suma(n - 1, total + polinomio(n) - polinomio(n - 1));
+    };
+    suma(5000, 0);
+'''
+
+
+def _chain_infix(node: ast.Infix, env: Environment) -> Optional[Object]:
+    # El evaluador de Infix antes de la tabla: cadenas de if por tipo y por operador
+    assert node.left is not None and node.right is not None
+    left = evaluator.evaluate(node.left, env)
+    right = evaluator.evaluate(node.right, env)
+
+    assert left is not None and right is not None
+    operator = node.operator
+
+    if left.type() == ObjectType.INTEGER and right.type() == ObjectType.INTEGER:
+        left_value: int = cast(Integer, left)._value
+        right_value: int = cast(Integer, right)._value
+
+        if operator == '+':
+            return new_integer(left_value + right_value)
+        elif operator == '-':
+            return new_integer(left_value - right_value)
+        elif operator == '*':
+            return new_integer(left_value * right_value)
+        elif operator == '/':
+            return new_integer(left_value // right_value)
+        elif operator == '<':
+            return to_boolean_object(left_value < right_value)
+        elif operator == '>':
+            return to_boolean_object(left_value > right_value)
+        elif operator == '==':
+            return to_boolean_object(left_value == right_value)
+        elif operator == '!=':
+            return to_boolean_object(left_value != right_value)
+    if left.type() == ObjectType.STRING and right.type() == ObjectType.STRING:
+        if operator == '+':
+            return String(cast(String, left).value + cast(String, right).value)
+        elif operator == '==':
+            return to_boolean_object(cast(String, left).value == cast(String, right).value)
+        elif operator == '!=':
+            return to_boolean_object(cast(String, left).value != cast(String, right).value)
+    elif operator == '==':
+        return to_boolean_object(left is right)
+    elif operator == '!=':
+        return to_boolean_object(left is not right)
+    elif left.type() != right.type():
+        return new_error(TYPE_MISMATCH, [left.type().name, operator, right.type().name])
+
+    return new_error(UNKNOW_INFIX_OPERATION, [left.type().name, operator, right.type().name])
+
+
+def _time(program: ast.Program, chain: bool) -> float:
+    original = evaluator._EVALUATORS[ast.Infix]
+    if chain:
+        evaluator._EVALUATORS[ast.Infix] = _chain_infix
+    try:
+        start = perf_counter()
+        evaluator.evaluate(program, Environment())
+
+        return perf_counter() - start
+    finally:
+        evaluator._EVALUATORS[ast.Infix] = original
+
+
+def main() -> None:
+    print(f'{"Operación":>22} {"if/elif":>10} {"tabla":>10} {"aceleración":>12}  (µs por sentencia)')
+    for name, statement in _CASES:
+        program = Parser(tokenize(statement * _STATEMENTS)).parse_program()
+
+        chain = min(_time(program, chain=True) for _ in range(3)) / _STATEMENTS * 1e6
+        table = min(_time(program, chain=False) for _ in range(3)) / _STATEMENTS * 1e6
+
+        print(f'{name:>22} {chain:>10.3f} {table:>10.3f} {chain / table:>11.2f}x')
+
+    program = Parser(tokenize(_ARITHMETIC)).parse_program()
+    chain = min(_time(program, chain=True) for _ in range(3))
+    table = min(_time(program, chain=False) for _ in range(3))
+    print(f'Programa aritmético: {chain:.3f}s con if/elif, {table:.3f}s con tabla ({chain / table:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
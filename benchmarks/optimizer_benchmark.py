@@ -0,0 +1,54 @@
+from time import perf_counter
+
+from lpp.ast import Program
+from lpp.evaluator import evaluate
+from lpp.lexer import tokenize
+from lpp.object import Environment
+from lpp.optimizer import optimize
+from lpp.parser import Parser
+
+
+# Un programa como los que salen de nuestras plantillas: mucha aritmética constante
+# dentro de un procedimiento que se llama muchas veces
+_TEMPLATE: str = '''
+    variable porcentaje = 16;
+    variable dias = 365;
+    variable calcula = procedimiento(n) {
+        si (n < 2) {
+            regresa 1;
+        }
+        variable base = 100 * 12 + 60 * 24 - 7 * 3;
+        variable anual = base * dias / (10 * 10);
+        si (porcentaje > 10 * 2) {
+            regresa 0;
+        }
+        regresa anual * porcentaje / 100 + calcula(n - 1) - calcula(n - 2);
+    };
+    calcula(17);
+'''
+
+
+def _time(program: Program) -> float:
+    start = perf_counter()
+    evaluate(program, Environment())
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    program = Parser(tokenize(_TEMPLATE)).parse_program()
+
+    start = perf_counter()
+    optimized = optimize(program)
+    optimization = perf_counter() - start
+
+    original_time = min(_time(program) for _ in range(3))
+    optimized_time = min(_time(optimized) for _ in range(3))
+
+    print(f'Optimización: {optimization * 1000:.2f} ms')
+    print(f'Sin optimizar: {original_time:.3f}s')
+    print(f'Optimizado: {optimized_time:.3f}s ({original_time / optimized_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+from os import cpu_count
+from time import perf_counter
+
+from benchmarks.programs import generate_program
+from lpp.lexer import lex_parallel
+
+
+def main() -> None:
+    source = generate_program(20_000)
+    print(f'Fuente: {len(source) / 1024 / 1024:.1f} MB, {cpu_count()} núcleos disponibles')
+
+    baseline = 0.0
+    for workers in range(1, 9):
+        start = perf_counter()
+        buffer = lex_parallel(source, workers=workers)
+        elapsed = perf_counter() - start
+
+        if workers == 1:
+            baseline = elapsed
+
+        print(f'{workers} procesos: {len(buffer)} tokens en {elapsed:.2f}s, aceleración {baseline / elapsed:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+from time import perf_counter
+from typing import (
+    Callable,
+    Optional,
+    Type,
+)
+
+from benchmarks.programs import generate_program
+from lpp.lexer import tokenize
+from lpp.parser import (
+    IterativeParser,
+    Parser,
+)
+
+
+def _parse_time(parser_class: Type[Parser], source: str) -> Optional[float]:
+    buffer = tokenize(source)
+
+    start = perf_counter()
+    try:
+        parser_class(buffer).parse_program()
+    except RecursionError:
+        return None
+
+    return perf_counter() - start
+
+
+def _report(title: str, make_source: Callable[[int], str], sizes: range) -> None:
+    print(title)
+    for size in sizes:
+        source = make_source(size)
+        times = [_parse_time(parser_class, source) for parser_class in (Parser, IterativeParser)]
+        print(f'  {size:>8}: ' + '  '.join(
+            f'{parser_class.__name__} {"RecursionError" if time is None else f"{time:.3f}s":>14}'
+            for parser_class, time in zip((Parser, IterativeParser), times)
+        ))
+
+
+def main() -> None:
+    _report('Programa generado (número de procedimientos)',
+            generate_program, range(500, 4_001, 1_500))
+    _report('Suma encadenada 1 + 1 + ... + 1',
+            lambda size: ' + '.join(['1'] * size), range(25_000, 100_001, 25_000))
+    _report('Paréntesis anidados',
+            lambda size: '(' * size + '1' + ')' * size, range(100, 100_001, 24_975))
+    _report('Prefijos anidados',
+            lambda size: '-' * size + '1', range(100, 100_001, 24_975))
+
+
+if __name__ == '__main__':
+    main()
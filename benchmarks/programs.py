@@ -0,0 +1,30 @@
+from typing import List
+
+
+FIBONACCI: str = '''
+    variable fibonacci = procedimiento(n) {
+        si (n < 2) {
+            regresa n;
+        }
+        regresa fibonacci(n - 1) + fibonacci(n - 2);
+    };
+    fibonacci(20);
+'''
+
+
+def generate_program(functions: int) -> str:
+    out: List[str] = []
+    for i in range(functions):
+        out.append(f'''
+            variable suma_{i} = procedimiento(x, y) {{
+                variable mensaje = "suma numero {i}";
+                si (x > {i}) {{
+                    regresa x + y * {i} - (x / 2);
+                }} si_no {{
+                    regresa longitud(mensaje) == {i};
+                }}
+            }};
+            variable resultado_{i} = suma_{i}({i}, {i + 1});
+        ''')
+
+    return ''.join(out)
@@ -0,0 +1,36 @@
+from time import perf_counter
+from typing import Callable
+
+from benchmarks.programs import FIBONACCI
+from lpp.ast import Program
+from lpp.evaluator import evaluate
+from lpp.lexer import tokenize
+from lpp.object import Environment
+from lpp.parser import Parser
+from lpp.resolver import (
+    resolve,
+    SlotEvaluator,
+)
+
+
+def _time(run: Callable[[Program], object]) -> float:
+    # Un árbol nuevo cada vez para que ninguna medición use las cachés de otra
+    program = Parser(tokenize(FIBONACCI)).parse_program()
+
+    start = perf_counter()
+    run(program)
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    tree = min(_time(lambda program: evaluate(program, Environment())) for _ in range(5))
+    slots = min(_time(lambda program: SlotEvaluator(resolve(program)).run(program)) for _ in range(5))
+
+    print(f'Árbol: {tree:.3f}s')
+    print(f'Ranuras (con la resolución): {slots:.3f}s ({tree / slots:.1f}x)')
+    assert slots < tree
+
+
+if __name__ == '__main__':
+    main()
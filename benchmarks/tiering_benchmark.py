@@ -0,0 +1,38 @@
+from time import perf_counter
+from typing import Callable
+
+from benchmarks.programs import FIBONACCI
+from lpp.ast import Program
+from lpp.evaluator import evaluate
+from lpp.lexer import tokenize
+from lpp.object import Environment
+from lpp.parser import Parser
+from lpp.tiering import Tiering
+
+
+def _time(run: Callable[[Program], object]) -> float:
+    # Un árbol nuevo cada vez: los cuerpos promovidos se quedan compilados en el árbol
+    program = Parser(tokenize(FIBONACCI)).parse_program()
+
+    start = perf_counter()
+    run(program)
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    tree = min(_time(lambda program: evaluate(program, Environment())) for _ in range(5))
+
+    tiered = min(_time(lambda program: Tiering().run(program, Environment())) for _ in range(5))
+
+    tiering = Tiering()
+    tiering.run(Parser(tokenize(FIBONACCI)).parse_program(), Environment())
+
+    print(f'Árbol: {tree:.3f}s')
+    print(f'Niveles: {tiered:.3f}s ({tree / tiered:.1f}x)')
+    print(tiering.report())
+    assert tiered < tree
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+from time import perf_counter
+from tracemalloc import (
+    get_traced_memory,
+    start,
+    stop,
+)
+from typing import (
+    Callable,
+    List,
+    Tuple,
+    TypeVar,
+)
+
+from benchmarks.programs import generate_program
+from lpp.lexer import (
+    Lexer,
+    tokenize,
+)
+from lpp.token import (
+    Token,
+    TokenBuffer,
+    TokenType,
+)
+
+
+T = TypeVar('T')
+
+
+def _tokens_list(source: str) -> List[Token]:
+    lexer = Lexer(source)
+
+    tokens: List[Token] = [lexer.next_token()]
+    while tokens[-1].token_type != TokenType.EOF:
+        tokens.append(lexer.next_token())
+
+    return tokens
+
+
+def _measure(fn: Callable[[str], T], source: str) -> Tuple[T, int, float]:
+    start()
+    begin = perf_counter()
+
+    result = fn(source)
+
+    elapsed = perf_counter() - begin
+    memory, _ = get_traced_memory()
+    stop()
+
+    return result, memory, elapsed
+
+
+def main() -> None:
+    source = generate_program(2_000)
+
+    tokens, list_memory, list_time = _measure(_tokens_list, source)
+    buffer, buffer_memory, buffer_time = _measure(tokenize, source)
+    assert isinstance(buffer, TokenBuffer) and len(buffer) == len(tokens)
+
+    print(f'Tokens: {len(tokens)}')
+    print(f'List[Token]: {list_memory / len(tokens):6.1f} bytes/token, {list_time:.3f}s')
+    print(f'TokenBuffer: {buffer_memory / len(tokens):6.1f} bytes/token, {buffer_time:.3f}s')
+    print(f'Reducción de memoria: {list_memory / buffer_memory:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,568 @@
+from array import array
+from enum import IntEnum
+from marshal import (
+    dumps,
+    loads,
+)
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+import lpp.ast as ast
+from lpp.builtins import BUILTINS
+from lpp.evaluator import (
+    apply_function,
+    evaluate_infix_expression,
+    evaluate_prefix_expression,
+    extend_function_environment,
+    is_truthy,
+    new_error,
+    NOT_A_FUNCTION,
+    to_boolean_object,
+    UNKNOW_IDENTIFIER,
+    unwrap_return_value,
+    NULL,
+)
+from lpp.object import (
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Integer,
+    new_integer,
+    Object,
+    ObjectType,
+    Return,
+    String,
+)
+from lpp.token import (
+    Token,
+    TokenType,
+)
+
+
+class NodeKind(IntEnum):
+    PROGRAM = 0
+    LET = 1
+    RETURN = 2
+    EXPRESSION_STATEMENT = 3
+    IDENTIFIER = 4
+    INTEGER = 5
+    BOOLEAN = 6
+    STRING = 7
+    PREFIX = 8
+    INFIX = 9
+    BLOCK = 10
+    IF = 11
+    FUNCTION = 12
+    CALL = 13
+
+
+_KINDS: Dict[Type[ast.ASTNode], NodeKind] = {
+    ast.Program: NodeKind.PROGRAM,
+    ast.LetStatement: NodeKind.LET,
+    ast.ReturnStatement: NodeKind.RETURN,
+    ast.ExpressionStatement: NodeKind.EXPRESSION_STATEMENT,
+    ast.Identifier: NodeKind.IDENTIFIER,
+    ast.Integer: NodeKind.INTEGER,
+    ast.Boolean: NodeKind.BOOLEAN,
+    ast.StringLiteral: NodeKind.STRING,
+    ast.Prefix: NodeKind.PREFIX,
+    ast.Infix: NodeKind.INFIX,
+    ast.Block: NodeKind.BLOCK,
+    ast.If: NodeKind.IF,
+    ast.Function: NodeKind.FUNCTION,
+    ast.Call: NodeKind.CALL,
+}
+
+# Atributos de cada nodo que son otros nodos o listas de nodos
+_CHILDREN: Dict[Type[ast.ASTNode], Tuple[str, ...]] = {
+    ast.Program: ('statements',),
+    ast.LetStatement: ('name', 'value'),
+    ast.ReturnStatement: ('return_value',),
+    ast.ExpressionStatement: ('expression',),
+    ast.Prefix: ('right',),
+    ast.Infix: ('left', 'right'),
+    ast.Block: ('statements',),
+    ast.If: ('condition', 'consequence', 'alternative'),
+    ast.Function: ('parameters', 'body'),
+    ast.Call: ('function', 'arguments'),
+}
+
+_NONE: int = -1
+
+# El parámetro token de los constructores ya no se guarda en los nodos
+_NO_TOKEN: Token = Token(TokenType.ILLEGAL, '')
+
+
+class Arena:
+    # Representación plana del árbol: en lugar de un objeto por nodo hay columnas
+    # paralelas (una entrada por nodo) con el tipo de nodo, su posición y hasta tres
+    # campos que son índices de otros nodos o de la tabla de literales. Las listas de
+    # hijos (statements, parámetros, argumentos) son rangos dentro de la columna children.
+    # Los nodos quedan en postorden, así que los hijos siempre tienen un índice menor
+    # que el de su padre y la raíz es el último nodo
+
+    def __init__(self) -> None:
+        self.kinds: 'array[int]' = array('B')
+        self.positions: 'array[int]' = array('i')
+        self.first: 'array[int]' = array('i')
+        self.second: 'array[int]' = array('i')
+        self.third: 'array[int]' = array('i')
+        self.children: 'array[int]' = array('i')
+        self.literals: List[Any] = []
+
+        self._literal_indexes: Dict[Tuple[type, Any], int] = {}
+        self._parameter_names: Dict[int, List[str]] = {}
+        self._parameters: Dict[int, List[ast.Identifier]] = {}
+        self._free_variables: Dict[int, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def root(self) -> int:
+        return len(self.kinds) - 1
+
+    @classmethod
+    def from_program(cls, program: ast.Program) -> 'Arena':
+        arena = cls()
+
+        results: List[Any] = []
+        pending: List[Tuple[Any, bool]] = [(program, False)]
+
+        while pending:
+            node, children_done = pending.pop()
+
+            if node is None:
+                results.append(_NONE)
+            elif type(node) == list:
+                if children_done:
+                    count = len(node)
+                    items = results[len(results) - count:]
+                    del results[len(results) - count:]
+
+                    results.append((len(arena.children), count))
+                    arena.children.extend(items)
+                else:
+                    pending.append((node, True))
+                    pending.extend((child, False) for child in reversed(node))
+            else:
+                children = _CHILDREN.get(type(node), ())
+
+                if children_done or not children:
+                    values = results[len(results) - len(children):] if children else []
+                    if children:
+                        del results[len(results) - len(children):]
+
+                    results.append(arena._add(node, values))
+                else:
+                    pending.append((node, True))
+                    pending.extend((getattr(node, child), False) for child in reversed(children))
+
+        return arena
+
+    def to_program(self) -> ast.Program:
+        nodes: List[Any] = []
+
+        for index in range(len(self.kinds)):
+            nodes.append(self._build(index, nodes))
+
+        program = nodes[self.root]
+        assert type(program) == ast.Program
+
+        return program
+
+    def to_bytes(self) -> bytes:
+        return dumps((
+            self.kinds.tobytes(),
+            self.positions.tobytes(),
+            self.first.tobytes(),
+            self.second.tobytes(),
+            self.third.tobytes(),
+            self.children.tobytes(),
+            self.literals,
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Arena':
+        arena = cls()
+        kinds, positions, first, second, third, children, literals = loads(data)
+
+        arena.kinds.frombytes(kinds)
+        arena.positions.frombytes(positions)
+        arena.first.frombytes(first)
+        arena.second.frombytes(second)
+        arena.third.frombytes(third)
+        arena.children.frombytes(children)
+        arena.literals = literals
+
+        return arena
+
+    def node(self, index: int) -> ast.ASTNode:
+        # Reconstruye solo el subárbol que empieza en index
+        nodes: Dict[int, Any] = {}
+        pending: List[int] = [index]
+
+        while pending:
+            current = pending[-1]
+            missing = [child for child in self._child_indexes(current) if child not in nodes]
+
+            if missing:
+                pending.extend(missing)
+            else:
+                pending.pop()
+                nodes[current] = self._build(current, nodes)
+
+        return nodes[index]
+
+    def parameter_names(self, index: int) -> List[str]:
+        try:
+            return self._parameter_names[index]
+        except KeyError:
+            start, count = self.first[index], self.second[index]
+            names = [self.literals[self.first[parameter]]
+                     for parameter in self.children[start:start + count]]
+
+            self._parameter_names[index] = names
+            return names
+
+    def parameters(self, index: int) -> List[ast.Identifier]:
+        try:
+            return self._parameters[index]
+        except KeyError:
+            parameters = self._parameters[index] = [ast.Identifier(_NO_TOKEN, name)
+                                                    for name in self.parameter_names(index)]
+            return parameters
+
+    def free_variables(self, index: int) -> FrozenSet[str]:
+        # Lo mismo que lpp.capture.free_variables pero recorriendo las columnas
+        try:
+            return self._free_variables[index]
+        except KeyError:
+            names: Set[str] = set()
+            pending: List[int] = [self.third[index]]
+
+            while pending:
+                current = pending.pop()
+                kind = self.kinds[current]
+
+                if kind == NodeKind.IDENTIFIER:
+                    names.add(self.literals[self.first[current]])
+                elif kind == NodeKind.FUNCTION:
+                    names.update(self.free_variables(current))
+                elif kind == NodeKind.LET:
+                    # El nombre de la variable se escribe en el ambiente de la llamada
+                    pending.append(self.second[current])
+                else:
+                    pending.extend(self._child_indexes(current))
+
+            names.difference_update(self.parameter_names(index))
+
+            free = self._free_variables[index] = frozenset(names)
+            return free
+
+    def _literal(self, value: Any) -> int:
+        if value is None:
+            return _NONE
+
+        key = (type(value), value)
+        try:
+            return self._literal_indexes[key]
+        except KeyError:
+            self.literals.append(value)
+            self._literal_indexes[key] = len(self.literals) - 1
+
+            return len(self.literals) - 1
+
+    def _add(self, node: ast.ASTNode, values: List[Any]) -> int:
+        kind = _KINDS[type(node)]
+        first = second = third = _NONE
+
+        if kind == NodeKind.PROGRAM or kind == NodeKind.BLOCK:
+            first, second = values[0]
+        elif kind == NodeKind.IDENTIFIER or kind == NodeKind.INTEGER or kind == NodeKind.STRING:
+            first = self._literal(node.value)  # type: ignore
+        elif kind == NodeKind.BOOLEAN:
+            value = node.value  # type: ignore
+            first = _NONE if value is None else int(value)
+        elif kind == NodeKind.PREFIX:
+            first, second = self._literal(node.operator), values[0]  # type: ignore
+        elif kind == NodeKind.INFIX:
+            first, second, third = self._literal(node.operator), values[0], values[1]  # type: ignore
+        elif kind == NodeKind.FUNCTION:
+            (first, second), third = values
+        elif kind == NodeKind.CALL:
+            first = values[0]
+            if values[1] != _NONE:
+                second, third = values[1]
+        else:
+            first, second, third = (values + [_NONE, _NONE])[:3]
+
+        self.kinds.append(kind)
+        self.positions.append(node.position if kind != NodeKind.PROGRAM else _NONE)  # type: ignore
+        self.first.append(first)
+        self.second.append(second)
+        self.third.append(third)
+
+        return len(self.kinds) - 1
+
+    def _child_indexes(self, index: int) -> List[int]:
+        kind = self.kinds[index]
+        first, second, third = self.first[index], self.second[index], self.third[index]
+
+        if kind == NodeKind.PROGRAM or kind == NodeKind.BLOCK:
+            return list(self.children[first:first + second])
+        elif kind == NodeKind.FUNCTION:
+            return list(self.children[first:first + second]) + [third]
+        elif kind == NodeKind.CALL:
+            arguments = list(self.children[second:second + third]) if second != _NONE else []
+            return [first] + arguments
+        elif kind == NodeKind.PREFIX:
+            return [second]
+        elif kind == NodeKind.INFIX:
+            return [second, third]
+        elif kind in (NodeKind.IDENTIFIER, NodeKind.INTEGER, NodeKind.BOOLEAN, NodeKind.STRING):
+            return []
+
+        return [child for child in (first, second, third) if child != _NONE]
+
+    def _build(self, index: int, nodes: Any) -> ast.ASTNode:
+        kind = self.kinds[index]
+        position = self.positions[index]
+        first, second, third = self.first[index], self.second[index], self.third[index]
+
+        def child(child_index: int) -> Any:
+            return nodes[child_index] if child_index != _NONE else None
+
+        def child_list(start: int, count: int) -> List[Any]:
+            return [nodes[child_index] for child_index in self.children[start:start + count]]
+
+        if kind == NodeKind.PROGRAM:
+            return ast.Program(statements=child_list(first, second))
+        elif kind == NodeKind.LET:
+            return ast.LetStatement(_NO_TOKEN, child(first), child(second), position=position)
+        elif kind == NodeKind.RETURN:
+            return ast.ReturnStatement(_NO_TOKEN, child(first), position=position)
+        elif kind == NodeKind.EXPRESSION_STATEMENT:
+            return ast.ExpressionStatement(_NO_TOKEN, child(first), position=position)
+        elif kind == NodeKind.IDENTIFIER:
+            return ast.Identifier(_NO_TOKEN, self.literals[first], position=position)
+        elif kind == NodeKind.INTEGER:
+            return ast.Integer(_NO_TOKEN, self.literals[first] if first != _NONE else None, position=position)
+        elif kind == NodeKind.BOOLEAN:
+            return ast.Boolean(_NO_TOKEN, bool(first) if first != _NONE else None, position=position)
+        elif kind == NodeKind.STRING:
+            return ast.StringLiteral(_NO_TOKEN, self.literals[first], position=position)
+        elif kind == NodeKind.PREFIX:
+            return ast.Prefix(_NO_TOKEN, self.literals[first], child(second), position=position)
+        elif kind == NodeKind.INFIX:
+            return ast.Infix(_NO_TOKEN, child(second), self.literals[first], child(third), position=position)
+        elif kind == NodeKind.BLOCK:
+            return ast.Block(_NO_TOKEN, child_list(first, second), position=position)
+        elif kind == NodeKind.IF:
+            return ast.If(_NO_TOKEN, child(first), child(second), child(third), position=position)
+        elif kind == NodeKind.FUNCTION:
+            return ast.Function(_NO_TOKEN, child_list(first, second), child(third), position=position)
+        else:
+            arguments = child_list(second, third) if second != _NONE else None
+            return ast.Call(_NO_TOKEN, child(first), arguments, position=position)
+
+
+class ArenaFunction(Object):
+    # Procedimiento creado al evaluar una Arena: en lugar de nodos guarda el índice
+    # del nodo Function dentro de la arena. Los parámetros y el cuerpo como nodos
+    # solo se reconstruyen si alguien los pide (p.ej. inspect). No es un Function
+    # porque ahí parameters y body son atributos que se pueden asignar
+    __slots__ = ('arena', 'index', 'env')
+
+    def __init__(self, arena: Arena, index: int, env: Environment) -> None:
+        self.arena = arena
+        self.index = index
+        self.env = env
+
+    @property
+    def parameters(self) -> List[ast.Identifier]:
+        return self.arena.parameters(self.index)
+
+    @property
+    def body(self) -> ast.Block:
+        body = self.arena.node(self.arena.third[self.index])
+
+        assert type(body) == ast.Block
+        return body
+
+    def type(self) -> ObjectType:
+        return ObjectType.FUNCTION
+
+    def inspect(self) -> str:
+        params: str = ', '.join([str(param) for param in self.parameters])
+
+        return 'procedimiento({}) {{\n {}\n}}'.format(params, str(self.body))
+
+
+ArenaEvaluator = Callable[[Arena, int, Environment], Optional[Object]]
+
+
+def evaluate_arena(arena: Arena, env: Environment, index: Optional[int] = None) -> Optional[Object]:
+    if index is None:
+        index = arena.root
+
+    return _EVALUATORS[arena.kinds[index]](arena, index, env)
+
+
+def _evaluate_program(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    result: Optional[Object] = None
+
+    start, count = arena.first[index], arena.second[index]
+    for statement in arena.children[start:start + count]:
+        result = evaluate_arena(arena, env, statement)
+
+        if type(result) == Return:
+            return result._value  # type: ignore
+        elif type(result) == Error:
+            return result
+
+    return result
+
+
+def _evaluate_block(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    result: Optional[Object] = None
+
+    start, count = arena.first[index], arena.second[index]
+    for statement in arena.children[start:start + count]:
+        result = evaluate_arena(arena, env, statement)
+
+        if result is not None and (result.type() == ObjectType.RETURN or result.type() == ObjectType.ERROR):
+            return result
+
+    return result
+
+
+def _evaluate_let(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    value = evaluate_arena(arena, env, arena.second[index])
+
+    env[arena.literals[arena.first[arena.first[index]]]] = value
+
+    return None
+
+
+def _evaluate_return(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    value = evaluate_arena(arena, env, arena.first[index])
+
+    assert value is not None
+    return Return(value)
+
+
+def _evaluate_expression_statement(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    return evaluate_arena(arena, env, arena.first[index])
+
+
+def _evaluate_identifier(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    name = arena.literals[arena.first[index]]
+
+    try:
+        return env[name]
+    except KeyError:
+        return BUILTINS.get(name, new_error(UNKNOW_IDENTIFIER, [name]))
+
+
+def _evaluate_integer(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    return new_integer(arena.literals[arena.first[index]])
+
+
+def _evaluate_boolean(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    return to_boolean_object(bool(arena.first[index]))
+
+
+def _evaluate_string(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    return String(arena.literals[arena.first[index]])
+
+
+def _evaluate_prefix(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    right = evaluate_arena(arena, env, arena.second[index])
+
+    assert right is not None
+    return evaluate_prefix_expression(arena.literals[arena.first[index]], right)
+
+
+def _evaluate_infix(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    left = evaluate_arena(arena, env, arena.second[index])
+    right = evaluate_arena(arena, env, arena.third[index])
+
+    assert left is not None and right is not None
+    return evaluate_infix_expression(arena.literals[arena.first[index]], left, right)
+
+
+def _evaluate_if(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    condition = evaluate_arena(arena, env, arena.first[index])
+
+    assert condition is not None
+    if is_truthy(condition):
+        return evaluate_arena(arena, env, arena.second[index])
+    elif arena.third[index] != _NONE:
+        return evaluate_arena(arena, env, arena.third[index])
+    else:
+        return NULL
+
+
+def _evaluate_function(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    env.capture(arena.free_variables(index))
+
+    return ArenaFunction(arena, index, env)
+
+
+def _evaluate_call(arena: Arena, index: int, env: Environment) -> Optional[Object]:
+    function = evaluate_arena(arena, env, arena.first[index])
+
+    start, count = arena.second[index], arena.third[index]
+    args: List[Object] = []
+    for argument in arena.children[start:start + count]:
+        evaluated = evaluate_arena(arena, env, argument)
+
+        assert evaluated is not None
+        args.append(evaluated)
+
+    assert function is not None
+    if type(function) == ArenaFunction:
+        function = cast(ArenaFunction, function)
+
+        # El cuerpo se evalúa en la arena del procedimiento, que puede no ser la de la
+        # llamada (p.ej. un procedimiento de otro programa en el mismo ambiente)
+        extended_environment = extend_function_environment(function, args)  # type: ignore
+        evaluated = evaluate_arena(function.arena, extended_environment, function.arena.third[function.index])
+        extended_environment.release()
+
+        assert evaluated is not None
+        return unwrap_return_value(evaluated)
+    elif type(function) == Function or type(function) == Builtin:
+        return apply_function(function, args)
+    else:
+        return new_error(NOT_A_FUNCTION, [function.type().name])
+
+
+_EVALUATORS: List[ArenaEvaluator] = [
+    _evaluate_program,
+    _evaluate_let,
+    _evaluate_return,
+    _evaluate_expression_statement,
+    _evaluate_identifier,
+    _evaluate_integer,
+    _evaluate_boolean,
+    _evaluate_string,
+    _evaluate_prefix,
+    _evaluate_infix,
+    _evaluate_block,
+    _evaluate_if,
+    _evaluate_function,
+    _evaluate_call,
+]
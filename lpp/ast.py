@@ -4,14 +4,30 @@ from abc import (
 )
 
 from typing import (
-    List, 
-    Optional
+    Any,
+    Callable,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
 )
 
 from lpp.token import Token
 
+if TYPE_CHECKING:
+    from lpp.object import (
+        Environment,
+        Object,
+    )
+
+# Los nodos usan __slots__ y no guardan el Token del que salieron: solo los campos que
+# necesita la evaluación y la posición (en caracteres desde el inicio de la fuente)
+# como un entero. La literal del token se reconstruye a partir de esos campos
+
 class ASTNode(ABC):
-    
+    __slots__ = ()
+
     @abstractmethod
     def token_literal(self) -> str:
         pass
@@ -21,26 +37,33 @@ class ASTNode(ABC):
         pass
 
 
+# cache es lo único del árbol que escribe un motor: lo que calculó la primera vez que
+# evaluó el nodo para no repetirlo. Cada clase de nodo declara qué guarda ahí
+
 class Statement(ASTNode):
+    __slots__ = ('position', 'cache')
+    cache: object
 
-    
-    def __init__(self, token: Token) -> None:
-        self.token = token
+    def __init__(self, token: Token, position: int = -1) -> None:
+        self.position = position
+        self.cache = None
+
+
+# Lo que guarda el evaluador en un Infix: (tipo izquierdo, tipo derecho, operación)
+InfixCache = Tuple[type, type, Callable[[Any, Any], Any]]
 
-    def token_literal(self) -> str:
-        return self.token.literal
-    
 
 class Expression(ASTNode):
-    
-    def __init__(self, token: Token) -> None:
-        self.token = token
+    __slots__ = ('position', 'cache')
+    cache: object
+
+    def __init__(self, token: Token, position: int = -1) -> None:
+        self.position = position
+        self.cache = None
 
-    def token_literal(self) -> str:
-        return self.token.literal
-    
 
 class Program(ASTNode):
+    __slots__ = ('statements',)
 
     def __init__(self, statements: List[Statement]) -> None:
         self.statements = statements
@@ -48,7 +71,7 @@ class Program(ASTNode):
     def token_literal(self) -> str:
         if len(self.statements) > 0:
             return self.statements[0].token_literal()
-        
+
         return ''
 
     def __str__(self) -> str:
@@ -60,111 +83,167 @@ class Program(ASTNode):
 
 
 class Identifier(Expression):
+    __slots__ = ('value',)
+    # Integer si el valor siempre es un entero, ver lpp.inference.is_integer
+    cache: Optional[type]
 
-    def __init__(self, token: Token, value: str) -> None:
-        super().__init__(token)
+    def __init__(self, token: Token, value: str, position: int = -1) -> None:
+        super().__init__(token, position)
         self.value = value
-    
+
+    def token_literal(self) -> str:
+        return self.value
+
     def __str__(self) -> str:
         return self.value
-    
-    
+
+
 class LetStatement(Statement):
+    __slots__ = ('name', 'value')
 
-    def __init__(self, 
-                token: Token, 
-                name: Optional[Identifier] = None, 
-                value: Optional[Expression] = None) -> None:
-        super().__init__(token)
+    def __init__(self,
+                token: Token,
+                name: Optional[Identifier] = None,
+                value: Optional[Expression] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.name = name
         self.value = value
 
+    def token_literal(self) -> str:
+        return 'variable'
+
     def __str__(self) -> str:
         return f'{self.token_literal()} {str(self.name)} = {str(self.value)};'
 
 
 class ReturnStatement(Statement):
+    __slots__ = ('return_value',)
+
     def __init__(self,
                 token: Token,
-                return_value: Optional[Expression] = None) -> None:
-        super().__init__(token)
+                return_value: Optional[Expression] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.return_value = return_value
 
+    def token_literal(self) -> str:
+        return 'regresa'
+
     def __str__(self) -> str:
         return f'{self.token_literal()} {str(self.return_value)};'
 
 
 class ExpressionStatement(Statement):
+    __slots__ = ('expression',)
 
-    def __init__(self, 
+    def __init__(self,
                 token: Token,
-                expression: Optional[Expression] = None) -> None:
-        super().__init__(token)
+                expression: Optional[Expression] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.expression = expression
 
+    def token_literal(self) -> str:
+        return self.expression.token_literal() if self.expression is not None else ''
+
     def __str__(self) -> str:
         return str(self.expression)
 
 
 class Integer(Expression):
+    __slots__ = ('value',)
+    # El objeto que produce la literal, lo asigna el parser (ver lpp.object.ConstantPool)
+    cache: Optional['Object']
 
     def __init__(self,
                 token: Token,
-                value: Optional[int] = None) -> None:
-        super().__init__(token)
+                value: Optional[int] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.value = value
 
+    def token_literal(self) -> str:
+        return str(self.value)
+
     def __str__(self) -> str:
         return str(self.value)
 
 
 class Prefix(Expression):
+    __slots__ = ('operator', 'right')
 
     def __init__(self,
                 token: Token,
                 operator: str,
-                right: Optional[Expression] = None) -> None:
-        super().__init__(token)
+                right: Optional[Expression] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.operator = operator
         self.right = right
-    
+
+    def token_literal(self) -> str:
+        return self.operator
+
     def __str__(self) -> str:
         return f'({self.operator}{str(self.right)})'
 
 
 class Infix(Expression):
+    __slots__ = ('left', 'operator', 'right')
+    # La última operación que usó el evaluador, ver lpp.evaluator._evaluate_infix
+    cache: Optional[InfixCache]
+
     def __init__(self,
                 token: Token,
                 left: Expression,
                 operator: str,
-                right: Optional[Expression] = None) -> None:
-        super().__init__(token)
+                right: Optional[Expression] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.left = left
         self.operator = operator
         self.right = right
 
+    def token_literal(self) -> str:
+        return self.operator
+
     def __str__(self) -> str:
         return f'({str(self.left)} {self.operator} {str(self.right)})'
 
 
 class Boolean(Expression):
+    __slots__ = ('value',)
+
     def __init__(self,
                 token: Token,
-                value: Optional[bool] = None) -> None:
-        super().__init__(token)
+                value: Optional[bool] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.value = value
 
+    def token_literal(self) -> str:
+        return 'verdadero' if self.value else 'falso'
+
     def __str__(self) -> str:
         return self.token_literal()
 
 
 class Block(Statement):
+    __slots__ = ('statements',)
+    # El cuerpo compilado de un procedimiento promovido, ver lpp.tiering
+    cache: Optional[Callable[['Environment'], Optional['Object']]]
+
     def __init__(self,
                 token: Token,
-                statements: List[Statement]) -> None:
-        super().__init__(token)
+                statements: List[Statement],
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.statements = statements
 
+    def token_literal(self) -> str:
+        return '{'
+
     def __str__(self) -> str:
         out: List[str] = [str(statement) for statement in self.statements]
 
@@ -172,16 +251,22 @@ class Block(Statement):
 
 
 class If(Expression):
+    __slots__ = ('condition', 'consequence', 'alternative')
+
     def __init__(self,
                 token: Token,
                 condition: Optional[Expression] = None,
                 consequence: Optional[Block] = None,
-                alternative: Optional[Block] = None) -> None:
-        super().__init__(token)
+                alternative: Optional[Block] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.condition = condition
         self.consequence = consequence
         self.alternative = alternative
-    
+
+    def token_literal(self) -> str:
+        return 'si'
+
     def __str__(self) -> str:
         out: str = f'si {str(self.condition)} {str(self.consequence)}'
 
@@ -192,33 +277,46 @@ class If(Expression):
 
 
 class Function(Expression):
-    
+    __slots__ = ('parameters', 'body')
+    # Los nombres que el procedimiento puede leer de su ambiente, ver
+    # lpp.capture.free_variables
+    cache: Optional[FrozenSet[str]]
+
     def __init__(self,
                 token: Token,
-                parameters: List[Identifier] = [],
-                body: Optional[Block] = None) -> None:
-        super().__init__(token)
-        self.parameters = parameters
+                parameters: Optional[List[Identifier]] = None,
+                body: Optional[Block] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
+        self.parameters: List[Identifier] = parameters if parameters is not None else []
         self.body = body
 
-    def __str__(self) -> str: 
+    def token_literal(self) -> str:
+        return 'procedimiento'
+
+    def __str__(self) -> str:
         param_list: List[str] = [str(parameter) for parameter in self.parameters]
 
         params: str = ', '.join(param_list)
 
         return f'{self.token_literal()}({params}) {str(self.body)}'
 
-    
+
 class Call(Expression):
+    __slots__ = ('function', 'arguments')
 
     def __init__(self,
                 token: Token,
                 function: Expression,
-                arguments: Optional[List[Expression]] = None) -> None:
-        super().__init__(token) 
+                arguments: Optional[List[Expression]] = None,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.function = function
         self.arguments = arguments
 
+    def token_literal(self) -> str:
+        return '('
+
     def __str__(self) -> str:
         assert self.arguments is not None
 
@@ -230,11 +328,19 @@ class Call(Expression):
 
 
 class StringLiteral(Expression):
+    __slots__ = ('value',)
+    # El objeto que produce la literal, lo asigna el parser (ver lpp.object.ConstantPool)
+    cache: Optional['Object']
+
     def __init__(self,
                 token: Token,
-                value: str) -> None:
-        super().__init__(token)
+                value: str,
+                position: int = -1) -> None:
+        super().__init__(token, position)
         self.value = value
 
+    def token_literal(self) -> str:
+        return self.value
+
     def __str__(self) -> str:
-        return super().__str__()
\ No newline at end of file
+        return self.value
@@ -6,7 +6,7 @@ from typing import (
 from lpp.object import (
     Builtin,
     Error,
-    Integer,
+    new_integer,
     Object,
     String,
 )
@@ -21,7 +21,7 @@ def longitud(*args: Object) -> Object:
         return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 1))
     elif type(args[0]) == String:
         argument = cast(String, args[0])
-        return Integer(len(argument.value))
+        return new_integer(len(argument.value))
     else:
         return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
 
@@ -0,0 +1,245 @@
+from hashlib import sha256
+from marshal import (
+    dumps,
+    loads,
+)
+from os import (
+    getpid,
+    makedirs,
+    path,
+    replace,
+)
+from sys import implementation
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from lpp import __version__
+from lpp.ast import (
+    ASTNode,
+    Block,
+    Boolean,
+    Call,
+    Expression,
+    ExpressionStatement,
+    Function,
+    Identifier,
+    If,
+    Infix,
+    Integer,
+    LetStatement,
+    Prefix,
+    Program,
+    ReturnStatement,
+    Statement,
+    StringLiteral,
+)
+from lpp.codegen import (
+    compile_python,
+    PythonProgram,
+)
+from lpp.lexer import Lexer
+from lpp.object import ConstantPool
+from lpp.parser import Parser
+
+
+DEFAULT_CACHE_DIRECTORY: str = '__lppcache__'
+
+# Se incrementa cada vez que cambian los nodos o el formato binario
+FORMAT_VERSION: int = 2
+
+# Por cada nodo: los atributos escalares que se guardan tal cual y los atributos que
+# son otros nodos (o listas de nodos). El orden de esta lista es el código de cada nodo
+# en el formato binario, así que solo se deben agregar nodos al final
+_NODES: List[Tuple[Type[ASTNode], Tuple[str, ...], Tuple[str, ...]]] = [
+    (Program, (), ('statements',)),
+    (LetStatement, ('position',), ('name', 'value')),
+    (ReturnStatement, ('position',), ('return_value',)),
+    (ExpressionStatement, ('position',), ('expression',)),
+    (Identifier, ('position', 'value'), ()),
+    (Integer, ('position', 'value'), ()),
+    (Boolean, ('position', 'value'), ()),
+    (StringLiteral, ('position', 'value'), ()),
+    (Prefix, ('position', 'operator'), ('right',)),
+    (Infix, ('position', 'operator'), ('left', 'right')),
+    (Block, ('position',), ('statements',)),
+    (If, ('position',), ('condition', 'consequence', 'alternative')),
+    (Function, ('position',), ('parameters', 'body')),
+    (Call, ('position',), ('function', 'arguments')),
+]
+
+_NODE_CODES: Dict[Type[ASTNode], int] = {node_class: code for code, (node_class, _, _) in enumerate(_NODES)}
+
+_NONE: int = -1
+_LIST: int = -2
+
+
+def dump_program(program: Program) -> bytes:
+    # El árbol se escribe en postorden como una lista plana (primero los hijos y luego
+    # el código del nodo con sus escalares), así no importa qué tan profundo sea
+    code: List[Any] = []
+    pending: List[Tuple[Any, bool]] = [(program, False)]
+
+    while pending:
+        node, children_done = pending.pop()
+
+        if node is None:
+            code.append(_NONE)
+        elif type(node) == list:
+            if children_done:
+                code.append(_LIST)
+                code.append(len(node))
+            else:
+                pending.append((node, True))
+                pending.extend((child, False) for child in reversed(node))
+        else:
+            node_code = _NODE_CODES[type(node)]
+            _, scalars, children = _NODES[node_code]
+
+            if children_done or not children:
+                code.append(node_code)
+                code.extend(getattr(node, scalar) for scalar in scalars)
+            else:
+                pending.append((node, True))
+                pending.extend((getattr(node, child), False) for child in reversed(children))
+
+    return dumps(code)
+
+
+def load_program(data: bytes) -> Program:
+    code: List[Any] = loads(data)
+    stack: List[Any] = []
+    constants = ConstantPool()
+
+    index = 0
+    while index < len(code):
+        node_code = code[index]
+        index += 1
+
+        if node_code == _NONE:
+            stack.append(None)
+        elif node_code == _LIST:
+            count = code[index]
+            index += 1
+
+            items = stack[len(stack) - count:]
+            del stack[len(stack) - count:]
+            stack.append(items)
+        else:
+            node_class, scalars, children = _NODES[node_code]
+            node = node_class.__new__(node_class)
+
+            for scalar in scalars:
+                setattr(node, scalar, code[index])
+                index += 1
+
+            # __new__ no pasa por __init__. Igual que en el parser, cada literal apunta
+            # a su objeto en el programa
+            if node_class == Integer:
+                node.cache = constants.integer(node.value)
+            elif node_class == StringLiteral:
+                node.cache = constants.string(node.value)
+            elif isinstance(node, (Expression, Statement)):
+                node.cache = None
+
+            for child in reversed(children):
+                setattr(node, child, stack.pop())
+
+            stack.append(node)
+
+    program = stack.pop()
+    assert type(program) == Program and not stack
+
+    return program
+
+
+class ASTCache:
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIRECTORY) -> None:
+        self.directory = directory
+        self.hits: int = 0
+        self.misses: int = 0
+        # El código de Python generado se cuenta aparte de los árboles
+        self.python_hits: int = 0
+        self.python_misses: int = 0
+
+    def parse(self, source: str) -> Tuple[Program, List[str]]:
+        cache_path = path.join(self.directory, f'{self._key(source)}.lppc')
+
+        data = self._read(cache_path)
+        if data is not None:
+            try:
+                program = load_program(data)
+            except (ValueError, EOFError, TypeError, IndexError, AssertionError):
+                pass
+            else:
+                self.hits += 1
+
+                return program, []
+
+        self.misses += 1
+
+        parser = Parser(Lexer(source))
+        program = parser.parse_program()
+
+        # Un programa con errores no se guarda para que los errores se vuelvan a reportar
+        if not parser.errors:
+            self._write(cache_path, dump_program(program))
+
+        return program, parser.errors
+
+    def python_program(self, source: str, program: Program) -> PythonProgram:
+        # El código de Python generado se guarda junto al árbol con la misma llave
+        cache_path = path.join(self.directory, f'{self._key(source)}.lppy')
+
+        data = self._read(cache_path)
+        if data is not None:
+            try:
+                python_program = PythonProgram.from_bytes(data, program)
+            except (ValueError, EOFError, TypeError):
+                pass
+            else:
+                self.python_hits += 1
+
+                return python_program
+
+        self.python_misses += 1
+
+        python_program = compile_python(program)
+        self._write(cache_path, python_program.to_bytes())
+
+        return python_program
+
+    def _key(self, source: str) -> str:
+        # La versión de Python también es parte de la llave porque el formato de marshal
+        # puede cambiar entre versiones, igual que en __pycache__
+        key = sha256(f'{__version__}\0{FORMAT_VERSION}\0{implementation.cache_tag}\0'.encode('utf-8'))
+        key.update(source.encode('utf-8'))
+
+        return key.hexdigest()
+
+    def _read(self, cache_path: str) -> Optional[bytes]:
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                return cache_file.read()
+        except OSError:
+            return None
+
+    def _write(self, cache_path: str, data: bytes) -> None:
+        try:
+            makedirs(self.directory, exist_ok=True)
+
+            # Se escribe en un archivo temporal y se renombra para que otro proceso
+            # nunca lea una entrada a medio escribir
+            temporary_path = f'{cache_path}.{getpid()}.tmp'
+            with open(temporary_path, 'wb') as cache_file:
+                cache_file.write(data)
+
+            replace(temporary_path, cache_path)
+        except OSError:
+            pass
@@ -0,0 +1,59 @@
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Set,
+    Tuple,
+)
+
+import lpp.ast as ast
+
+
+# Un procedimiento solo puede leer de su ambiente los identificadores que aparecen en
+# su cuerpo (o en los de los procedimientos anidados), menos sus parámetros, que
+# siempre están en el ambiente de la llamada. Las variables locales se cuentan porque,
+# igual que con Environment, antes de asignarse se buscan afuera.
+def free_variables(function: ast.Function) -> FrozenSet[str]:
+    free = function.cache
+    if free is not None:
+        return free
+
+    assert function.body is not None
+    names: Set[str] = set()
+    pending: List[Any] = [function.body]
+
+    while pending:
+        node = pending.pop()
+        node_type = type(node)
+
+        if node_type == list:
+            pending.extend(node)
+        elif node is None:
+            continue
+        elif node_type == ast.Identifier:
+            names.add(node.value)
+        elif node_type == ast.Function:
+            names.update(free_variables(node))
+        elif node_type == ast.LetStatement:
+            # El nombre de la variable se escribe en el ambiente de la llamada
+            pending.append(node.value)
+        else:
+            for child in _CHILDREN.get(node_type, ()):
+                pending.append(getattr(node, child))
+
+    names.difference_update(parameter.value for parameter in function.parameters)
+
+    free = function.cache = frozenset(names)
+    return free
+
+
+_CHILDREN: Dict[type, Tuple[str, ...]] = {
+    ast.ReturnStatement: ('return_value',),
+    ast.ExpressionStatement: ('expression',),
+    ast.Prefix: ('right',),
+    ast.Infix: ('left', 'right'),
+    ast.Block: ('statements',),
+    ast.If: ('condition', 'consequence', 'alternative'),
+    ast.Call: ('function', 'arguments'),
+}
@@ -0,0 +1,403 @@
+from operator import (
+    add,
+    eq,
+    floordiv,
+    gt,
+    lt,
+    mul,
+    ne,
+    sub,
+)
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import lpp.ast as ast
+from lpp.builtins import BUILTINS
+from lpp.capture import free_variables
+from lpp.evaluator import (
+    apply_function,
+    evaluate_bang_operator_expression,
+    extend_function_environment,
+    evaluate_infix_expression,
+    evaluate_minus_operator_expression,
+    evaluate_prefix_expression,
+    is_truthy,
+    new_error,
+    NOT_A_FUNCTION,
+    TailCall,
+    to_boolean_object,
+    UNKNOW_IDENTIFIER,
+    NULL,
+)
+from lpp.inference import is_integer
+from lpp.object import (
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Integer,
+    new_integer,
+    Object,
+    Return,
+    String,
+)
+
+
+# El árbol se traduce una sola vez a closures de Python anidadas, una por nodo y
+# especializada para ese nodo. Ejecutar el programa es solo llamar a la closure raíz
+# con el ambiente: ya no hay despacho por tipo de nodo ni asserts en tiempo de ejecución
+Code = Callable[[Environment], Optional[Object]]
+# Una expresión que siempre es un entero se traduce a closures que regresan el int de
+# Python, ver _compile_integer_expression
+IntegerCode = Callable[[Environment], int]
+
+
+class _NotAnInteger(Exception):
+    # Un nombre que según lpp.inference siempre es entero no lo fue (si no existe, el
+    # ambiente lanza KeyError)
+    pass
+
+
+class CompiledFunction(Function):
+    __slots__ = ('code', 'names')
+
+    def __init__(self,
+                parameters: List[ast.Identifier],
+                body: ast.Block,
+                env: Environment,
+                code: Code) -> None:
+        super().__init__(parameters, body, env)
+        self.code = code
+        self.names: List[str] = [parameter.value for parameter in parameters]
+
+
+# Operaciones entre dos enteros: la operación de Python y cómo se envuelve el resultado
+_INTEGER_OPERATIONS: Dict[str, Tuple[Callable[[int, int], Any], Callable[[Any], Object]]] = {
+    '+': (add, new_integer),
+    '-': (sub, new_integer),
+    '*': (mul, new_integer),
+    '/': (floordiv, new_integer),
+    '<': (lt, to_boolean_object),
+    '>': (gt, to_boolean_object),
+    '==': (eq, to_boolean_object),
+    '!=': (ne, to_boolean_object),
+}
+
+
+def compile_program(program: ast.Program) -> Code:
+    statements = [compile_node(statement) for statement in program.statements]
+
+    def run_program(env: Environment) -> Optional[Object]:
+        result: Optional[Object] = None
+
+        for statement in statements:
+            result = statement(env)
+
+            if type(result) is Return:
+                return result._value  # type: ignore
+            elif type(result) is Error:
+                return result
+
+        return result
+
+    return run_program
+
+
+def compile_node(node: ast.ASTNode) -> Code:
+    try:
+        compiler = _COMPILERS[type(node)]
+    except KeyError:
+        return lambda env: None
+
+    return compiler(node)
+
+
+def apply_compiled_function(function: Object, args: List[Object]) -> Object:
+    if type(function) is CompiledFunction:
+        compiled = cast(CompiledFunction, function)
+
+        env = Environment(outer=compiled.env)
+        for index, name in enumerate(compiled.names):
+            env[name] = args[index]
+
+        code = compiled.code
+    elif type(function) is Function:
+        # Un procedimiento del evaluador de árbol (ver lpp.tiering): si su cuerpo ya se
+        # compiló se ejecuta aquí mismo, si no lo llama el evaluador
+        tree_function = cast(Function, function)
+
+        promoted = tree_function.body.cache
+        if promoted is None:
+            return apply_function(function, args)
+
+        env = extend_function_environment(tree_function, args)
+        code = promoted
+    elif type(function) is Builtin:
+        return cast(Builtin, function).fn(*args)
+    else:
+        return new_error(NOT_A_FUNCTION, [function.type().name])
+
+    result = code(env)
+    env.release()
+
+    # Un cuerpo siempre produce un valor, solo las sentencias sueltas producen None
+    if type(result) is Return:
+        result = cast(Return, result)._value
+
+        if type(result) is TailCall:
+            tail_call = cast(TailCall, result)
+            return apply_function(tail_call.fn, tail_call.args)
+
+    return cast(Object, result)
+
+
+def _compile_block(node: ast.Block) -> Code:
+    statements = [compile_node(statement) for statement in node.statements]
+
+    def run_block(env: Environment) -> Optional[Object]:
+        result: Optional[Object] = None
+
+        for statement in statements:
+            result = statement(env)
+
+            if type(result) is Return or type(result) is Error:
+                return result
+
+        return result
+
+    return run_block
+
+
+def _compile_expression_statement(node: ast.ExpressionStatement) -> Code:
+    assert node.expression is not None
+    return compile_node(node.expression)
+
+
+def _compile_integer(node: ast.Integer) -> Code:
+    assert node.value is not None
+    value = new_integer(node.value)
+
+    return lambda env: value
+
+
+def _compile_boolean(node: ast.Boolean) -> Code:
+    assert node.value is not None
+    value = to_boolean_object(node.value)
+
+    return lambda env: value
+
+
+def _compile_string(node: ast.StringLiteral) -> Code:
+    value = String(node.value)
+
+    return lambda env: value
+
+
+def _compile_identifier(node: ast.Identifier) -> Code:
+    name = node.value
+
+    def identifier(env: Environment) -> Optional[Object]:
+        try:
+            return env[name]
+        except KeyError:
+            return BUILTINS.get(name, new_error(UNKNOW_IDENTIFIER, [name]))
+
+    return identifier
+
+
+def _compile_prefix(node: ast.Prefix) -> Code:
+    assert node.right is not None
+    right = compile_node(node.right)
+    operator = node.operator
+
+    if operator == '-':
+        def minus(env: Environment) -> Optional[Object]:
+            value = right(env)
+
+            if type(value) is Integer:
+                return new_integer(-value._value)  # type: ignore
+
+            return evaluate_minus_operator_expression(cast(Object, value))
+
+        return minus
+    elif operator == '!':
+        return lambda env: evaluate_bang_operator_expression(right(env))  # type: ignore
+
+    return lambda env: evaluate_prefix_expression(operator, right(env))  # type: ignore
+
+
+def _compile_infix(node: ast.Infix) -> Code:
+    assert node.left is not None and node.right is not None
+    left = compile_node(node.left)
+    right = compile_node(node.right)
+    operator = node.operator
+
+    if operator not in _INTEGER_OPERATIONS:
+        return lambda env: evaluate_infix_expression(operator, left(env), right(env))  # type: ignore
+
+    operation, wrap = _INTEGER_OPERATIONS[operator]
+
+    if is_integer(node.left) and is_integer(node.right):
+        # lpp.inference demostró que los operandos son enteros: se opera con los int de
+        # Python y solo se crea el objeto del resultado. Si la inferencia se equivoca
+        # (p.ej. un nombre que se lee antes de asignarse) se evalúa de forma genérica;
+        # los operandos no tienen llamadas, así que evaluarlos otra vez no cambia nada
+        left_integer = _compile_integer_expression(node.left)
+        right_integer = _compile_integer_expression(node.right)
+
+        def integer_infix(env: Environment) -> Optional[Object]:
+            try:
+                return wrap(operation(left_integer(env), right_integer(env)))
+            except (_NotAnInteger, KeyError):
+                return evaluate_infix_expression(operator, cast(Object, left(env)), cast(Object, right(env)))
+
+        return integer_infix
+
+    def infix(env: Environment) -> Optional[Object]:
+        left_value = left(env)
+        right_value = right(env)
+
+        if type(left_value) is Integer and type(right_value) is Integer:
+            return wrap(operation(left_value._value, right_value._value))  # type: ignore
+
+        return evaluate_infix_expression(operator, cast(Object, left_value), cast(Object, right_value))
+
+    return infix
+
+
+def _compile_integer_expression(node: ast.Expression) -> IntegerCode:
+    if type(node) == ast.Integer:
+        value = cast(ast.Integer, node).value
+        assert value is not None
+
+        return lambda env: value
+    elif type(node) == ast.Identifier:
+        name = cast(ast.Identifier, node).value
+
+        def identifier(env: Environment) -> int:
+            value = env[name]
+            if type(value) is Integer:
+                return value._value
+
+            raise _NotAnInteger()
+
+        return identifier
+    elif type(node) == ast.Prefix:
+        right = _compile_integer_expression(cast(ast.Expression, cast(ast.Prefix, node).right))
+
+        return lambda env: -right(env)
+
+    infix = cast(ast.Infix, node)
+    left = _compile_integer_expression(infix.left)
+    right = _compile_integer_expression(cast(ast.Expression, infix.right))
+    operation = _INTEGER_OPERATIONS[infix.operator][0]
+
+    return lambda env: operation(left(env), right(env))
+
+
+def _compile_if(node: ast.If) -> Code:
+    assert node.condition is not None and node.consequence is not None
+    condition = compile_node(node.condition)
+    consequence = compile_node(node.consequence)
+    alternative = compile_node(node.alternative) if node.alternative is not None else None
+
+    def if_expression(env: Environment) -> Optional[Object]:
+        if is_truthy(condition(env)):  # type: ignore
+            return consequence(env)
+        elif alternative is not None:
+            return alternative(env)
+        else:
+            return NULL
+
+    return if_expression
+
+
+def _compile_return(node: ast.ReturnStatement) -> Code:
+    assert node.return_value is not None
+
+    if type(node.return_value) == ast.Call:
+        call = cast(ast.Call, node.return_value)
+        function = compile_node(call.function)
+        arguments = [compile_node(argument) for argument in call.arguments or []]
+
+        def return_call(env: Environment) -> Optional[Object]:
+            fn = function(env)
+            args: List[Object] = [argument(env) for argument in arguments]  # type: ignore
+
+            if type(fn) is Function:
+                # Un procedimiento del evaluador de árbol (ver lpp.tiering): la llamada la
+                # hace quien ejecuta este cuerpo, igual que con lpp.evaluator.call_function
+                return Return(TailCall(fn, args))
+
+            return Return(apply_compiled_function(fn, args))  # type: ignore
+
+        return return_call
+
+    value = compile_node(node.return_value)
+
+    return lambda env: Return(value(env))  # type: ignore
+
+
+def _compile_let(node: ast.LetStatement) -> Code:
+    assert node.name is not None and node.value is not None
+    name = node.name.value
+    value = compile_node(node.value)
+
+    def let(env: Environment) -> Optional[Object]:
+        env[name] = value(env)
+
+        return None
+
+    return let
+
+
+def _compile_function(node: ast.Function) -> Code:
+    assert node.body is not None
+    parameters = node.parameters
+    body = node.body
+    code = compile_node(body)
+    free = free_variables(node)
+
+    def function(env: Environment) -> Optional[Object]:
+        env.capture(free)
+
+        return CompiledFunction(parameters, body, env, code)
+
+    return function
+
+
+def _compile_call(node: ast.Call) -> Code:
+    assert node.arguments is not None
+    function = compile_node(node.function)
+    arguments = [compile_node(argument) for argument in node.arguments]
+
+    def call(env: Environment) -> Optional[Object]:
+        return apply_compiled_function(function(env), [argument(env) for argument in arguments])  # type: ignore
+
+    return call
+
+
+_COMPILERS: Dict[Type[ast.ASTNode], Callable[[Any], Code]] = {
+    ast.Program: compile_program,
+    ast.ExpressionStatement: _compile_expression_statement,
+    ast.Integer: _compile_integer,
+    ast.Boolean: _compile_boolean,
+    ast.Prefix: _compile_prefix,
+    ast.Infix: _compile_infix,
+    ast.Block: _compile_block,
+    ast.If: _compile_if,
+    ast.ReturnStatement: _compile_return,
+    ast.LetStatement: _compile_let,
+    ast.Identifier: _compile_identifier,
+    ast.Function: _compile_function,
+    ast.Call: _compile_call,
+    ast.StringLiteral: _compile_string,
+}
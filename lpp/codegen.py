@@ -0,0 +1,677 @@
+import ast as pyast
+from marshal import (
+    dumps,
+    loads,
+)
+from types import (
+    CodeType,
+    FunctionType,
+)
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+
+import lpp.ast as ast
+from lpp.builtins import BUILTINS
+from lpp.evaluator import (
+    new_error,
+    NOT_A_FUNCTION,
+    TYPE_MISMATCH,
+    UNKNOW_IDENTIFIER,
+    UNKNOW_INFIX_OPERATION,
+    UNKNOW_PREFIX_OPERATION,
+    FALSE,
+    NULL,
+    TRUE,
+)
+from lpp.object import (
+    Boolean,
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Integer,
+    new_integer,
+    Object,
+    ObjectType,
+    Return,
+    String,
+)
+
+
+# Traduce un Program a un módulo de Python. Los valores de LPP se representan con
+# valores nativos mientras el programa corre (int, str, True/False, None para las
+# sentencias variable) y solo se convierten a objetos de lpp.object al final. NULL,
+# Error, Return y Builtin siguen siendo los objetos del evaluador.
+#
+# Cada procedimiento es una función de Python anidada y el programa completo es la
+# función _programa. Las variables de cada procedimiento se renombran a
+# <nombre>_<ámbito> para que una variable que todavía no se asigna en un ámbito pueda
+# seguir buscándose en los ámbitos de afuera, igual que Environment; por eso empiezan
+# con el valor _UNBOUND
+
+_PROGRAM_NAME: str = '_programa'
+_FILE_NAME: str = '<lpp>'
+
+_INTEGER_OPERATORS: Dict[str, pyast.AST] = {
+    '+': pyast.Add(),
+    '-': pyast.Sub(),
+    '*': pyast.Mult(),
+    '/': pyast.FloorDiv(),
+    '<': pyast.Lt(),
+    '>': pyast.Gt(),
+    '==': pyast.Eq(),
+    '!=': pyast.NotEq(),
+}
+
+
+class _Unbound:
+
+    def __repr__(self) -> str:
+        return '_UNBOUND'
+
+
+_UNBOUND = _Unbound()
+
+
+class PythonFunction(Function):
+    __slots__ = ('function',)
+
+    def __init__(self, function: FunctionType, node: ast.Function) -> None:
+        assert node.body is not None
+        super().__init__(node.parameters, node.body, Environment())
+        self.function = function
+
+
+class PythonProgram:
+
+    def __init__(self, code: CodeType, functions: List[ast.Function]) -> None:
+        self.code = code
+        self.functions = functions
+
+    def run(self) -> Optional[Object]:
+        namespace: Dict[str, Any] = dict(_RUNTIME)
+        namespace['_call'] = self._call
+
+        exec(self.code, namespace)
+
+        return self._to_object(namespace[_PROGRAM_NAME]())
+
+    def to_bytes(self) -> bytes:
+        return dumps(self.code)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, program: ast.Program) -> 'PythonProgram':
+        code = loads(data)
+        if type(code) != CodeType:
+            raise ValueError('Se esperaba un objeto de código')
+
+        return cls(code, _collect_functions(program))
+
+    def _call(self, function: Any, *args: Any) -> Any:
+        if type(function) is FunctionType:
+            return function(*args)
+        elif type(function) is Builtin:
+            arguments: List[Object] = [cast(Object, self._to_object(arg)) for arg in args]
+
+            return _from_object(function.fn(*arguments))
+
+        return new_error(NOT_A_FUNCTION, [_type_name(function)])
+
+    def _to_object(self, value: Any) -> Optional[Object]:
+        value_type = type(value)
+
+        if value_type is bool:
+            return TRUE if value else FALSE
+        elif value_type is int:
+            return new_integer(value)
+        elif value_type is str:
+            return String(value)
+        elif value_type is FunctionType:
+            index = int(value.__code__.co_name.rsplit('_', 1)[1])
+            return PythonFunction(value, self.functions[index])
+        elif value_type is Return:
+            return Return(self._to_object(value._value))  # type: ignore
+
+        return value
+
+
+def compile_python(program: ast.Program) -> PythonProgram:
+    generator = _Generator(program)
+    module = generator.generate()
+
+    return PythonProgram(compile(module, _FILE_NAME, 'exec'), generator.functions)
+
+
+def emit_python(program: ast.Program) -> str:
+    return pyast.unparse(_Generator(program).generate())
+
+
+def _collect_functions(program: ast.Program) -> List[ast.Function]:
+    # Todos los nodos Function en preorden: la posición en esta lista es el número
+    # con el que se nombra la función de Python generada
+    functions: List[ast.Function] = []
+    pending: List[Any] = [program]
+
+    while pending:
+        node = pending.pop()
+
+        if type(node) == list:
+            pending.extend(reversed(node))
+        elif node is not None:
+            if type(node) == ast.Function:
+                functions.append(node)
+
+            for child in reversed(_CHILDREN.get(type(node), ())):
+                pending.append(getattr(node, child))
+
+    return functions
+
+
+_CHILDREN: Dict[type, tuple] = {
+    ast.Program: ('statements',),
+    ast.LetStatement: ('value',),
+    ast.ReturnStatement: ('return_value',),
+    ast.ExpressionStatement: ('expression',),
+    ast.Prefix: ('right',),
+    ast.Infix: ('left', 'right'),
+    ast.Block: ('statements',),
+    ast.If: ('condition', 'consequence', 'alternative'),
+    ast.Function: ('body',),
+    ast.Call: ('function', 'arguments'),
+}
+
+
+class _Scope:
+    # Un ámbito de LPP: el programa o un procedimiento. Los bloques de si no crean
+    # ámbitos, sus variables pertenecen al procedimiento que los contiene
+
+    def __init__(self, number: int, parent: Optional['_Scope'], parameters: List[str]) -> None:
+        self.number = number
+        self.parent = parent
+        self.parameters: Set[str] = set(parameters)
+        self.names: Set[str] = set()
+
+    def python_name(self, name: str) -> str:
+        return f'{name}_{self.number}'
+
+
+class _Definition:
+    # Una función de Python que se está generando: un procedimiento o un bloque que se
+    # evalúa como expresión
+
+    def __init__(self, scope: _Scope) -> None:
+        self.scope = scope
+        self.temporaries = 0
+        self.assigned: Set[str] = set()
+
+
+# En modo _TAIL regresa termina el procedimiento (o el programa); en modo _VALUE el
+# bloque es una expresión y regresa produce un objeto Return como valor del bloque
+_TAIL: int = 0
+_VALUE: int = 1
+
+
+class _Generator:
+
+    def __init__(self, program: ast.Program) -> None:
+        self._program = program
+        self.functions = _collect_functions(program)
+        self._function_numbers: Dict[int, int] = {id(function): index for index, function in enumerate(self.functions)}
+
+        self._definitions: List[_Definition] = []
+        self._prelude: List[pyast.stmt] = []
+        self._blocks = 0
+
+    def generate(self) -> pyast.Module:
+        scope = self._scope(self._program, None, [])
+        body = self._function_body(scope, self._program.statements)
+
+        definition = pyast.FunctionDef(name=_PROGRAM_NAME,
+                                       args=self._arguments([]),
+                                       body=body,
+                                       decorator_list=[])
+
+        module = pyast.Module(body=[definition], type_ignores=[])
+        return pyast.fix_missing_locations(module)
+
+    def _scope(self, node: Any, parent: Optional[_Scope], parameters: List[str]) -> _Scope:
+        number = 0 if parent is None else self._function_numbers[id(node)] + 1
+        scope = _Scope(number, parent, parameters)
+
+        pending: List[Any] = list(node.statements if type(node) == ast.Program else node.body.statements)
+        while pending:
+            current = pending.pop()
+
+            if type(current) == list:
+                pending.extend(current)
+            elif current is not None and type(current) != ast.Function:
+                if type(current) == ast.LetStatement:
+                    assert current.name is not None
+                    scope.names.add(current.name.value)
+
+                for child in _CHILDREN.get(type(current), ()):
+                    pending.append(getattr(current, child))
+
+        return scope
+
+    @property
+    def _definition(self) -> _Definition:
+        return self._definitions[-1]
+
+    def _function_body(self, scope: _Scope, statements: List[ast.Statement]) -> List[pyast.stmt]:
+        self._definitions.append(_Definition(scope))
+
+        body: List[pyast.stmt] = []
+        unbound = sorted(scope.names - scope.parameters)
+        if unbound:
+            body.append(pyast.Assign(targets=[self._store(scope.python_name(name)) for name in unbound],
+                                     value=self._load('_UNBOUND')))
+
+        body.extend(self._sequence(statements, _TAIL, True))
+        self._definitions.pop()
+
+        return body
+
+    def _sequence(self, statements: List[ast.Statement], mode: int, tail: bool) -> List[pyast.stmt]:
+        out: List[pyast.stmt] = []
+
+        for index, statement in enumerate(statements):
+            out.extend(self._statement(statement, mode, tail and index == len(statements) - 1))
+
+            # Lo que sigue a un regresa nunca se ejecuta
+            if type(statement) == ast.ReturnStatement:
+                return out
+
+        if tail and not statements:
+            out.append(pyast.Return(value=pyast.Constant(value=None)))
+
+        return out
+
+    def _statement(self, statement: ast.Statement, mode: int, tail: bool) -> List[pyast.stmt]:
+        outer_prelude = self._prelude
+        self._prelude = []
+
+        out = self._prelude
+        if type(statement) == ast.LetStatement:
+            out.extend(self._let(statement, tail))
+        elif type(statement) == ast.ReturnStatement:
+            value = self._expression(statement.return_value)
+            if mode == _VALUE:
+                value = self._call_name('_Return', [value])
+
+            out.append(pyast.Return(value=value))
+        elif type(statement) == ast.ExpressionStatement:
+            out.extend(self._expression_statement(statement.expression, mode, tail))
+        elif type(statement) == ast.Block:
+            out.extend(self._sequence(statement.statements, mode, tail))
+        elif tail:
+            out.append(pyast.Return(value=pyast.Constant(value=None)))
+
+        self._prelude = outer_prelude
+        return out
+
+    def _let(self, statement: ast.LetStatement, tail: bool) -> List[pyast.stmt]:
+        assert statement.name is not None
+        python_name = self._definition.scope.python_name(statement.name.value)
+        self._definition.assigned.add(python_name)
+
+        out: List[pyast.stmt] = [pyast.Assign(targets=[self._store(python_name)],
+                                              value=self._expression(statement.value))]
+        if tail:
+            out.append(pyast.Return(value=pyast.Constant(value=None)))
+
+        return out
+
+    def _expression_statement(self, expression: Optional[ast.Expression], mode: int, tail: bool) -> List[pyast.stmt]:
+        if type(expression) == ast.If:
+            return [self._if_statement(expression, mode, tail)]  # type: ignore
+        elif expression is None or type(expression) in (ast.Integer, ast.Boolean, ast.StringLiteral, ast.Function):
+            if tail:
+                return [pyast.Return(value=self._expression(expression))]
+
+            return []
+        elif tail and type(expression) != ast.Identifier:
+            return [pyast.Return(value=self._expression(expression))]
+
+        # El valor de la sentencia puede ser un Error o un Return (p.ej. una variable que
+        # guardó uno), en cuyo caso el bloque termina con ese valor
+        temporary = self._temporary()
+        stop: pyast.expr = self._load(temporary)
+        if mode == _TAIL:
+            stop = self._call_name('_unwrap', [stop])
+
+        out: List[pyast.stmt] = [
+            pyast.Assign(targets=[self._store(temporary)], value=self._expression(expression)),
+            pyast.If(test=pyast.Compare(left=self._call_name('type', [self._load(temporary)]),
+                                        ops=[pyast.In()],
+                                        comparators=[self._load('_STOP')]),
+                     body=[pyast.Return(value=stop)],
+                     orelse=[]),
+        ]
+        if tail:
+            out.append(pyast.Return(value=self._load(temporary)))
+
+        return out
+
+    def _if_statement(self, expression: ast.If, mode: int, tail: bool) -> pyast.stmt:
+        assert expression.consequence is not None
+        test = self._truthy(expression.condition)
+
+        body = self._sequence(expression.consequence.statements, mode, tail) or [pyast.Pass()]
+        if expression.alternative is not None:
+            orelse = self._sequence(expression.alternative.statements, mode, tail)
+        else:
+            orelse = [pyast.Return(value=self._load('_NULL'))] if tail else []
+
+        return pyast.If(test=test, body=body, orelse=orelse)
+
+    def _expression(self, expression: Optional[ast.Expression]) -> pyast.expr:
+        expression_type = type(expression)
+
+        if expression_type == ast.Integer or expression_type == ast.Boolean or expression_type == ast.StringLiteral:
+            return pyast.Constant(value=expression.value)  # type: ignore
+        elif expression_type == ast.Identifier:
+            return self._identifier(expression.value)  # type: ignore
+        elif expression_type == ast.Prefix:
+            return self._prefix(expression)  # type: ignore
+        elif expression_type == ast.Infix:
+            return self._infix(expression)  # type: ignore
+        elif expression_type == ast.If:
+            return self._if_expression(expression)  # type: ignore
+        elif expression_type == ast.Function:
+            return self._function(expression)  # type: ignore
+        elif expression_type == ast.Call:
+            return self._call(expression)  # type: ignore
+
+        return pyast.Constant(value=None)
+
+    def _identifier(self, name: str) -> pyast.expr:
+        # Los parámetros siempre están asignados, así que terminan la búsqueda
+        candidates: List[str] = []
+        lookup: pyast.expr = self._call_name('_unknown', [pyast.Constant(value=name)])
+
+        scope: Optional[_Scope] = self._definition.scope
+        while scope is not None:
+            if name in scope.parameters:
+                lookup = self._load(scope.python_name(name))
+                break
+            elif name in scope.names:
+                candidates.append(scope.python_name(name))
+
+            scope = scope.parent
+
+        for candidate in reversed(candidates):
+            lookup = pyast.IfExp(test=pyast.Compare(left=self._load(candidate),
+                                                    ops=[pyast.IsNot()],
+                                                    comparators=[self._load('_UNBOUND')]),
+                                 body=self._load(candidate),
+                                 orelse=lookup)
+
+        return lookup
+
+    def _prefix(self, expression: ast.Prefix) -> pyast.expr:
+        temporary = self._temporary()
+        right = pyast.NamedExpr(target=self._store(temporary), value=self._expression(expression.right))
+
+        if expression.operator == '!':
+            # !x es verdadero solo para falso y nulo
+            return pyast.BoolOp(op=pyast.Or(), values=[
+                pyast.Compare(left=right, ops=[pyast.Is()], comparators=[pyast.Constant(value=False)]),
+                pyast.Compare(left=self._load(temporary), ops=[pyast.Is()], comparators=[self._load('_NULL')]),
+            ])
+        elif expression.operator == '-':
+            return pyast.IfExp(test=self._is_integer(right),
+                               body=pyast.UnaryOp(op=pyast.USub(), operand=self._load(temporary)),
+                               orelse=self._call_name('_prefix', [pyast.Constant(value='-'), self._load(temporary)]))
+
+        return self._call_name('_prefix', [pyast.Constant(value=expression.operator), right])
+
+    def _infix(self, expression: ast.Infix) -> pyast.expr:
+        # Los operandos se guardan en temporales dentro de la condición para evaluarlos
+        # una sola vez y en orden; & en lugar de and para que siempre se evalúen ambos.
+        # Una literal entera no necesita revisarse
+        operands: List[pyast.expr] = []
+        checks: List[pyast.expr] = []
+
+        for operand in (expression.left, expression.right):
+            if type(operand) == ast.Integer:
+                operands.append(self._expression(operand))
+            else:
+                temporary = self._temporary()
+                named = pyast.NamedExpr(target=self._store(temporary), value=self._expression(operand))
+                operands.append(self._load(temporary))
+                checks.append(self._is_integer(named))
+
+        fallback = self._call_name('_infix', [pyast.Constant(value=expression.operator), *operands])
+        if not checks:
+            checks.append(pyast.Constant(value=True))
+
+        operator = _INTEGER_OPERATORS[expression.operator]
+        if type(operator) in (pyast.Lt, pyast.Gt, pyast.Eq, pyast.NotEq):
+            integer_operation: pyast.expr = pyast.Compare(left=operands[0],
+                                                          ops=[cast(pyast.cmpop, operator)],
+                                                          comparators=[operands[1]])
+        else:
+            integer_operation = pyast.BinOp(left=operands[0], op=cast(pyast.operator, operator), right=operands[1])
+
+        test = checks[0] if len(checks) == 1 else pyast.BinOp(left=checks[0], op=pyast.BitAnd(), right=checks[1])
+        return pyast.IfExp(test=test, body=integer_operation, orelse=fallback)
+
+    def _if_expression(self, expression: ast.If) -> pyast.expr:
+        assert expression.consequence is not None
+        test = self._truthy(expression.condition)
+        body = self._block_value(expression.consequence)
+        orelse = self._block_value(expression.alternative) if expression.alternative is not None \
+            else self._load('_NULL')
+
+        return pyast.IfExp(test=test, body=body, orelse=orelse)
+
+    def _block_value(self, block: ast.Block) -> pyast.expr:
+        statements = block.statements
+
+        if not statements:
+            return pyast.Constant(value=None)
+        elif len(statements) == 1 and type(statements[0]) == ast.ExpressionStatement:
+            return self._expression(statements[0].expression)  # type: ignore
+        elif len(statements) == 1 and type(statements[0]) == ast.ReturnStatement:
+            return self._call_name('_Return', [self._expression(statements[0].return_value)])  # type: ignore
+
+        # Un bloque con varias sentencias se vuelve una función anidada; las variables
+        # que asigna siguen siendo del procedimiento que lo contiene
+        self._blocks += 1
+        name = f'_bloque{self._blocks}'
+
+        self._definitions.append(_Definition(self._definition.scope))
+        outer_prelude = self._prelude
+
+        body = self._sequence(statements, _VALUE, True)
+        if self._definition.assigned:
+            body.insert(0, pyast.Nonlocal(names=sorted(self._definition.assigned)))
+
+        self._definitions.pop()
+        self._prelude = outer_prelude
+
+        self._prelude.append(pyast.FunctionDef(name=name,
+                                               args=self._arguments([]),
+                                               body=body,
+                                               decorator_list=[]))
+
+        return self._call_name(name, [])
+
+    def _function(self, expression: ast.Function) -> pyast.expr:
+        assert expression.body is not None
+        name = f'_procedimiento_{self._function_numbers[id(expression)]}'
+        parameters = [parameter.value for parameter in expression.parameters]
+
+        scope = self._scope(expression, self._definition.scope, parameters)
+        outer_prelude = self._prelude
+        body = self._function_body(scope, expression.body.statements)
+        self._prelude = outer_prelude
+
+        # Con un parámetro repetido el nombre se queda con el último argumento, igual que
+        # en Environment; Python no acepta argumentos repetidos
+        names = [scope.python_name(parameter) for parameter in parameters]
+        names = [f'_repetido_{index}' if name in names[index + 1:] else name for index, name in enumerate(names)]
+
+        self._prelude.append(pyast.FunctionDef(name=name,
+                                               args=self._arguments(names, rest=True),
+                                               body=body,
+                                               decorator_list=[]))
+
+        return self._load(name)
+
+    def _call(self, expression: ast.Call) -> pyast.expr:
+        # f(a, b) se vuelve:
+        #   _t1(_t2, _t3) if (_t1 := f, _t2 := a, _t3 := b) and type(_t1) is _FunctionType
+        #   else _call(_t1, _t2, _t3)
+        # para evaluar la función y los argumentos una vez y en orden
+        assert expression.arguments is not None
+        temporaries = [self._temporary() for _ in range(len(expression.arguments) + 1)]
+        values = [expression.function, *expression.arguments]
+
+        evaluations = pyast.Tuple(elts=[pyast.NamedExpr(target=self._store(temporary), value=self._expression(value))
+                                        for temporary, value in zip(temporaries, values)],
+                                  ctx=pyast.Load())
+        is_function = pyast.Compare(left=self._call_name('type', [self._load(temporaries[0])]),
+                                    ops=[pyast.Is()],
+                                    comparators=[self._load('_FunctionType')])
+
+        arguments: List[pyast.expr] = [self._load(temporary) for temporary in temporaries[1:]]
+        return pyast.IfExp(test=pyast.BoolOp(op=pyast.And(), values=[evaluations, is_function]),
+                           body=pyast.Call(func=self._load(temporaries[0]), args=arguments, keywords=[]),
+                           orelse=self._call_name('_call', [self._load(temporaries[0]), *arguments]))
+
+    def _truthy(self, condition: Optional[ast.Expression]) -> pyast.expr:
+        # Solo falso y nulo son falsos, 0 y "" son verdaderos
+        temporary = self._temporary()
+
+        return pyast.BoolOp(op=pyast.And(), values=[
+            pyast.Compare(left=pyast.NamedExpr(target=self._store(temporary), value=self._expression(condition)),
+                          ops=[pyast.IsNot()],
+                          comparators=[pyast.Constant(value=False)]),
+            pyast.Compare(left=self._load(temporary), ops=[pyast.IsNot()], comparators=[self._load('_NULL')]),
+        ])
+
+    def _is_integer(self, value: pyast.expr) -> pyast.expr:
+        return pyast.Compare(left=self._call_name('type', [value]), ops=[pyast.Is()], comparators=[self._load('int')])
+
+    def _temporary(self) -> str:
+        self._definition.temporaries += 1
+
+        return f'_t{self._definition.temporaries}'
+
+    def _arguments(self, names: List[str], rest: bool = False) -> pyast.arguments:
+        # *_resto en los procedimientos porque LPP ignora los argumentos de más, también
+        # cuando no tienen parámetros
+        return pyast.arguments(posonlyargs=[],
+                               args=[pyast.arg(arg=name) for name in names],
+                               vararg=pyast.arg(arg='_resto') if rest else None,
+                               kwonlyargs=[],
+                               kw_defaults=[],
+                               defaults=[])
+
+    def _call_name(self, name: str, args: List[pyast.expr]) -> pyast.expr:
+        return pyast.Call(func=self._load(name), args=args, keywords=[])
+
+    def _load(self, name: str) -> pyast.Name:
+        return pyast.Name(id=name, ctx=pyast.Load())
+
+    def _store(self, name: str) -> pyast.Name:
+        return pyast.Name(id=name, ctx=pyast.Store())
+
+
+def _type_name(value: Any) -> str:
+    value_type = type(value)
+
+    if value_type is bool:
+        return ObjectType.BOOLEAN.name
+    elif value_type is int:
+        return ObjectType.INTEGER.name
+    elif value_type is str:
+        return ObjectType.STRING.name
+    elif value_type is FunctionType:
+        return ObjectType.FUNCTION.name
+
+    return value.type().name
+
+
+def _from_object(value: Object) -> Any:
+    value_type = type(value)
+
+    if value_type is Integer:
+        return value._value  # type: ignore
+    elif value_type is String:
+        return value.value  # type: ignore
+    elif value_type is Boolean:
+        return value._value  # type: ignore
+
+    return value
+
+
+def _infix(operator: str, left: Any, right: Any) -> Any:
+    if type(left) is int and type(right) is int:
+        return _INTEGER_OPERATIONS[operator](left, right)
+    elif type(left) is str and type(right) is str:
+        if operator == '+':
+            return left + right
+        elif operator == '==':
+            return left == right
+        elif operator == '!=':
+            return left != right
+    elif operator == '==':
+        return left is right
+    elif operator == '!=':
+        return left is not right
+
+    left_type, right_type = _type_name(left), _type_name(right)
+    if left_type != right_type:
+        return new_error(TYPE_MISMATCH, [left_type, operator, right_type])
+
+    return new_error(UNKNOW_INFIX_OPERATION, [left_type, operator, right_type])
+
+
+def _prefix(operator: str, right: Any) -> Any:
+    if operator == '!':
+        return right is False or right is NULL
+    elif operator == '-' and type(right) is int:
+        return -right
+
+    return new_error(UNKNOW_PREFIX_OPERATION, [operator, _type_name(right)])
+
+
+def _unknown(name: str) -> Any:
+    return BUILTINS.get(name, new_error(UNKNOW_IDENTIFIER, [name]))
+
+
+def _unwrap(value: Any) -> Any:
+    return value._value if type(value) is Return else value
+
+
+_INTEGER_OPERATIONS: Dict[str, Any] = {
+    '+': lambda left, right: left + right,
+    '-': lambda left, right: left - right,
+    '*': lambda left, right: left * right,
+    '/': lambda left, right: left // right,
+    '<': lambda left, right: left < right,
+    '>': lambda left, right: left > right,
+    '==': lambda left, right: left == right,
+    '!=': lambda left, right: left != right,
+}
+
+_RUNTIME: Dict[str, Any] = {
+    '_FunctionType': FunctionType,
+    '_NULL': NULL,
+    '_Return': Return,
+    '_STOP': (Error, Return),
+    '_UNBOUND': _UNBOUND,
+    '_infix': _infix,
+    '_prefix': _prefix,
+    '_unknown': _unknown,
+    '_unwrap': _unwrap,
+}
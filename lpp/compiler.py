@@ -0,0 +1,301 @@
+from array import array
+from enum import IntEnum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import lpp.ast as ast
+from lpp.object import (
+    Function,
+    Integer,
+    new_integer,
+    Object,
+    String,
+)
+
+
+class OpCode(IntEnum):
+    CONSTANT = 0
+    TRUE = 1
+    FALSE = 2
+    NULL = 3
+    NONE = 4
+    POP = 5
+    ADD = 6
+    SUB = 7
+    MUL = 8
+    DIV = 9
+    LT = 10
+    GT = 11
+    EQ = 12
+    NE = 13
+    MINUS = 14
+    BANG = 15
+    JUMP = 16
+    JUMP_IF_FALSY = 17
+    JUMP_IF_STOP = 18
+    GET_NAME = 19
+    SET_NAME = 20
+    FUNCTION = 21
+    CALL = 22
+    RETURN_VALUE = 23
+    LEAVE = 24
+    HALT = 25
+
+
+# Operaciones que usan el operando: las demás lo ignoran
+_OPERAND_OPCODES = frozenset([
+    OpCode.CONSTANT,
+    OpCode.JUMP,
+    OpCode.JUMP_IF_FALSY,
+    OpCode.JUMP_IF_STOP,
+    OpCode.GET_NAME,
+    OpCode.SET_NAME,
+    OpCode.FUNCTION,
+    OpCode.CALL,
+])
+
+_INFIX_OPCODES: Dict[str, OpCode] = {
+    '+': OpCode.ADD,
+    '-': OpCode.SUB,
+    '*': OpCode.MUL,
+    '/': OpCode.DIV,
+    '<': OpCode.LT,
+    '>': OpCode.GT,
+    '==': OpCode.EQ,
+    '!=': OpCode.NE,
+}
+
+_PREFIX_OPCODES: Dict[str, OpCode] = {
+    '-': OpCode.MINUS,
+    '!': OpCode.BANG,
+}
+
+
+class CodeObject:
+    # Cada instrucción ocupa dos enteros: el código de operación y su operando.
+    # Los saltos apuntan a la posición dentro de instructions
+
+    def __init__(self,
+                name: str,
+                instructions: 'array[int]',
+                constants: List[Any],
+                parameters: List[str],
+                node: Optional[ast.Function] = None) -> None:
+        self.name = name
+        self.instructions = instructions
+        self.constants = constants
+        self.parameters = parameters
+        self.node = node
+
+
+class BytecodeFunction(Function):
+    __slots__ = ('code',)
+
+    def __init__(self, code: CodeObject, env: Any) -> None:
+        assert code.node is not None and code.node.body is not None
+        super().__init__(code.node.parameters, code.node.body, env)
+        self.code = code
+
+
+class Compiler:
+    # Todas las sentencias dejan exactamente un valor en la pila (None para variable),
+    # igual que evaluate() regresa un valor por sentencia. Después de cada sentencia
+    # que no es la última de su bloque, JUMP_IF_STOP salta al final del bloque si el
+    # valor es un Return o un Error, que es cuando el evaluador deja de ejecutar el bloque
+
+    def __init__(self) -> None:
+        self._instructions: 'array[int]' = array('i')
+        self._constants: List[Any] = []
+        self._constant_indexes: Dict[Tuple[type, Any], int] = {}
+
+        self._compilers: Dict[Type[ast.ASTNode], Callable[[Any], None]] = {
+            ast.ExpressionStatement: self._compile_expression_statement,
+            ast.Integer: self._compile_integer,
+            ast.Boolean: self._compile_boolean,
+            ast.StringLiteral: self._compile_string,
+            ast.Identifier: self._compile_identifier,
+            ast.Prefix: self._compile_prefix,
+            ast.Infix: self._compile_infix,
+            ast.Block: self._compile_block,
+            ast.If: self._compile_if,
+            ast.ReturnStatement: self._compile_return,
+            ast.LetStatement: self._compile_let,
+            ast.Function: self._compile_function,
+            ast.Call: self._compile_call,
+        }
+
+    def compile_program(self, program: ast.Program) -> CodeObject:
+        self._compile_statements(program.statements)
+        self._emit(OpCode.HALT)
+
+        return CodeObject('<programa>', self._instructions, self._constants, [])
+
+    def _compile(self, node: Optional[ast.ASTNode]) -> None:
+        compiler = self._compilers.get(type(node)) if node is not None else None
+
+        if compiler is None:
+            self._emit(OpCode.NONE)
+        else:
+            compiler(node)
+
+    def _compile_statements(self, statements: List[ast.Statement]) -> None:
+        if not statements:
+            self._emit(OpCode.NONE)
+
+            return
+
+        jumps: List[int] = []
+        for index, statement in enumerate(statements):
+            self._compile(statement)
+
+            if index < len(statements) - 1:
+                jumps.append(self._emit(OpCode.JUMP_IF_STOP))
+                self._emit(OpCode.POP)
+
+        for jump in jumps:
+            self._patch(jump)
+
+    def _compile_expression_statement(self, node: ast.ExpressionStatement) -> None:
+        self._compile(node.expression)
+
+    def _compile_integer(self, node: ast.Integer) -> None:
+        assert node.value is not None
+        self._emit(OpCode.CONSTANT, self._constant(new_integer(node.value), node.value))
+
+    def _compile_boolean(self, node: ast.Boolean) -> None:
+        self._emit(OpCode.TRUE if node.value else OpCode.FALSE)
+
+    def _compile_string(self, node: ast.StringLiteral) -> None:
+        self._emit(OpCode.CONSTANT, self._constant(String(node.value), node.value))
+
+    def _compile_identifier(self, node: ast.Identifier) -> None:
+        self._emit(OpCode.GET_NAME, self._constant(node.value, node.value))
+
+    def _compile_prefix(self, node: ast.Prefix) -> None:
+        self._compile(node.right)
+        self._emit(_PREFIX_OPCODES[node.operator])
+
+    def _compile_infix(self, node: ast.Infix) -> None:
+        self._compile(node.left)
+        self._compile(node.right)
+        self._emit(_INFIX_OPCODES[node.operator])
+
+    def _compile_block(self, node: ast.Block) -> None:
+        self._compile_statements(node.statements)
+
+    def _compile_if(self, node: ast.If) -> None:
+        self._compile(node.condition)
+        jump_to_alternative = self._emit(OpCode.JUMP_IF_FALSY)
+
+        self._compile(node.consequence)
+        jump_to_end = self._emit(OpCode.JUMP)
+
+        self._patch(jump_to_alternative)
+        if node.alternative is not None:
+            self._compile(node.alternative)
+        else:
+            self._emit(OpCode.NULL)
+
+        self._patch(jump_to_end)
+
+    def _compile_return(self, node: ast.ReturnStatement) -> None:
+        self._compile(node.return_value)
+        self._emit(OpCode.RETURN_VALUE)
+
+    def _compile_let(self, node: ast.LetStatement) -> None:
+        assert node.name is not None
+        self._compile(node.value)
+        self._emit(OpCode.SET_NAME, self._constant(node.name.value, node.name.value))
+
+    def _compile_function(self, node: ast.Function) -> None:
+        compiler = Compiler()
+
+        assert node.body is not None
+        compiler._compile(node.body)
+        compiler._emit(OpCode.LEAVE)
+
+        code = CodeObject('<procedimiento>',
+                          compiler._instructions,
+                          compiler._constants,
+                          [parameter.value for parameter in node.parameters],
+                          node)
+
+        self._constants.append(code)
+        self._emit(OpCode.FUNCTION, len(self._constants) - 1)
+
+    def _compile_call(self, node: ast.Call) -> None:
+        assert node.arguments is not None
+        self._compile(node.function)
+        for argument in node.arguments:
+            self._compile(argument)
+
+        self._emit(OpCode.CALL, len(node.arguments))
+
+    def _emit(self, opcode: OpCode, operand: int = 0) -> int:
+        self._instructions.append(opcode)
+        self._instructions.append(operand)
+
+        return len(self._instructions) - 2
+
+    def _patch(self, position: int) -> None:
+        self._instructions[position + 1] = len(self._instructions)
+
+    def _constant(self, value: Any, key: Any) -> int:
+        constant_key = (type(value), key)
+
+        try:
+            return self._constant_indexes[constant_key]
+        except KeyError:
+            self._constants.append(value)
+            self._constant_indexes[constant_key] = len(self._constants) - 1
+
+            return len(self._constants) - 1
+
+
+def compile_program(program: ast.Program) -> CodeObject:
+    return Compiler().compile_program(program)
+
+
+def disassemble(code: CodeObject) -> str:
+    out: List[str] = []
+    pending: List[CodeObject] = [code]
+
+    while pending:
+        current = pending.pop(0)
+        parameters = ', '.join(current.parameters)
+        out.append(f'== {current.name}({parameters}) ==' if current.node is not None else f'== {current.name} ==')
+
+        instructions = current.instructions
+        for position in range(0, len(instructions), 2):
+            opcode = OpCode(instructions[position])
+            line = f'{position:04d} {opcode.name}'
+
+            if opcode in _OPERAND_OPCODES:
+                operand = instructions[position + 1]
+                line = f'{line:<20} {operand}'
+
+                if opcode == OpCode.CONSTANT or opcode == OpCode.GET_NAME or opcode == OpCode.SET_NAME:
+                    line += f' ({_describe(current.constants[operand])})'
+                elif opcode == OpCode.FUNCTION:
+                    line += ' (<procedimiento>)'
+                    pending.append(current.constants[operand])
+
+            out.append(line)
+
+    return '\n'.join(out)
+
+
+def _describe(constant: Any) -> str:
+    if isinstance(constant, String):
+        return f'"{constant.value}"'
+    elif isinstance(constant, Object):
+        return constant.inspect()
+
+    return str(constant)
@@ -0,0 +1,50 @@
+from enum import Enum
+from typing import (
+    Callable,
+    Dict,
+    Optional,
+)
+
+import lpp.closures as closures
+import lpp.compiler as compiler
+from lpp.ast import Program
+from lpp.codegen import compile_python
+from lpp.evaluator import evaluate
+from lpp.iterative import evaluate_iterative
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.resolver import evaluate_resolved
+from lpp.tiering import Tiering
+from lpp.unwinding import evaluate_unwinding
+from lpp.vm import VirtualMachine
+
+
+class Engine(Enum):
+    TREE = 'arbol'
+    CLOSURES = 'cierres'
+    BYTECODE = 'bytecode'
+    PYTHON = 'python'
+    TIERED = 'niveles'
+    SLOTS = 'ranuras'
+    ITERATIVE = 'iterativo'
+    UNWINDING = 'excepciones'
+
+
+_ENGINES: Dict[Engine, Callable[[Program, Environment], Optional[Object]]] = {
+    Engine.TREE: evaluate,
+    Engine.CLOSURES: lambda program, env: closures.compile_program(program)(env),
+    Engine.BYTECODE: lambda program, env: VirtualMachine(compiler.compile_program(program), env).run(),
+    # El código generado corre en su propio espacio de nombres, no en env
+    Engine.PYTHON: lambda program, env: compile_python(program).run(),
+    Engine.TIERED: lambda program, env: Tiering().run(program, env),
+    # Los frames son listas con un lugar por variable, tampoco usa env
+    Engine.SLOTS: lambda program, env: evaluate_resolved(program),
+    Engine.ITERATIVE: evaluate_iterative,
+    Engine.UNWINDING: evaluate_unwinding,
+}
+
+
+def execute(program: Program, env: Environment, engine: Engine = Engine.TREE) -> Optional[Object]:
+    return _ENGINES[engine](program, env)
@@ -1,13 +1,17 @@
 from typing import (
+    Callable,
     cast,
+    Dict,
     List,
     Optional,
+    Tuple,
     Type,
     Any
 )
 
 import lpp.ast as ast
 from lpp.builtins import BUILTINS
+from lpp.capture import free_variables
 from lpp.object import (
     Boolean,
     Builtin,
@@ -15,6 +19,7 @@ from lpp.object import (
     Function,
     Environment,
     Integer,
+    new_integer,
     Null,
     Object,
     ObjectType,
@@ -28,132 +33,195 @@ FALSE = Boolean(False)
 NULL = Null()
 
 
-_NOT_A_FUNCTION = 'No es una funcion: {}'
-_TYPE_MISMATCH = 'Discrepancia de tipos: {} {} {}'
-_UNKNOW_PREFIX_OPERATION = 'Operador desconocido: {}{}'
-_UNKNOW_INFIX_OPERATION = 'Operador desconocido: {} {} {}'
-_UNKNOW_IDENTIFIER = 'Identificador no encontrado: {}'
+NOT_A_FUNCTION = 'No es una funcion: {}'
+TYPE_MISMATCH = 'Discrepancia de tipos: {} {} {}'
+UNKNOW_PREFIX_OPERATION = 'Operador desconocido: {}{}'
+UNKNOW_INFIX_OPERATION = 'Operador desconocido: {} {} {}'
+UNKNOW_IDENTIFIER = 'Identificador no encontrado: {}'
+
+InfixOperation = Callable[[Any, Any], Object]
+
+class TailCall(Object):
+    # Una llamada de un regresa que todavía no se hace. Solo viaja dentro de un Return
+    # hasta call_function o _evaluate_program, nunca llega a código de LPP
+    __slots__ = ('fn', 'args')
+
+    def __init__(self, fn: Object, args: List[Object]) -> None:
+        self.fn = fn
+        self.args = args
+
+    def type(self) -> ObjectType:
+        return ObjectType.RETURN
+
+    def inspect(self) -> str:
+        return f'llamada pendiente a {self.fn.inspect()}'
+
+
+# Si no es None, las llamadas a procedimientos pasan por aquí en lugar de evaluarse
+# directamente (ver lpp.tiering)
+call_hook: Optional[Callable[[Function, List[Object]], Object]] = None
 
 
 def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
-    node_type: Type = type(node)
+    try:
+        evaluator = _EVALUATORS[type(node)]
+    except KeyError:
+        return None
 
-    if node_type == ast.Program:
-        node = cast(ast.Program, node)
+    return evaluator(node, env)
 
-        return _evaluate_program(node, env)
-    elif node_type == ast.ExpressionStatement:
-        node = cast(ast.ExpressionStatement, node)
 
-        assert node.expression is not None
-        return evaluate(node.expression, env)
-    elif node_type == ast.Integer:
-        node = cast(ast.Integer, node)
+def _evaluate_expression_statement(node: ast.ExpressionStatement, env: Environment) -> Optional[Object]:
+    assert node.expression is not None
+    return evaluate(node.expression, env)
 
-        assert node.value is not None
-        return Integer(node.value)
-    elif node_type == ast.Boolean:
-        node = cast(ast.Boolean, node)
 
+def evaluate_integer(node: ast.Integer, env: Environment) -> Optional[Object]:
+    constant = node.cache
+    if constant is None:
+        # Nodos que no salieron del parser (p.ej. los que crea lpp.optimizer)
         assert node.value is not None
-        return _to_boolean_object(node.value)
-    elif node_type == ast.Prefix:
-        node = cast(ast.Prefix, node)
+        constant = node.cache = new_integer(node.value)
 
-        assert node.right is not None
-        right = evaluate(node.right, env)
+    return constant
 
-        assert right is not None
-        return _evaluate_prefix_expression(node.operator, right)
-    elif node_type == ast.Infix:
-        node = cast(ast.Infix, node)
 
-        assert node.left is not None and node.right is not None
-        left = evaluate(node.left, env)
-        right = evaluate(node.right, env)
+def evaluate_boolean(node: ast.Boolean, env: Environment) -> Optional[Object]:
+    assert node.value is not None
+    return to_boolean_object(node.value)
 
-        assert right is not None and left is not None
-        return _evaluate_infix_expression(node.operator, left, right)   
-    elif node_type == ast.Block:
-        node = cast(ast.Block, node)
 
-        return _evaluate_block_statement(node, env)
-    elif node_type == ast.If:
-        node = cast(ast.If, node)
+def _evaluate_prefix(node: ast.Prefix, env: Environment) -> Optional[Object]:
+    assert node.right is not None
+    right = evaluate(node.right, env)
 
-        return _evaluate_if_expression(node, env)
-    elif node_type == ast.ReturnStatement:
-        node = cast(ast.ReturnStatement, node)
+    assert right is not None
+    return evaluate_prefix_expression(node.operator, right)
 
-        assert node.return_value is not None
-        value = evaluate(node.return_value, env)
 
-        assert value is not None
-        return Return(value)
-    elif node_type == ast.LetStatement:
-        node = cast(ast.LetStatement, node)
+def _evaluate_infix(node: ast.Infix, env: Environment) -> Optional[Object]:
+    assert node.left is not None and node.right is not None
+    left = evaluate(node.left, env)
+    right = evaluate(node.right, env)
 
-        assert node.value is not None
-        value = evaluate(node.value, env)
+    # Casi siempre los operandos de un nodo tienen los mismos tipos que la vez
+    # anterior, así que la operación se busca en la tabla solo cuando cambian
+    operation = node.cache
+    if operation is not None and operation[0] is type(left) and operation[1] is type(right):
+        return operation[2](left, right)
+
+    assert right is not None and left is not None
+    operation = (type(left), type(right), infix_operation(node.operator, left, right))
+    node.cache = operation
+
+    return operation[2](left, right)
 
-        assert node.name is not None
-        env[node.name.value] = value
-    elif node_type == ast.Identifier:
-        node = cast(ast.Identifier, node)
 
-        return _evaluate_identifier(node, env)
-    elif node_type == ast.Function:
-        node = cast(ast.Function, node)
-        
-        assert node.body is not None
-        return Function(node.parameters,
-                        node.body,
-                        env)
-    elif node_type == ast.Call:
-        node = cast(ast.Call, node)
+def _evaluate_return_statement(node: ast.ReturnStatement, env: Environment) -> Optional[Object]:
+    assert node.return_value is not None
 
-        function = evaluate(node.function, env)
+    # Una llamada en posición de cola no se hace aquí: se regresa pendiente y
+    # call_function la hace en su propio ciclo, sin crecer la pila de Python
+    if type(node.return_value) == ast.Call:
+        call = cast(ast.Call, node.return_value)
+        function = evaluate(call.function, env)
 
-        assert node.arguments is not None
-        args = _evaluate_expression(node.arguments, env)
+        assert call.arguments is not None
+        args = _evaluate_expression(call.arguments, env)
 
         assert function is not None
-        return _apply_function(function, args)
-    elif node_type == ast.StringLiteral:
-        node = cast(ast.StringLiteral, node)
+        return Return(TailCall(function, args))
 
-        return String(node.value)
+    value = evaluate(node.return_value, env)
+
+    assert value is not None
+    return Return(value)
+
+
+def _evaluate_let_statement(node: ast.LetStatement, env: Environment) -> Optional[Object]:
+    assert node.value is not None
+    value = evaluate(node.value, env)
+
+    assert node.name is not None
+    env[node.name.value] = value
 
     return None
 
 
-def _apply_function(fn: Object, args: List[Object]) -> Object:
-    if type(fn) == Function:
+def evaluate_function(node: ast.Function, env: Environment) -> Optional[Object]:
+    assert node.body is not None
+    env.capture(free_variables(node))
+
+    return Function(node.parameters,
+                    node.body,
+                    env)
+
+
+def _evaluate_call(node: ast.Call, env: Environment) -> Optional[Object]:
+    function = evaluate(node.function, env)
+
+    assert node.arguments is not None
+    args = _evaluate_expression(node.arguments, env)
+
+    assert function is not None
+    return apply_function(function, args)
+
+
+def evaluate_string(node: ast.StringLiteral, env: Environment) -> Optional[Object]:
+    constant = node.cache
+    if constant is None:
+        constant = node.cache = String(node.value)
+
+    return constant
+
+
+def apply_function(fn: Object, args: List[Object]) -> Object:
+    # isinstance porque los motores compilados crean subclases de Function que pueden
+    # terminar llamándose desde aquí (p.ej. una closure que regresa un procedimiento)
+    if isinstance(fn, Function):
         fn = cast(Function, fn)
 
-        extended_environment = _extend_function_environment(fn, args)
-        evaluated = evaluate(fn.body, extended_environment)
+        if call_hook is not None:
+            return call_hook(fn, args)
 
-        assert evaluated is not None
-        return _unwrap_return_value(evaluated)
+        return call_function(fn, args)
     elif type(fn) == Builtin:
         fn = cast(Builtin, fn)
 
         return fn.fn(*args)
     else:
-        return _new_error(_NOT_A_FUNCTION, [fn.type().name])
+        return new_error(NOT_A_FUNCTION, [fn.type().name])
+
+
+def call_function(fn: Function, args: List[Object]) -> Object:
+    while True:
+        extended_environment = extend_function_environment(fn, args)
+        evaluated = evaluate(fn.body, extended_environment)
+        extended_environment.release()
+
+        assert evaluated is not None
+        result = unwrap_return_value(evaluated)
+
+        if type(result) != TailCall:
+            return result
+
+        tail_call = cast(TailCall, result)
+        if type(tail_call.fn) != Function:
+            return apply_function(tail_call.fn, tail_call.args)
 
+        fn, args = cast(Function, tail_call.fn), tail_call.args
 
-def _extend_function_environment(fn: Function, args: List[Object]) -> Environment:
+
+def extend_function_environment(fn: Function, args: List[Object]) -> Environment:
     env = Environment(outer=fn.env)
 
     for idx, param in enumerate(fn.parameters):
-        env[param.value] = args[idx - 1]
+        env[param.value] = args[idx]
     
     return env
 
 
-def _unwrap_return_value(obj: Object) -> Object:
+def unwrap_return_value(obj: Object) -> Object:
     if type(obj) == Return:
         obj = cast(Return, obj)
         return obj._value
@@ -169,6 +237,11 @@ def _evaluate_program(program: ast.Program, env: Environment) -> Optional[Object
 
         if type(result) == Return:
             result = cast(Return, result)
+
+            if type(result._value) == TailCall:
+                tail_call = cast(TailCall, result._value)
+                return apply_function(tail_call.fn, tail_call.args)
+
             return result._value
         elif type(result) == Error:
             return result
@@ -176,7 +249,7 @@ def _evaluate_program(program: ast.Program, env: Environment) -> Optional[Object
     return result
 
 
-def _evaluate_bang_operator_expression(right: Object) -> Object:
+def evaluate_bang_operator_expression(right: Object) -> Object:
     if right is TRUE:
         return FALSE
     elif right is FALSE:
@@ -211,12 +284,12 @@ def _evaluate_expression(expressions: List[ast.Expression], env: Environment) ->
     return result
 
 
-def _evaluate_identifier(node: ast.Identifier, env: Environment) -> Object:
+def evaluate_identifier(node: ast.Identifier, env: Environment) -> Object:
     try:
         return env[node.value]
     except KeyError:
         return BUILTINS.get(node.value,
-                            _new_error(_UNKNOW_IDENTIFIER, [node.value]))
+                            new_error(UNKNOW_IDENTIFIER, [node.value]))
 
 
 def _evaluate_if_expression(if_expression: ast.If, env: Environment) -> Optional[Object]:
@@ -224,7 +297,7 @@ def _evaluate_if_expression(if_expression: ast.If, env: Environment) -> Optional
     condition = evaluate(if_expression.condition, env)
 
     assert condition is not None
-    if _is_truthy(condition):
+    if is_truthy(condition):
         assert if_expression.consequence is not None
         return evaluate(if_expression.consequence, env)
     elif if_expression.alternative is not None:
@@ -233,7 +306,7 @@ def _evaluate_if_expression(if_expression: ast.If, env: Environment) -> Optional
         return NULL
 
 
-def _is_truthy(obj: Object) -> bool:
+def is_truthy(obj: Object) -> bool:
     if obj is NULL:
         return False
     elif obj is TRUE:
@@ -244,90 +317,95 @@ def _is_truthy(obj: Object) -> bool:
         return True
 
 
-def _evaluate_infix_expression(operator: str,
+def evaluate_infix_expression(operator: str,
                                 left: Object,
                                 right: Object) -> Object:
-    if left.type() == ObjectType.INTEGER \
-            and right.type() == ObjectType.INTEGER:
-        return _evaluate_integer_infix_expression(operator, left, right)
-    if left.type() == ObjectType.STRING \
-            and right.type() == ObjectType.STRING:
-        return _evaluate_string_infix_expression(operator, left, right)
-    elif operator == '==':
-        return _to_boolean_object(left is right)
+    return infix_operation(operator, left, right)(left, right)
+
+
+def infix_operation(operator: str, left: Object, right: Object) -> InfixOperation:
+    operation = INFIX_OPERATIONS.get((type(left), operator, type(right)))
+    if operation is not None:
+        return operation
+
+    # Para cualquier otra combinación el resultado solo depende de los tipos y del
+    # operador: identidad para == y != o un error
+    if operator == '==':
+        return _identical
     elif operator == '!=':
-        return _to_boolean_object(left is not right)
+        return _not_identical
     elif left.type() != right.type():
-        return _new_error(_TYPE_MISMATCH, [left.type().name, operator, right.type().name])
+        error = TYPE_MISMATCH
     else:
-        return _new_error(_UNKNOW_INFIX_OPERATION, [left.type().name, operator, right.type().name])
+        error = UNKNOW_INFIX_OPERATION
 
+    message = error.format(left.type().name, operator, right.type().name)
+    return lambda left, right: Error(message)
 
-def _evaluate_string_infix_expression(operator: str,
-                                    left: Object,
-                                    right: Object) -> Object:
-    left_value: str = cast(String, left).value
-    right_value: str = cast(String, right).value
 
-    if operator == '+':
-        return String(left_value + right_value)
-    elif operator == '==':
-        return _to_boolean_object(left_value == right_value)
-    elif operator == '!=':
-        return _to_boolean_object(left_value != right_value)
-    else:
-        return _new_error(_UNKNOW_INFIX_OPERATION, [left.type().name,
-                                                    operator,
-                                                    right.type().name])
+def _identical(left: Object, right: Object) -> Object:
+    return TRUE if left is right else FALSE
 
 
-def _evaluate_integer_infix_expression(operator: str,
-                                        left: Object,
-                                        right: Object) -> Object:
-    left_value: int = cast(Integer, left)._value
-    right_value: int = cast(Integer, right)._value
+def _not_identical(left: Object, right: Object) -> Object:
+    return FALSE if left is right else TRUE
 
-    if operator == '+':
-        return Integer(left_value + right_value)
-    elif operator == '-':
-        return Integer(left_value - right_value)
-    elif operator == '*':
-        return Integer(left_value * right_value)
-    elif operator == '/':
-        return Integer(left_value // right_value)
-    elif operator == '<':
-        return _to_boolean_object(left_value < right_value)
-    elif operator == '>':
-        return _to_boolean_object(left_value > right_value)
-    elif operator == '==':
-        return _to_boolean_object(left_value == right_value)
-    elif operator == '!=':
-        return _to_boolean_object(left_value != right_value)
-    else:
-        return _new_error(_UNKNOW_INFIX_OPERATION, [left.type().name, operator,right.type().name])
+
+# Operaciones por (tipo izquierdo, operador, tipo derecho)
+INFIX_OPERATIONS: Dict[Tuple[type, str, type], InfixOperation] = {
+    (Integer, '+', Integer): lambda left, right: new_integer(left._value + right._value),
+    (Integer, '-', Integer): lambda left, right: new_integer(left._value - right._value),
+    (Integer, '*', Integer): lambda left, right: new_integer(left._value * right._value),
+    (Integer, '/', Integer): lambda left, right: new_integer(left._value // right._value),
+    (Integer, '<', Integer): lambda left, right: TRUE if left._value < right._value else FALSE,
+    (Integer, '>', Integer): lambda left, right: TRUE if left._value > right._value else FALSE,
+    (Integer, '==', Integer): lambda left, right: TRUE if left._value == right._value else FALSE,
+    (Integer, '!=', Integer): lambda left, right: TRUE if left._value != right._value else FALSE,
+    (String, '+', String): lambda left, right: String(left.value + right.value),
+    (String, '==', String): lambda left, right: TRUE if left.value == right.value else FALSE,
+    (String, '!=', String): lambda left, right: TRUE if left.value != right.value else FALSE,
+}
 
 
-def _evaluate_minus_operator_expression(right: Object) -> Object:
+def evaluate_minus_operator_expression(right: Object) -> Object:
     if type(right) != Integer:
-        return _new_error(_UNKNOW_PREFIX_OPERATION, ['-', right.type().name])
+        return new_error(UNKNOW_PREFIX_OPERATION, ['-', right.type().name])
     
     right = cast(Integer, right)
 
-    return Integer(-right._value)
+    return new_integer(-right._value)
 
 
-def _evaluate_prefix_expression(operator: str, right: Object) -> Object:
+def evaluate_prefix_expression(operator: str, right: Object) -> Object:
     if operator == '!':
-        return _evaluate_bang_operator_expression(right)
+        return evaluate_bang_operator_expression(right)
     elif operator == '-':
-        return _evaluate_minus_operator_expression(right)
+        return evaluate_minus_operator_expression(right)
     else:
-        return _new_error(_UNKNOW_PREFIX_OPERATION, [operator, right.type().name])
+        return new_error(UNKNOW_PREFIX_OPERATION, [operator, right.type().name])
 
 
-def _new_error(message: str, args: List[Any]) -> Error:
+def new_error(message: str, args: List[Any]) -> Error:
     return Error(message.format(*args))
 
 
-def _to_boolean_object(value: bool) -> Boolean:
-    return TRUE if value else FALSE
\ No newline at end of file
+def to_boolean_object(value: bool) -> Boolean:
+    return TRUE if value else FALSE
+
+
+_EVALUATORS: Dict[Type[ast.ASTNode], Callable[[Any, Environment], Optional[Object]]] = {
+    ast.Program: _evaluate_program,
+    ast.ExpressionStatement: _evaluate_expression_statement,
+    ast.Integer: evaluate_integer,
+    ast.Boolean: evaluate_boolean,
+    ast.Prefix: _evaluate_prefix,
+    ast.Infix: _evaluate_infix,
+    ast.Block: _evaluate_block_statement,
+    ast.If: _evaluate_if_expression,
+    ast.ReturnStatement: _evaluate_return_statement,
+    ast.LetStatement: _evaluate_let_statement,
+    ast.Identifier: evaluate_identifier,
+    ast.Function: evaluate_function,
+    ast.Call: _evaluate_call,
+    ast.StringLiteral: evaluate_string,
+}
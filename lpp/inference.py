@@ -0,0 +1,457 @@
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import lpp.ast as ast
+from lpp.builtins import BUILTINS
+from lpp.evaluator import INFIX_OPERATIONS
+from lpp.object import (
+    Integer,
+    ObjectType,
+    String,
+)
+
+
+# Los tipos posibles de una expresión. Vacío mientras no se sabe nada (p.ej. el valor
+# de regresa de un procedimiento que todavía no se analiza)
+Types = FrozenSet[ObjectType]
+
+_NOTHING: Types = frozenset()
+_ANY: Types = frozenset(ObjectType)
+_INTEGER: Types = frozenset([ObjectType.INTEGER])
+_STRING: Types = frozenset([ObjectType.STRING])
+_BOOLEAN: Types = frozenset([ObjectType.BOOLEAN])
+_FUNCTION: Types = frozenset([ObjectType.FUNCTION])
+_NULL: Types = frozenset([ObjectType.NULL])
+_ERROR: Types = frozenset([ObjectType.ERROR])
+_RETURN: Types = frozenset([ObjectType.RETURN])
+
+_ARITHMETIC = {'+', '-', '*', '/'}
+_COMPARISONS = {'<', '>', '==', '!='}
+
+# Una pasada por iteración; cada tipo solo puede crecer así que el análisis siempre
+# termina, esto solo es un límite por si acaso
+_MAX_ITERATIONS: int = 50
+
+
+class InferenceReport(NamedTuple):
+    infix_nodes: int
+    integer_nodes: int
+    string_nodes: int
+    # Los de integer_nodes cuyos operandos son enteros sin importar el orden en que se
+    # ejecute el programa, ver is_integer
+    exact_nodes: int = 0
+
+    def share(self) -> float:
+        if self.infix_nodes == 0:
+            return 0.0
+
+        return (self.integer_nodes + self.string_nodes) / self.infix_nodes
+
+    def __str__(self) -> str:
+        return f'{self.integer_nodes + self.string_nodes} de {self.infix_nodes} operaciones especializadas ' \
+            f'({self.share():.0%}): {self.integer_nodes} entre enteros ({self.exact_nodes} sin revisar tipos), ' \
+            f'{self.string_nodes} entre cadenas'
+
+
+def infer_types(program: ast.Program) -> InferenceReport:
+    # Los Infix cuyos operandos siempre son enteros (o siempre cadenas) se anotan con
+    # su operación en node.cache, la misma caché que usa _evaluate_infix: el
+    # evaluador compara los tipos de los operandos con los de la anotación y llama la
+    # operación directamente. Si la inferencia se equivoca (p.ej. una variable que se
+    # lee antes de asignarse) los tipos no coinciden y se evalúa de forma genérica
+    inference = _Inference(program)
+
+    try:
+        inference.run()
+        inference.find_integer_parameters()
+    except RecursionError:
+        # Igual que lpp.optimizer, un árbol demasiado profundo se deja como está
+        return InferenceReport(0, 0, 0)
+
+    return inference.annotate()
+
+
+class _Inference:
+    # El análisis no distingue ámbitos ni el orden de las sentencias: el tipo de un
+    # nombre es la unión de todo lo que se le asigna en el programa, y los parámetros
+    # reciben la unión de los argumentos de todas las llamadas. Solo se conocen las
+    # llamadas a procedimientos asignados a un nombre que nunca se usa como valor (solo
+    # se llama); los parámetros de cualquier otro procedimiento pueden ser lo que sea
+
+    def __init__(self, program: ast.Program) -> None:
+        self._program = program
+
+        self._names: Dict[str, Types] = {}
+        self._returns: Dict[ast.Function, Types] = {}
+        self._operands: Dict[ast.Infix, Tuple[Types, Types]] = {}
+        self._known: Dict[str, List[ast.Function]] = {}
+        self._known_functions: Set[ast.Function] = set()
+        self._assigned: Set[str] = set()
+        self._changed = False
+
+        self._find_known_functions()
+
+    def run(self) -> None:
+        for _ in range(_MAX_ITERATIONS):
+            self._changed = False
+            self._statements(self._program.statements)
+
+            if not self._changed:
+                return
+
+        # Sin llegar a un punto fijo no se puede confiar en nada
+        self._names = {name: _ANY for name in self._names}
+        self._returns = {function: _ANY for function in self._returns}
+
+    def find_integer_parameters(self) -> None:
+        # A diferencia de run, aquí sí importan los ámbitos. Un identificador dentro de
+        # un procedimiento que tiene un parámetro con ese nombre siempre lo encuentra en
+        # el ambiente (nada lo asigna antes ni lo borra), así que si todas las llamadas
+        # pasan un entero en esa posición el identificador siempre es un entero. Se
+        # empieza suponiendo que lo son todos los candidatos y se descartan los que
+        # reciben algo que no se puede demostrar, hasta que ya no cambia nada
+        bindings: Dict[Tuple[ast.Function, str], List[ast.Identifier]] = {}
+        assigned: Dict[ast.Function, Set[str]] = {}
+        calls: Dict[str, List[ast.Call]] = {}
+
+        pending: List[Tuple[Any, Tuple[ast.Function, ...]]] = [(self._program, ())]
+        while pending:
+            node, scopes = pending.pop()
+            node_type = type(node)
+
+            if node_type == list:
+                pending.extend((item, scopes) for item in node)
+            elif node is None:
+                continue
+            elif node_type == ast.Identifier:
+                for function in reversed(scopes):
+                    if any(parameter.value == node.value for parameter in function.parameters):
+                        bindings.setdefault((function, node.value), []).append(node)
+                        break
+            elif node_type == ast.Function:
+                assigned.setdefault(node, set())
+                pending.append((node.body, scopes + (node,)))
+            elif node_type == ast.LetStatement:
+                # Una variable con el nombre del parámetro lo reemplaza en el ambiente
+                for function in scopes:
+                    assigned[function].add(node.name.value)
+                pending.append((node.value, scopes))
+            else:
+                if node_type == ast.Call and type(node.function) == ast.Identifier \
+                        and node.function.value in self._known:
+                    calls.setdefault(node.function.value, []).append(node)
+
+                for child in _CHILDREN.get(node_type, ()):
+                    pending.append((getattr(node, child), scopes))
+
+        callers: Dict[ast.Function, List[ast.Call]] = {}
+        for name, functions in self._known.items():
+            for function in functions:
+                callers.setdefault(function, []).extend(calls.get(name, []))
+
+        candidates: Dict[Tuple[ast.Function, str], int] = {}
+        for function, name in bindings:
+            names = [parameter.value for parameter in function.parameters]
+            if function in self._known_functions and names.count(name) == 1 and name not in assigned[function]:
+                candidates[(function, name)] = names.index(name)
+
+                for identifier in bindings[(function, name)]:
+                    identifier.cache = Integer
+
+        changed = True
+        while changed:
+            changed = False
+
+            for (function, name), index in list(candidates.items()):
+                if all(len(call.arguments) > index and is_integer(call.arguments[index])  # type: ignore
+                       for call in callers.get(function, [])):
+                    continue
+
+                del candidates[(function, name)]
+                for identifier in bindings[(function, name)]:
+                    identifier.cache = None
+                changed = True
+
+    def annotate(self) -> InferenceReport:
+        infix_nodes = integer_nodes = string_nodes = exact_nodes = 0
+
+        for node in _walk(self._program):
+            if type(node) != ast.Infix:
+                continue
+
+            assert isinstance(node, ast.Infix)
+            infix_nodes += 1
+
+            # Los tipos de la última pasada, en la que ya nada cambió
+            left, right = self._operands.get(node, (_ANY, _ANY))
+            if left == _INTEGER and right == _INTEGER:
+                node.cache = (Integer, Integer, INFIX_OPERATIONS[(Integer, node.operator, Integer)])
+                integer_nodes += 1
+
+                if is_integer(node.left) and is_integer(node.right):
+                    exact_nodes += 1
+            elif left == _STRING and right == _STRING and (String, node.operator, String) in INFIX_OPERATIONS:
+                node.cache = (String, String, INFIX_OPERATIONS[(String, node.operator, String)])
+                string_nodes += 1
+
+        return InferenceReport(infix_nodes, integer_nodes, string_nodes, exact_nodes)
+
+    def _find_known_functions(self) -> None:
+        assigned: Dict[str, List[Optional[ast.Expression]]] = {}
+        parameters: Set[str] = set()
+        # Identificadores que no son un valor: el nombre de una variable y la función
+        # de una llamada
+        not_values: Set[ast.Identifier] = set()
+
+        nodes = _walk(self._program)
+        for node in nodes:
+            if type(node) == ast.LetStatement:
+                assert isinstance(node, ast.LetStatement) and node.name is not None
+                assigned.setdefault(node.name.value, []).append(node.value)
+                not_values.add(node.name)
+            elif type(node) == ast.Function:
+                assert isinstance(node, ast.Function)
+                parameters.update(parameter.value for parameter in node.parameters)
+                not_values.update(node.parameters)
+            elif type(node) == ast.Call and type(node.function) == ast.Identifier:  # type: ignore
+                not_values.add(node.function)  # type: ignore
+
+        escaping = {node.value for node in nodes if type(node) == ast.Identifier and node not in not_values}  # type: ignore
+
+        self._assigned = set(assigned) | parameters
+
+        for name, values in assigned.items():
+            if name not in parameters and name not in escaping \
+                    and all(type(value) == ast.Function for value in values):
+                self._known[name] = values  # type: ignore
+                self._known_functions.update(values)  # type: ignore
+
+    def _join(self, name: str, types: Types) -> None:
+        current = self._names.get(name, _NOTHING)
+
+        if not types <= current:
+            self._names[name] = current | types
+            self._changed = True
+
+    def _statements(self, statements: List[ast.Statement]) -> Types:
+        # Regresa el tipo del valor del bloque; un error en cualquier sentencia también
+        # puede ser el valor porque detiene el bloque
+        value: Types = _NOTHING
+        stops: Types = _NOTHING
+
+        for statement in statements:
+            value = self._statement(statement)
+
+            if ObjectType.ERROR in value:
+                stops = stops | _ERROR
+            if ObjectType.RETURN in value:
+                stops = stops | _RETURN
+
+        return value | stops
+
+    def _statement(self, statement: ast.Statement) -> Types:
+        if type(statement) == ast.LetStatement:
+            assert isinstance(statement, ast.LetStatement) and statement.name is not None
+            self._join(statement.name.value, self._type(statement.value))
+
+            # Evalúa a None, que para el análisis es tan distinto de un entero como nulo
+            return _NULL
+        elif type(statement) == ast.ReturnStatement:
+            assert isinstance(statement, ast.ReturnStatement)
+            self._type(statement.return_value)
+
+            return _RETURN
+        elif type(statement) == ast.ExpressionStatement:
+            assert isinstance(statement, ast.ExpressionStatement)
+            return self._type(statement.expression)
+
+        return _ANY
+
+    def _type(self, expression: Optional[ast.Expression]) -> Types:
+        expression_type = type(expression)
+
+        if expression_type == ast.Integer:
+            return _INTEGER
+        elif expression_type == ast.Boolean:
+            return _BOOLEAN
+        elif expression_type == ast.StringLiteral:
+            return _STRING
+        elif expression_type == ast.Identifier:
+            assert isinstance(expression, ast.Identifier)
+            if expression.value in self._assigned:
+                # Un Return guardado en una variable (variable x = si (c) { regresa 1 })
+                # puede detener un bloque con cualquier valor
+                types = self._names.get(expression.value, _NOTHING)
+                return _ANY if ObjectType.RETURN in types else types
+
+            return frozenset([ObjectType.BUILTIN]) if expression.value in BUILTINS else _ERROR
+        elif expression_type == ast.Prefix:
+            assert isinstance(expression, ast.Prefix)
+            return self._prefix(expression.operator, self._type(expression.right))
+        elif expression_type == ast.Infix:
+            assert isinstance(expression, ast.Infix)
+            left, right = self._type(expression.left), self._type(expression.right)
+            self._operands[expression] = (left, right)
+
+            return self._infix(expression.operator, left, right)
+        elif expression_type == ast.If:
+            assert isinstance(expression, ast.If) and expression.consequence is not None
+            self._type(expression.condition)
+
+            consequence = self._statements(expression.consequence.statements)
+            alternative = self._statements(expression.alternative.statements) \
+                if expression.alternative is not None else _NULL
+
+            return consequence | alternative
+        elif expression_type == ast.Function:
+            assert isinstance(expression, ast.Function)
+            self._function(expression)
+
+            return _FUNCTION
+        elif expression_type == ast.Call:
+            assert isinstance(expression, ast.Call)
+            return self._call(expression)
+
+        return _ANY
+
+    def _prefix(self, operator: str, right: Types) -> Types:
+        if operator == '!':
+            return _BOOLEAN if right else _NOTHING
+
+        result = _NOTHING
+        if ObjectType.INTEGER in right:
+            result = result | _INTEGER
+        if right - _INTEGER:
+            result = result | _ERROR
+
+        return result
+
+    def _infix(self, operator: str, left: Types, right: Types) -> Types:
+        result = _NOTHING
+
+        for left_type in left:
+            for right_type in right:
+                if left_type == ObjectType.INTEGER and right_type == ObjectType.INTEGER:
+                    result = result | (_INTEGER if operator in _ARITHMETIC else _BOOLEAN)
+                elif left_type == ObjectType.STRING and right_type == ObjectType.STRING:
+                    if operator == '+':
+                        result = result | _STRING
+                    elif operator in ('==', '!='):
+                        result = result | _BOOLEAN
+                    else:
+                        result = result | _ERROR
+                elif operator in ('==', '!='):
+                    result = result | _BOOLEAN
+                else:
+                    result = result | _ERROR
+
+        return result
+
+    def _function(self, function: ast.Function) -> None:
+        assert function.body is not None
+        if function not in self._known_functions:
+            for parameter in function.parameters:
+                self._join(parameter.value, _ANY)
+
+        # Lo que regresa una llamada: el valor del cuerpo y los valores de regresa
+        returned = self._statements(function.body.statements) - _RETURN
+        for statement in _returns(function.body.statements):
+            returned = returned | self._type(statement.return_value)
+
+        current = self._returns.get(function, _NOTHING)
+        if not returned <= current:
+            self._returns[function] = current | returned
+            self._changed = True
+
+    def _call(self, call: ast.Call) -> Types:
+        assert call.arguments is not None
+        arguments = [self._type(argument) for argument in call.arguments]
+
+        if type(call.function) != ast.Identifier:
+            self._type(call.function)
+
+            return _ANY
+
+        name = call.function.value  # type: ignore
+        if name in self._known:
+            result = _NOTHING
+            for function in self._known[name]:
+                for parameter, argument in zip(function.parameters, arguments):
+                    self._join(parameter.value, argument)
+
+                result = result | self._returns.get(function, _NOTHING)
+
+            return result
+        elif name not in self._assigned and name in BUILTINS:
+            return _INTEGER | _ERROR
+
+        return _ANY
+
+
+def is_integer(expression: Optional[ast.Expression]) -> bool:
+    # Si el valor de la expresión siempre es un entero: las literales, los parámetros
+    # que marcó find_integer_parameters y la aritmética entre ellos
+    if isinstance(expression, ast.Integer):
+        return True
+    elif isinstance(expression, ast.Identifier):
+        return expression.cache is Integer
+    elif isinstance(expression, ast.Prefix):
+        return expression.operator == '-' and is_integer(expression.right)
+    elif isinstance(expression, ast.Infix):
+        return expression.operator in _ARITHMETIC and is_integer(expression.left) and is_integer(expression.right)
+
+    return False
+
+
+def _returns(statements: List[ast.Statement]) -> List[ast.ReturnStatement]:
+    # Los regresa de un cuerpo, sin entrar a los procedimientos anidados
+    found: List[ast.ReturnStatement] = []
+
+    for node in _walk(statements, functions=False):
+        if type(node) == ast.ReturnStatement:
+            found.append(node)  # type: ignore
+
+    return found
+
+
+def _walk(root: Any, functions: bool = True) -> List[ast.ASTNode]:
+    nodes: List[ast.ASTNode] = []
+    pending: List[object] = [root]
+
+    while pending:
+        node = pending.pop()
+
+        if type(node) == list:
+            pending.extend(reversed(node))  # type: ignore
+        elif node is not None:
+            nodes.append(node)  # type: ignore
+
+            if type(node) == ast.Function and not functions:
+                continue
+
+            for child in _CHILDREN.get(type(node), ()):
+                pending.append(getattr(node, child))
+
+    return nodes
+
+
+_CHILDREN: Dict[type, Tuple[str, ...]] = {
+    ast.Program: ('statements',),
+    ast.LetStatement: ('value', 'name'),
+    ast.ReturnStatement: ('return_value',),
+    ast.ExpressionStatement: ('expression',),
+    ast.Prefix: ('right',),
+    ast.Infix: ('right', 'left'),
+    ast.Block: ('statements',),
+    ast.If: ('alternative', 'consequence', 'condition'),
+    ast.Function: ('body', 'parameters'),
+    ast.Call: ('arguments', 'function'),
+}
@@ -0,0 +1,250 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import lpp.ast as ast
+from lpp.evaluator import (
+    apply_function,
+    evaluate_boolean,
+    evaluate_function,
+    evaluate_identifier,
+    evaluate_infix_expression,
+    evaluate_integer,
+    evaluate_prefix_expression,
+    evaluate_string,
+    extend_function_environment,
+    is_truthy,
+    new_error,
+    unwrap_return_value,
+    NULL,
+)
+from lpp.object import (
+    Environment,
+    Error,
+    Function,
+    Object,
+    ObjectType,
+    Return,
+)
+
+
+DEFAULT_MAX_DEPTH: int = 100000
+
+_MAX_DEPTH_EXCEEDED = 'Profundidad máxima de llamadas excedida: {}'
+
+# Cada tarea es el paso que sigue, su argumento y el ambiente en el que corre
+Task = Tuple[Callable[[Any, Environment], None], Any, Environment]
+
+
+class IterativeEvaluator:
+    # Da los mismos resultados que lpp.evaluator.evaluate pero sin recursión de Python:
+    # lo que falta por hacer vive en una pila de tareas y los resultados parciales en
+    # una pila de valores, así que la profundidad de LPP solo depende de la memoria.
+    # Más de max_depth llamadas anidadas detienen el programa con un Error
+
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH) -> None:
+        self.max_depth = max_depth
+
+        self._tasks: List[Task] = []
+        self._values: List[Optional[Object]] = []
+        self._depth: int = 0
+        self._error: Optional[Error] = None
+
+        self._evaluators: Dict[Type[ast.ASTNode], Callable[[Any, Environment], None]] = {
+            ast.Program: self._evaluate_program,
+            ast.ExpressionStatement: self._evaluate_expression_statement,
+            ast.Integer: self._evaluate_leaf(evaluate_integer),
+            ast.Boolean: self._evaluate_leaf(evaluate_boolean),
+            ast.Prefix: self._evaluate_prefix,
+            ast.Infix: self._evaluate_infix,
+            ast.Block: self._evaluate_block,
+            ast.If: self._evaluate_if,
+            ast.ReturnStatement: self._evaluate_return,
+            ast.LetStatement: self._evaluate_let,
+            ast.Identifier: self._evaluate_leaf(evaluate_identifier),
+            ast.Function: self._evaluate_leaf(evaluate_function),
+            ast.Call: self._evaluate_call,
+            ast.StringLiteral: self._evaluate_leaf(evaluate_string),
+        }
+
+    def run(self, node: ast.ASTNode, env: Environment) -> Optional[Object]:
+        self._tasks = [(self._evaluate, node, env)]
+        self._values = []
+        self._depth = 0
+        self._error = None
+
+        tasks = self._tasks
+        while tasks:
+            step, argument, task_env = tasks.pop()
+            step(argument, task_env)
+
+        if self._error is not None:
+            return self._error
+
+        assert len(self._values) == 1
+        return self._values.pop()
+
+    def _evaluate(self, node: ast.ASTNode, env: Environment) -> None:
+        evaluator = self._evaluators.get(type(node))
+
+        if evaluator is None:
+            self._values.append(None)
+        else:
+            evaluator(node, env)
+
+    def _evaluate_leaf(self,
+                       evaluator: Callable[[Any, Environment], Optional[Object]]) -> Callable[[Any, Environment], None]:
+        # Los nodos sin hijos que evaluar se evalúan igual que en el evaluador recursivo
+        def evaluate_leaf(node: ast.ASTNode, env: Environment) -> None:
+            self._values.append(evaluator(node, env))
+
+        return evaluate_leaf
+
+    def _evaluate_program(self, program: ast.Program, env: Environment) -> None:
+        self._tasks.append((self._finish_program, None, env))
+        self._start_sequence(program.statements, env)
+
+    def _finish_program(self, _: None, env: Environment) -> None:
+        result = self._values[-1]
+
+        if type(result) == Return:
+            self._values[-1] = result._value  # type: ignore
+
+    def _evaluate_block(self, block: ast.Block, env: Environment) -> None:
+        self._start_sequence(block.statements, env)
+
+    def _start_sequence(self, statements: List[ast.Statement], env: Environment) -> None:
+        self._values.append(None)
+        self._tasks.append((self._continue_sequence, (statements, 0), env))
+
+    def _continue_sequence(self, position: Tuple[List[ast.Statement], int], env: Environment) -> None:
+        statements, index = position
+
+        # El valor de arriba es el resultado de la sentencia anterior
+        result = self._values[-1]
+        if result is not None and (result.type() == ObjectType.RETURN or result.type() == ObjectType.ERROR):
+            return
+        elif index == len(statements):
+            return
+
+        self._values.pop()
+        self._tasks.append((self._continue_sequence, (statements, index + 1), env))
+        self._tasks.append((self._evaluate, statements[index], env))
+
+    def _evaluate_expression_statement(self, node: ast.ExpressionStatement, env: Environment) -> None:
+        assert node.expression is not None
+        self._tasks.append((self._evaluate, node.expression, env))
+
+    def _evaluate_prefix(self, node: ast.Prefix, env: Environment) -> None:
+        assert node.right is not None
+        self._tasks.append((self._apply_prefix, node.operator, env))
+        self._tasks.append((self._evaluate, node.right, env))
+
+    def _apply_prefix(self, operator: str, env: Environment) -> None:
+        right = self._values.pop()
+
+        assert right is not None
+        self._values.append(evaluate_prefix_expression(operator, right))
+
+    def _evaluate_infix(self, node: ast.Infix, env: Environment) -> None:
+        assert node.left is not None and node.right is not None
+        self._tasks.append((self._apply_infix, node.operator, env))
+        self._tasks.append((self._evaluate, node.right, env))
+        self._tasks.append((self._evaluate, node.left, env))
+
+    def _apply_infix(self, operator: str, env: Environment) -> None:
+        right = self._values.pop()
+        left = self._values.pop()
+
+        assert left is not None and right is not None
+        self._values.append(evaluate_infix_expression(operator, left, right))
+
+    def _evaluate_if(self, node: ast.If, env: Environment) -> None:
+        assert node.condition is not None
+        self._tasks.append((self._branch, node, env))
+        self._tasks.append((self._evaluate, node.condition, env))
+
+    def _branch(self, node: ast.If, env: Environment) -> None:
+        condition = self._values.pop()
+
+        assert condition is not None
+        if is_truthy(condition):
+            assert node.consequence is not None
+            self._tasks.append((self._evaluate, node.consequence, env))
+        elif node.alternative is not None:
+            self._tasks.append((self._evaluate, node.alternative, env))
+        else:
+            self._values.append(NULL)
+
+    def _evaluate_return(self, node: ast.ReturnStatement, env: Environment) -> None:
+        assert node.return_value is not None
+        self._tasks.append((self._wrap_return, None, env))
+        self._tasks.append((self._evaluate, node.return_value, env))
+
+    def _wrap_return(self, _: None, env: Environment) -> None:
+        value = self._values.pop()
+
+        assert value is not None
+        self._values.append(Return(value))
+
+    def _evaluate_let(self, node: ast.LetStatement, env: Environment) -> None:
+        assert node.name is not None and node.value is not None
+        self._tasks.append((self._bind, node.name.value, env))
+        self._tasks.append((self._evaluate, node.value, env))
+
+    def _bind(self, name: str, env: Environment) -> None:
+        env[name] = self._values.pop()
+        self._values.append(None)
+
+    def _evaluate_call(self, node: ast.Call, env: Environment) -> None:
+        assert node.arguments is not None
+        self._tasks.append((self._call, len(node.arguments), env))
+
+        # Primero la función y después los argumentos de izquierda a derecha
+        for argument in reversed(node.arguments):
+            self._tasks.append((self._evaluate, argument, env))
+        self._tasks.append((self._evaluate, node.function, env))
+
+    def _call(self, count: int, env: Environment) -> None:
+        args: List[Object] = self._values[len(self._values) - count:]  # type: ignore
+        del self._values[len(self._values) - count:]
+
+        function = self._values.pop()
+
+        assert function is not None
+        if type(function) != Function:
+            # Builtins y procedimientos de otros motores se llaman directamente
+            self._values.append(apply_function(function, args))
+            return
+
+        if self._depth >= self.max_depth:
+            # No hay forma de seguir sin perder la pila de LPP, el programa termina
+            self._error = new_error(_MAX_DEPTH_EXCEEDED, [self.max_depth])
+            del self._tasks[:]
+            return
+
+        self._depth += 1
+        extended_environment = extend_function_environment(function, args)  # type: ignore
+
+        self._tasks.append((self._leave, extended_environment, env))
+        self._tasks.append((self._evaluate, function.body, extended_environment))  # type: ignore
+
+    def _leave(self, extended_environment: Environment, env: Environment) -> None:
+        self._depth -= 1
+        extended_environment.release()
+
+        result = self._values[-1]
+        assert result is not None
+        self._values[-1] = unwrap_return_value(result)
+
+
+def evaluate_iterative(node: ast.ASTNode,
+                       env: Environment,
+                       max_depth: int = DEFAULT_MAX_DEPTH) -> Optional[Object]:
+    return IterativeEvaluator(max_depth).run(node, env)
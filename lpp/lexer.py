@@ -1,23 +1,308 @@
-from re import match
+from array import array
+from codecs import getincrementaldecoder
+from concurrent.futures import ProcessPoolExecutor
+from mmap import mmap
+from os import cpu_count
+from re import (
+    compile,
+    DOTALL,
+    escape,
+    match,
+    Match,
+    Pattern,
+)
+from sys import stdin
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
 
 from lpp.token import (
+    KEYWORDS,
     Token,
+    TokenBuffer,
     TokenType,
     lookup_token_type
 )
 
 
+_LETTER = r'a-záéíóúA-ZÁÉÍÚÓñÑ_'
+
+# Los operadores de dos caracteres van primero para que '==' no se lea como dos '='
+_OPERATORS: Dict[str, TokenType] = {
+    '==': TokenType.EQ,
+    '!=': TokenType.NOT_EQ,
+    '=': TokenType.ASSIGN,
+    '+': TokenType.PLUS,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+    '<': TokenType.LT,
+    '>': TokenType.GT,
+    '-': TokenType.MINUS,
+    '/': TokenType.DIVISION,
+    '*': TokenType.MULTIPLICATION,
+    '!': TokenType.NEGATION,
+}
+
+# Cada alternativa del patrón maestro es un grupo y el índice del grupo que hace
+# match (lastindex) nos dice directamente el tipo de token, sin recorrer una
+# cadena de ifs por cada caracter
+_TOKEN_GROUPS: List[Tuple[TokenType, str]] = [
+    *[(token_type, f'({keyword})(?![{_LETTER}\\d])') for keyword, token_type in KEYWORDS.items()],
+    (TokenType.IDENT, f'([{_LETTER}][{_LETTER}\\d]*)'),
+    (TokenType.INT, r'(\d+)'),
+    (TokenType.STRING, r'"([^"]*)"?'),
+    *[(token_type, f'({escape(operator)})') for operator, token_type in _OPERATORS.items()],
+    (TokenType.EOF, r'(\Z)'),
+    (TokenType.ILLEGAL, r'(.)'),
+]
+
+# Las palabras reservadas y los operadores siempre tienen la misma literal, así
+# que se reutiliza el mismo string en lugar de recortarlo de la fuente
+_FIXED_LITERALS: Dict[TokenType, str] = {
+    **{token_type: keyword for keyword, token_type in KEYWORDS.items()},
+    **{token_type: operator for operator, token_type in _OPERATORS.items()},
+    TokenType.EOF: '',
+}
+
+TOKEN_PATTERN: Pattern = compile(
+    r'\s*(?:' + '|'.join(pattern for _, pattern in _TOKEN_GROUPS) + ')',
+    DOTALL
+)
+
+# El grupo 0 es el match completo, por eso las tablas empiezan con un hueco
+GROUP_TOKEN_TYPES: List[TokenType] = [TokenType.ILLEGAL] + [token_type for token_type, _ in _TOKEN_GROUPS]
+GROUP_LITERALS: List[Optional[str]] = [None]
+GROUP_LITERALS.extend(_FIXED_LITERALS.get(token_type) for token_type, _ in _TOKEN_GROUPS)
+
+_IDENT_GROUP: int = GROUP_TOKEN_TYPES.index(TokenType.IDENT)
+
+
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+
+# Tabla de identificadores internados: cada nombre se guarda una sola vez y todas
+# sus apariciones comparten el mismo objeto str. Se puede compartir entre varios
+# Lexer (p.ej. durante toda una sesión del REPL)
+IdentifierTable = Dict[str, str]
+
+
 class Lexer:
-    def __init__(self, source: str) -> None:
+    def __init__(self,
+                source: str,
+                chunks: Optional[Iterator[str]] = None,
+                identifiers: Optional[IdentifierTable] = None) -> None:
         self._source: str = source
+        self._position: int = 0
+        self._token_start: int = 0
+        # Posición absoluta en la fuente del inicio de self._source cuando se lee por pedazos
+        self._offset: int = 0
+        self._chunks = chunks
+        self._identifiers: IdentifierTable = identifiers if identifiers is not None else {}
+
+    @classmethod
+    def from_file(cls,
+                file: TextIO,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                identifiers: Optional[IdentifierTable] = None) -> 'Lexer':
+        return cls('', chunks=_read_text_chunks(file, chunk_size), identifiers=identifiers)
+
+    @classmethod
+    def from_stdin(cls,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                identifiers: Optional[IdentifierTable] = None) -> 'Lexer':
+        return cls.from_file(stdin, chunk_size, identifiers)
+
+    @classmethod
+    def from_mmap(cls,
+                buffer: mmap,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                identifiers: Optional[IdentifierTable] = None) -> 'Lexer':
+        return cls('', chunks=_read_mmap_chunks(buffer, chunk_size), identifiers=identifiers)
+
+    @property
+    def interned_identifiers(self) -> int:
+        return len(self._identifiers)
+
+    # Posición en la fuente del último token que regresó next_token
+    @property
+    def token_start(self) -> int:
+        return self._token_start
+
+    def next_token(self) -> Token:
+        token_match = TOKEN_PATTERN.match(self._source, self._position)
+        assert token_match is not None
+
+        # Si el token toca el final del pedazo actual puede continuar en el siguiente
+        # (un identificador, un string, un '=' que en realidad es '=='...)
+        if self._chunks is not None and token_match.end() == len(self._source):
+            token_match = self._read_chunks()
+
+        group = token_match.lastindex
+        assert group is not None
+
+        self._position = token_match.end()
+        self._token_start = self._offset + token_match.start(group)
+
+        literal = GROUP_LITERALS[group]
+        if literal is None:
+            literal = token_match.group(group)
+
+            if group == _IDENT_GROUP:
+                literal = self._identifiers.setdefault(literal, literal)
+
+        return Token(GROUP_TOKEN_TYPES[group], literal)
+
+    def _read_chunks(self) -> Match:
+        assert self._chunks is not None
+
+        # Descartamos lo que ya se tokenizó para no guardar una segunda copia de la fuente
+        self._offset += self._position
+        self._source = self._source[self._position:]
+        self._position = 0
+
+        for chunk in self._chunks:
+            self._source += chunk
+
+            token_match = TOKEN_PATTERN.match(self._source)
+            assert token_match is not None
+            if token_match.end() < len(self._source):
+                return token_match
+
+        self._chunks = None
+
+        token_match = TOKEN_PATTERN.match(self._source)
+        assert token_match is not None
+
+        return token_match
+
+
+TokenSpans = Tuple['array[int]', 'array[int]', 'array[int]']
+
+
+def tokenize(source: str, identifiers: Optional[IdentifierTable] = None) -> TokenBuffer:
+    token_types, starts, ends = _tokenize_spans(source, 0)
+
+    return TokenBuffer(source, token_types, starts, ends, identifiers)
+
+
+def lex_parallel(source: str,
+                workers: Optional[int] = None,
+                identifiers: Optional[IdentifierTable] = None) -> TokenBuffer:
+    workers = workers or cpu_count() or 1
+    if workers == 1:
+        return tokenize(source, identifiers)
+
+    # Más pedazos que procesos para repartir mejor el trabajo
+    chunks = _split_source(source, workers * 4)
+
+    token_types: 'array[int]' = array('B')
+    starts: 'array[int]' = array('I')
+    ends: 'array[int]' = array('I')
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        offsets = [offset for offset, _ in chunks]
+        sources = [chunk for _, chunk in chunks]
+
+        for chunk_types, chunk_starts, chunk_ends in executor.map(_tokenize_spans, sources, offsets):
+            # Cada pedazo termina con su propio EOF, solo nos quedamos con el del último
+            token_types.extend(chunk_types[:-1])
+            starts.extend(chunk_starts[:-1])
+            ends.extend(chunk_ends[:-1])
+
+    token_types.append(TokenType.EOF.value)
+    starts.append(len(source))
+    ends.append(len(source))
+
+    return TokenBuffer(source, token_types, starts, ends, identifiers)
+
+
+def _split_source(source: str, count: int) -> List[Tuple[int, str]]:
+    chunks: List[Tuple[int, str]] = []
+    chunk_size = max(len(source) // count, 1)
+
+    start = 0
+    while start < len(source):
+        end = source.find('\n', start + chunk_size)
+
+        # Solo se puede cortar en un salto de línea que no esté dentro de un string,
+        # es decir, cuando desde el inicio del pedazo hay un número par de comillas
+        quotes = source.count('"', start, end) if end != -1 else 0
+        while end != -1 and quotes % 2 == 1:
+            next_end = source.find('\n', end + 1)
+            quotes += source.count('"', end, next_end if next_end != -1 else len(source))
+            end = next_end
+
+        end = len(source) if end == -1 else end + 1
+        chunks.append((start, source[start:end]))
+        start = end
+
+    return chunks
+
+
+def _tokenize_spans(source: str, offset: int) -> TokenSpans:
+    token_types: 'array[int]' = array('B')
+    starts: 'array[int]' = array('I')
+    ends: 'array[int]' = array('I')
+
+    group_values: List[int] = [token_type.value for token_type in GROUP_TOKEN_TYPES]
+    eof: int = TokenType.EOF.value
+
+    # Solo se guardan los rangos de cada literal, nunca se recorta la fuente
+    for token_match in TOKEN_PATTERN.finditer(source):
+        group = token_match.lastindex
+        assert group is not None
+
+        start, end = token_match.span(group)
+        token_types.append(group_values[group])
+        starts.append(start + offset)
+        ends.append(end + offset)
+
+        if group_values[group] == eof:
+            break
+
+    return token_types, starts, ends
+
+
+def _read_text_chunks(file: TextIO, chunk_size: int) -> Iterator[str]:
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+def _read_mmap_chunks(buffer: mmap, chunk_size: int) -> Iterator[str]:
+    # El decodificador incremental se encarga de los caracteres UTF-8 que quedan
+    # partidos entre dos pedazos
+    decoder = getincrementaldecoder('utf-8')()
+
+    for start in range(0, len(buffer), chunk_size):
+        if chunk := decoder.decode(buffer[start:start + chunk_size]):
+            yield chunk
+
+    if chunk := decoder.decode(b'', final=True):
+        yield chunk
+
+
+# Implementación original caracter por caracter. Se conserva para poder comparar
+# (pruebas diferenciales y benchmarks) contra el Lexer basado en el patrón maestro
+class RegexLexer(Lexer):
+    def __init__(self, source: str) -> None:
+        super().__init__(source)
         self._character: str = ''
         self._read_position: int = 0
-        self._position: int = 0
 
         self._read_character()
 
     def next_token(self) -> Token:
         self._skip_whitespace()
+        self._token_start = self._position
         if match(r'^=$', self._character):
             if self._peek_character() == '=':
                 token = self._make_two_character_token(TokenType.EQ)
@@ -32,6 +32,7 @@ class ObjectType(Enum):
 
 
 class Object(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def type(self) -> ObjectType:
@@ -43,7 +44,8 @@ class Object(ABC):
 
 
 class Integer(Object):
-    
+    __slots__ = ('_value',)
+
     def __init__(self, value: int) -> None:
         self._value = value
 
@@ -54,7 +56,50 @@ class Integer(Object):
         return str(self._value)
 
 
+# Enteros chicos creados una sola vez, como hace CPython: los literales y los
+# resultados aritméticos en este rango no crean objetos nuevos. Los objetos de LPP
+# nunca se modifican, así que se pueden compartir
+SMALL_INTEGER_MIN: int = -5
+SMALL_INTEGER_MAX: int = 1024
+
+_SMALL_INTEGERS: List[Integer] = [Integer(value) for value in range(SMALL_INTEGER_MIN, SMALL_INTEGER_MAX + 1)]
+
+
+def new_integer(value: int) -> Integer:
+    if SMALL_INTEGER_MIN <= value <= SMALL_INTEGER_MAX:
+        return _SMALL_INTEGERS[value - SMALL_INTEGER_MIN]
+
+    return Integer(value)
+
+
+class ConstantPool:
+    # Los objetos de las literales de un programa, uno solo por valor: el parser los
+    # crea una vez y evaluar una literal solo regresa el objeto
+
+    def __init__(self) -> None:
+        self._integers: Dict[int, Integer] = {}
+        self._strings: Dict[str, 'String'] = {}
+
+    def integer(self, value: int) -> Integer:
+        try:
+            return self._integers[value]
+        except KeyError:
+            integer = self._integers[value] = new_integer(value)
+            return integer
+
+    def string(self, value: str) -> 'String':
+        try:
+            return self._strings[value]
+        except KeyError:
+            string = self._strings[value] = String(value)
+            return string
+
+    def __len__(self) -> int:
+        return len(self._integers) + len(self._strings)
+
+
 class Boolean(Object):
+    __slots__ = ('_value',)
 
     def __init__(self, value: bool) -> None:
         self._value = value
@@ -67,6 +112,7 @@ class Boolean(Object):
 
 
 class Null(Object):
+    __slots__ = ()
 
     def type(self) -> ObjectType:
         return ObjectType.NULL
@@ -76,6 +122,7 @@ class Null(Object):
 
 
 class Return(Object):
+    __slots__ = ('_value',)
 
     def __init__(self, value: Object) -> None:
         self._value = value
@@ -88,6 +135,8 @@ class Return(Object):
 
 
 class Error(Object):
+    __slots__ = ('message',)
+
     def __init__(self, message: str) -> None:
         self.message = message
 
@@ -99,16 +148,19 @@ class Error(Object):
 
 
 class Environment(Dict):
+    __slots__ = ('_store', '_outer', '_captured')
+
     def __init__(self, outer=None):
         self._store = dict()
         self._outer = outer
+        self._captured = None
 
     def __getitem__(self, key):
         try:
             return self._store[key]
         except KeyError as e:
             if self._outer is not None:
-                return self._outer
+                return self._outer[key]
             
             raise e
 
@@ -118,8 +170,30 @@ class Environment(Dict):
     def __delitem__(self, key):
         del self._store[key]
 
+    def capture(self, names):
+        # Un procedimiento creado en este ambiente puede leer estos nombres. El ambiente
+        # del programa (sin outer) nunca se recorta, sigue cambiando p.ej. en el REPL
+        if self._outer is None:
+            return
+
+        if self._captured is None:
+            self._captured = set(names)
+        else:
+            self._captured.update(names)
+
+    def release(self):
+        # Se llama cuando termina la llamada dueña del ambiente: nada vuelve a asignar
+        # en él, así que solo se conservan los nombres que leen los procedimientos que
+        # se crearon aquí y la closure que sobrevive a la llamada no retiene lo demás
+        captured = self._captured
+        if captured is not None:
+            self._store = {key: value for key, value in self._store.items() if key in captured}
+            self._captured = None
+
 
 class Function(Object):
+    __slots__ = ('parameters', 'body', 'env')
+
     def __init__(self,
                 parameters: List[Identifier],
                 body: Block,
@@ -138,6 +212,7 @@ class Function(Object):
 
 
 class String(Object):
+    __slots__ = ('value',)
 
     def __init__(self, value: str) -> None:
         self.value = value
@@ -155,6 +230,7 @@ class BuiltinFunction(Protocol):
 
 
 class Builtin(Object):
+    __slots__ = ('fn',)
 
     def __init__(self, fn: BuiltinFunction):
         self.fn = fn
@@ -0,0 +1,448 @@
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+import lpp.ast as ast
+from lpp.evaluator import (
+    evaluate_infix_expression,
+    evaluate_prefix_expression,
+    is_truthy,
+    FALSE,
+    TRUE,
+)
+from lpp.object import (
+    Boolean,
+    Integer,
+    Object,
+    String,
+)
+from lpp.token import (
+    Token,
+    TokenType,
+)
+
+
+Constant = Union[ast.Integer, ast.Boolean, ast.StringLiteral]
+# Los valores conocidos de las variables: constantes y procedimientos que se pueden
+# expandir en las llamadas
+Constants = Dict[str, Union[Constant, ast.Function]]
+
+# Tamaño máximo (en nodos) de la expresión de un procedimiento que se expande
+DEFAULT_INLINE_THRESHOLD: int = 12
+
+_NO_TOKEN: Token = Token(TokenType.ILLEGAL, '')
+
+_LITERALS = (ast.Integer, ast.Boolean, ast.StringLiteral)
+
+
+def optimize(program: ast.Program, inline_threshold: int = DEFAULT_INLINE_THRESHOLD) -> ast.Program:
+    # Regresa un programa nuevo; los nodos que no cambian se comparten con el original.
+    # Un árbol demasiado profundo para recorrerlo recursivamente se deja sin optimizar
+    try:
+        return _Optimizer(program, inline_threshold).optimize()
+    except RecursionError:
+        return program
+
+
+class _Optimizer:
+    # - Las expresiones Infix y Prefix con operandos constantes se evalúan con las mismas
+    #   funciones del evaluador. Si el resultado es un Error (5 + verdadero) o la
+    #   operación es una división entre cero la expresión se deja igual para que el
+    #   error ocurra al ejecutar.
+    # - Una variable con valor constante se sustituye en las sentencias que le siguen en
+    #   el mismo bloque, solo si su nombre se asigna una sola vez en todo el programa y
+    #   nunca es un parámetro, así ninguna otra asignación puede ocultarla.
+    # - Un si con condición constante se reemplaza por la rama que se ejecuta.
+    # - Las sentencias después de un regresa en un bloque se eliminan.
+    # - Una llamada a un procedimiento asignado de la misma forma que las constantes,
+    #   cuyo cuerpo es una sola expresión de a lo más inline_threshold nodos hecha de
+    #   literales, operadores y sus parámetros, se reemplaza por esa expresión con los
+    #   argumentos en lugar de los parámetros. Sin llamadas en el cuerpo no puede ser
+    #   recursivo, y sin otros identificadores el resultado no depende del ambiente en
+    #   el que se evalúa. Para que los argumentos se evalúen igual que en la llamada, el
+    #   de un parámetro que no se usa no puede tener llamadas, el de un parámetro que se
+    #   usa varias veces tiene que ser un literal o un identificador, y solo uno puede
+    #   tener llamadas.
+
+    def __init__(self, program: ast.Program, inline_threshold: int = DEFAULT_INLINE_THRESHOLD) -> None:
+        self._program = program
+        self._propagable = self._single_assignments(program)
+        self._inline_threshold = inline_threshold
+
+    def optimize(self) -> ast.Program:
+        return ast.Program(statements=self._statements(self._program.statements, {}))
+
+    def _single_assignments(self, program: ast.Program) -> Set[str]:
+        assignments: Dict[str, int] = {}
+        parameters: Set[str] = set()
+
+        pending: List[object] = [program]
+        while pending:
+            node = pending.pop()
+
+            if type(node) == list:
+                pending.extend(node)  # type: ignore
+            elif type(node) == ast.LetStatement:
+                assert node.name is not None  # type: ignore
+                name = node.name.value  # type: ignore
+                assignments[name] = assignments.get(name, 0) + 1
+                pending.append(node.value)  # type: ignore
+            elif type(node) == ast.Function:
+                parameters.update(parameter.value for parameter in node.parameters)  # type: ignore
+                pending.append(node.body)  # type: ignore
+            elif node is not None:
+                for child in ('statements', 'return_value', 'expression', 'left', 'right',
+                              'condition', 'consequence', 'alternative', 'function', 'arguments'):
+                    if hasattr(node, child):
+                        pending.append(getattr(node, child))
+
+        return {name for name, count in assignments.items() if count == 1 and name not in parameters}
+
+    def _statements(self, statements: List[ast.Statement], constants: Constants) -> List[ast.Statement]:
+        constants = dict(constants)
+        out: List[ast.Statement] = []
+
+        for index, statement in enumerate(statements):
+            is_last = index == len(statements) - 1
+
+            if type(statement) == ast.LetStatement:
+                statement = self._let(statement, constants)  # type: ignore
+                out.append(statement)
+            elif type(statement) == ast.ReturnStatement:
+                out.append(ast.ReturnStatement(_NO_TOKEN,
+                                               self._expression(statement.return_value, constants),  # type: ignore
+                                               position=statement.position))
+
+                # Nada después de un regresa se ejecuta
+                break
+            elif type(statement) == ast.ExpressionStatement:
+                out.extend(self._expression_statement(statement, constants, is_last))  # type: ignore
+
+                if out and type(out[-1]) == ast.ReturnStatement:
+                    break
+            else:
+                out.append(statement)
+
+        return out
+
+    def _let(self, statement: ast.LetStatement, constants: Constants) -> ast.LetStatement:
+        assert statement.name is not None
+        value = self._expression(statement.value, constants)
+
+        if statement.name.value in self._propagable and _is_constant(value):
+            constants[statement.name.value] = value  # type: ignore
+        elif statement.name.value in self._propagable and type(value) == ast.Function \
+                and self._inline_expression(value) is not None:  # type: ignore
+            constants[statement.name.value] = value  # type: ignore
+
+        return ast.LetStatement(_NO_TOKEN, statement.name, value, position=statement.position)
+
+    def _expression_statement(self,
+                              statement: ast.ExpressionStatement,
+                              constants: Constants,
+                              is_last: bool) -> List[ast.Statement]:
+        expression = self._expression(statement.expression, constants)
+
+        if type(expression) == ast.If:
+            # Un si con condición constante como sentencia se reemplaza por las sentencias
+            # de la rama que se ejecuta: los bloques no crean un ambiente nuevo y un
+            # regresa o un error en la rama detienen el bloque de afuera igual que antes.
+            # Si la rama está vacía (o no hay si_no) el si vale None o nulo, así que solo
+            # se puede quitar cuando no es la última sentencia
+            assert isinstance(expression, ast.If)
+            branch = self._constant_branch(expression)
+
+            if branch is not None and branch.statements:
+                return branch.statements
+            elif branch is not None and not is_last:
+                return []
+            elif expression.alternative is None and not is_last and _is_constant(expression.condition) \
+                    and not self._is_true(expression.condition):
+                return []
+
+        return [ast.ExpressionStatement(_NO_TOKEN, expression, position=statement.position)]
+
+    def _expression(self, expression: Optional[ast.Expression], constants: Constants) -> Optional[ast.Expression]:
+        expression_type = type(expression)
+
+        if expression_type == ast.Identifier:
+            assert isinstance(expression, ast.Identifier)
+            value = constants.get(expression.value)
+
+            # Un procedimiento no se copia, cada procedimiento(...) crea uno distinto
+            return value if _is_constant(value) else expression  # type: ignore
+        elif expression_type == ast.Prefix:
+            assert isinstance(expression, ast.Prefix)
+            return self._prefix(expression, constants)
+        elif expression_type == ast.Infix:
+            assert isinstance(expression, ast.Infix)
+            return self._infix(expression, constants)
+        elif expression_type == ast.If:
+            assert isinstance(expression, ast.If)
+            return self._if(expression, constants)
+        elif expression_type == ast.Function:
+            assert isinstance(expression, ast.Function) and expression.body is not None
+            return ast.Function(_NO_TOKEN,
+                                expression.parameters,
+                                self._block(expression.body, constants),
+                                position=expression.position)
+        elif expression_type == ast.Call:
+            assert isinstance(expression, ast.Call)
+            arguments = [self._expression(argument, constants) for argument in expression.arguments] \
+                if expression.arguments is not None else None
+
+            call = ast.Call(_NO_TOKEN,
+                            self._expression(expression.function, constants),  # type: ignore
+                            arguments,  # type: ignore
+                            position=expression.position)
+
+            inlined = self._inline(call, constants)
+            return inlined if inlined is not None else call
+
+        return expression
+
+    def _inline(self, call: ast.Call, constants: Constants) -> Optional[ast.Expression]:
+        if type(call.function) != ast.Identifier or call.arguments is None:
+            return None
+
+        function = constants.get(call.function.value)  # type: ignore
+        if type(function) != ast.Function:
+            return None
+
+        assert isinstance(function, ast.Function)
+        expression = self._inline_expression(function)
+        if expression is None or len(call.arguments) != len(function.parameters):
+            # Con menos argumentos la llamada falla, con más los que sobran también se
+            # evalúan
+            return None
+
+        uses = _uses(expression)
+        arguments: Dict[str, ast.Expression] = {}
+        with_calls = 0
+
+        for parameter, argument in zip(function.parameters, call.arguments):
+            count = uses.get(parameter.value, 0)
+
+            if not _is_simple(argument):
+                return None
+            elif count > 1 and not isinstance(argument, (ast.Identifier,) + _LITERALS):
+                return None
+            elif _has_calls(argument):
+                with_calls += 1
+                if count == 0 or with_calls > 1:
+                    return None
+
+            arguments[parameter.value] = argument
+
+        # Los argumentos ya están optimizados, solo falta plegar lo que quedó constante
+        return self._expression(_substitute(expression, arguments), {})
+
+    def _inline_expression(self, function: ast.Function) -> Optional[ast.Expression]:
+        # La expresión que reemplaza las llamadas a function o None si no se expande
+        assert function.body is not None
+        parameters = {parameter.value for parameter in function.parameters}
+
+        if len(function.body.statements) != 1 or len(parameters) != len(function.parameters):
+            return None
+
+        statement = function.body.statements[0]
+        if type(statement) == ast.ReturnStatement:
+            expression = statement.return_value  # type: ignore
+        elif type(statement) == ast.ExpressionStatement:
+            expression = statement.expression  # type: ignore
+        else:
+            return None
+
+        size = 0
+        pending: List[Optional[ast.Expression]] = [expression]
+        while pending:
+            node = pending.pop()
+            size += 1
+
+            if size > self._inline_threshold:
+                return None
+            elif type(node) == ast.Identifier:
+                if node.value not in parameters:  # type: ignore
+                    return None
+            elif type(node) == ast.Prefix:
+                pending.append(node.right)  # type: ignore
+            elif type(node) == ast.Infix:
+                pending.append(node.left)  # type: ignore
+                pending.append(node.right)  # type: ignore
+            elif not _is_constant(node):
+                return None
+
+        return expression
+
+    def _prefix(self, expression: ast.Prefix, constants: Constants) -> ast.Expression:
+        right = self._expression(expression.right, constants)
+
+        if _is_constant(right):
+            folded = _to_node(evaluate_prefix_expression(expression.operator, _to_object(right)),  # type: ignore
+                              expression.position)
+            if folded is not None:
+                return folded
+
+        return ast.Prefix(_NO_TOKEN, expression.operator, right, position=expression.position)
+
+    def _infix(self, expression: ast.Infix, constants: Constants) -> ast.Expression:
+        left = self._expression(expression.left, constants)
+        right = self._expression(expression.right, constants)
+
+        if _is_constant(left) and _is_constant(right) \
+                and not (expression.operator == '/' and type(right) == ast.Integer and right.value == 0):  # type: ignore
+            folded = _to_node(evaluate_infix_expression(expression.operator,
+                                                         _to_object(left),  # type: ignore
+                                                         _to_object(right)),  # type: ignore
+                              expression.position)
+            if folded is not None:
+                return folded
+
+        return ast.Infix(_NO_TOKEN, left, expression.operator, right, position=expression.position)  # type: ignore
+
+    def _if(self, expression: ast.If, constants: Constants) -> ast.Expression:
+        assert expression.consequence is not None
+        optimized = ast.If(_NO_TOKEN,
+                           self._expression(expression.condition, constants),
+                           self._block(expression.consequence, constants),
+                           self._block(expression.alternative, constants) if expression.alternative is not None else None,
+                           position=expression.position)
+
+        # Como expresión solo se puede reemplazar por una rama que es una sola expresión
+        branch = self._constant_branch(optimized)
+        if branch is not None and len(branch.statements) == 1 and type(branch.statements[0]) == ast.ExpressionStatement:
+            statement = branch.statements[0]
+            assert isinstance(statement, ast.ExpressionStatement) and statement.expression is not None
+
+            return statement.expression
+
+        # Si no, por lo menos se quita la rama que nunca se ejecuta
+        if _is_constant(optimized.condition):
+            if self._is_true(optimized.condition):
+                optimized.alternative = None
+            else:
+                optimized.consequence = ast.Block(_NO_TOKEN, [], position=expression.consequence.position)
+
+        return optimized
+
+    def _block(self, block: ast.Block, constants: Constants) -> ast.Block:
+        return ast.Block(_NO_TOKEN, self._statements(block.statements, constants), position=block.position)
+
+    def _constant_branch(self, expression: ast.If) -> Optional[ast.Block]:
+        if not _is_constant(expression.condition):
+            return None
+        elif self._is_true(expression.condition):
+            return expression.consequence
+
+        return expression.alternative
+
+    def _is_true(self, condition: Optional[ast.Expression]) -> bool:
+        return is_truthy(_to_object(condition))  # type: ignore
+
+
+def _uses(expression: ast.Expression) -> Dict[str, int]:
+    uses: Dict[str, int] = {}
+
+    pending: List[Optional[ast.Expression]] = [expression]
+    while pending:
+        node = pending.pop()
+
+        if type(node) == ast.Identifier:
+            uses[node.value] = uses.get(node.value, 0) + 1  # type: ignore
+        elif type(node) == ast.Prefix:
+            pending.append(node.right)  # type: ignore
+        elif type(node) == ast.Infix:
+            pending.append(node.left)  # type: ignore
+            pending.append(node.right)  # type: ignore
+
+    return uses
+
+
+def _is_simple(argument: Optional[ast.Expression]) -> bool:
+    # Identificadores, literales, operadores y llamadas: ni si (cuyo regresa podría
+    # terminar el procedimiento de afuera) ni procedimientos
+    pending: List[Optional[ast.Expression]] = [argument]
+    while pending:
+        node = pending.pop()
+
+        if type(node) == ast.Prefix:
+            pending.append(node.right)  # type: ignore
+        elif type(node) == ast.Infix:
+            pending.append(node.left)  # type: ignore
+            pending.append(node.right)  # type: ignore
+        elif type(node) == ast.Call:
+            if node.arguments is None:  # type: ignore
+                return False
+
+            pending.append(node.function)  # type: ignore
+            pending.extend(node.arguments)  # type: ignore
+        elif type(node) != ast.Identifier and not isinstance(node, _LITERALS):
+            return False
+
+    return True
+
+
+def _has_calls(argument: ast.Expression) -> bool:
+    pending: List[Optional[ast.Expression]] = [argument]
+    while pending:
+        node = pending.pop()
+
+        if type(node) == ast.Call:
+            return True
+        elif type(node) == ast.Prefix:
+            pending.append(node.right)  # type: ignore
+        elif type(node) == ast.Infix:
+            pending.append(node.left)  # type: ignore
+            pending.append(node.right)  # type: ignore
+
+    return False
+
+
+def _substitute(expression: Optional[ast.Expression], arguments: Dict[str, ast.Expression]) -> Optional[ast.Expression]:
+    if type(expression) == ast.Identifier:
+        return arguments[expression.value]  # type: ignore
+    elif type(expression) == ast.Prefix:
+        assert isinstance(expression, ast.Prefix)
+        return ast.Prefix(_NO_TOKEN,
+                          expression.operator,
+                          _substitute(expression.right, arguments),
+                          position=expression.position)
+    elif type(expression) == ast.Infix:
+        assert isinstance(expression, ast.Infix)
+        return ast.Infix(_NO_TOKEN,
+                         _substitute(expression.left, arguments),  # type: ignore
+                         expression.operator,
+                         _substitute(expression.right, arguments),
+                         position=expression.position)
+
+    return expression
+
+
+def _is_constant(expression: Optional[ast.Expression]) -> bool:
+    return (type(expression) == ast.Integer or type(expression) == ast.Boolean or type(expression) == ast.StringLiteral) \
+        and expression.value is not None  # type: ignore
+
+
+def _to_object(expression: Constant) -> Object:
+    if type(expression) == ast.Integer:
+        assert expression.value is not None
+        return Integer(expression.value)  # type: ignore
+    elif type(expression) == ast.Boolean:
+        return TRUE if expression.value else FALSE
+
+    return String(expression.value)  # type: ignore
+
+
+def _to_node(obj: Object, position: int) -> Optional[ast.Expression]:
+    if type(obj) == Integer:
+        return ast.Integer(_NO_TOKEN, obj._value, position=position)  # type: ignore
+    elif type(obj) == Boolean:
+        return ast.Boolean(_NO_TOKEN, obj._value, position=position)  # type: ignore
+    elif type(obj) == String:
+        return ast.StringLiteral(_NO_TOKEN, obj.value, position=position)  # type: ignore
+
+    return None
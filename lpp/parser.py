@@ -20,14 +20,18 @@ from lpp.ast import (
 )
 
 from typing import (
+    Any,
     Callable,
     Dict,
     List,
-    Optional
+    Optional,
+    Tuple,
+    Union
 )
 
 from lpp.lexer import Lexer
-from lpp.token import Token, TokenType
+from lpp.object import ConstantPool
+from lpp.token import Token, TokenBuffer, TokenType
 
 
 PrefixParseFn = Callable[[], Optional[Expression]]
@@ -60,11 +64,14 @@ PRECEDENCES: Dict[TokenType, Precedence] = {
 
 class Parser:
 
-    def __init__(self, lexer: Lexer) -> None:
+    def __init__(self, lexer: Union[Lexer, TokenBuffer]) -> None:
         self._lexer = lexer
         self._current_token: Optional[Token] = None
         self._peek_token: Optional[Token] = None
+        self._current_position: int = -1
+        self._peek_position: int = -1
         self._errors: List[str] = []
+        self.constants = ConstantPool()
 
         self._prefix_parse_fns: PrefixParseFns = self._register_prefix_fns()
         self._infix_parse_fns: InfixParseFns = self._register_infix_fns()
@@ -92,7 +99,9 @@ class Parser:
 
     def _advance_tokens(self) -> None:
         self._current_token = self._peek_token
+        self._current_position = self._peek_position
         self._peek_token = self._lexer.next_token()
+        self._peek_position = self._lexer.token_start
 
     def _current_precedence (self) -> Precedence:
         assert self._current_token is not None
@@ -121,11 +130,13 @@ class Parser:
     def _parse_boolean(self) -> Boolean:
         assert self._current_token is not None
 
-        return Boolean(token=self._current_token, value=self._current_token.token_type == TokenType.TRUE)
+        return Boolean(token=self._current_token,
+                        value=self._current_token.token_type == TokenType.TRUE,
+                        position=self._current_position)
 
     def _parse_call(self, function: Expression) -> Call:
         assert self._current_token is not None
-        call = Call(self._current_token, function=function)
+        call = Call(token=self._current_token, function=function, position=self._current_position)
         call.arguments = self._parse_call_arguments()
 
         return call
@@ -160,7 +171,8 @@ class Parser:
     def _parse_block(self) -> Block:
         assert self._current_token is not None
         block_statement = Block(token=self._current_token,
-                                statements=[])
+                                statements=[],
+                                position=self._current_position)
 
         self._advance_tokens()
 
@@ -211,7 +223,7 @@ class Parser:
         assert self._current_token is not None
 
         # Creamos el ReturnStatement indicandole que el token es el actual
-        expression_statement = ExpressionStatement(token=self._current_token)
+        expression_statement = ExpressionStatement(token=self._current_token, position=self._current_position)
         # Asignamos valor al expression
         expression_statement.expression = self._parse_expression(Precedence.LOWEST)
 
@@ -237,7 +249,7 @@ class Parser:
 
     def _parse_function(self) -> Optional[Function]:
         assert self._current_token is not None
-        function = Function(token=self._current_token)
+        function = Function(token=self._current_token, position=self._current_position)
 
         if not self._expected_token(TokenType.LPAREN):
             return None
@@ -263,7 +275,9 @@ class Parser:
         self._advance_tokens()
 
         assert self._current_token is not None
-        identifier = Identifier(token=self._current_token, value=self._current_token.literal)
+        identifier = Identifier(token=self._current_token,
+                                value=self._current_token.literal,
+                                position=self._current_position)
 
         params.append(identifier)
 
@@ -272,7 +286,8 @@ class Parser:
             self._advance_tokens()
 
             identifier = Identifier(token=self._current_token,
-                                    value=self._current_token.literal)
+                                    value=self._current_token.literal,
+                                    position=self._current_position)
 
             params.append(identifier)
 
@@ -285,11 +300,12 @@ class Parser:
         assert self._current_token is not None
 
         return Identifier(token=self._current_token,
-                        value=self._current_token.literal)
+                        value=self._current_token.literal,
+                        position=self._current_position)
 
     def _parse_if(self) -> Optional[If]:
         assert self._current_token is not None
-        if_expression = If(token=self._current_token)
+        if_expression = If(token=self._current_token, position=self._current_position)
 
         # Si no tenemos después del If un parentesis izquierdo, se acabó
         if not self._expected_token(TokenType.LPAREN):
@@ -325,7 +341,8 @@ class Parser:
         assert self._current_token is not None
         infix = Infix(token=self._current_token,
                     operator=self._current_token.literal,
-                    left=left)
+                    left=left,
+                    position=self._current_position)
 
         precedence = self._current_precedence()
 
@@ -337,7 +354,7 @@ class Parser:
 
     def _parse_integer(self) -> Optional[Integer]:
         assert self._current_token is not None
-        integer = Integer(token=self._current_token)
+        integer = Integer(token=self._current_token, position=self._current_position)
 
         try:
             integer.value = int(self._current_token.literal)
@@ -347,13 +364,15 @@ class Parser:
             self._errors.append(message)
 
             return None
-        
+
+        integer.cache = self.constants.integer(integer.value)
+
         return integer
 
     def _parse_let_statement(self) -> Optional[LetStatement]:
         assert self._current_token is not None
         # Creamos el LetStatement indicandole que el token es el actual
-        let_statement = LetStatement(token=self._current_token)
+        let_statement = LetStatement(token=self._current_token, position=self._current_position)
 
         # En dado caso que el expected token sí haya sido un IDENT, procederemos a crear una instancia de Identifier con este identificador
         if not self._expected_token(TokenType.IDENT):
@@ -382,7 +401,8 @@ class Parser:
         assert self._current_token is not None
         # Generamos el prefijo, le ponemos el operador
         prefix_expression = Prefix(token=self._current_token,
-                                    operator=self._current_token.literal)
+                                    operator=self._current_token.literal,
+                                    position=self._current_position)
         # Avanzamos al siguiente token
         self._advance_tokens()
         # Parseamos expresiones
@@ -392,7 +412,7 @@ class Parser:
 
     def _parse_return_statement(self) -> Optional[ReturnStatement]:
         assert self._current_token is not None
-        return_statement = ReturnStatement(token=self._current_token)
+        return_statement = ReturnStatement(token=self._current_token, position=self._current_position)
 
         self._advance_tokens()
 
@@ -417,8 +437,12 @@ class Parser:
 
     def _parse_string(self) -> Expression:
         assert self._current_token is not None
-        return StringLiteral(token=self._current_token,
-                            value=self._current_token.literal)
+        string = StringLiteral(token=self._current_token,
+                               value=self._current_token.literal,
+                               position=self._current_position)
+        string.cache = self.constants.string(string.value)
+
+        return string
 
     def _peek_precedence(self) -> Precedence:
         assert self._peek_token is not None
@@ -452,4 +476,257 @@ class Parser:
             TokenType.MINUS: self._parse_prefix_expression,
             TokenType.NEGATION: self._parse_prefix_expression,
             TokenType.STRING: self._parse_string,
-        }
\ No newline at end of file
+        }
+
+# Continuaciones pendientes del IterativeParser. Cada una recibe el valor
+# (expresión, statement o bloque) que se acaba de terminar de parsear
+_EXPRESSION_LOOP = 1
+_INFIX_RIGHT = 2
+_PREFIX_RIGHT = 3
+_GROUPED = 4
+_CALL_ARGUMENT = 5
+_IF_CONDITION = 6
+_IF_CONSEQUENCE = 7
+_IF_ALTERNATIVE = 8
+_FUNCTION_BODY = 9
+_LET_VALUE = 10
+_RETURN_VALUE = 11
+_EXPRESSION_STATEMENT = 12
+_BLOCK_STATEMENT = 13
+_PROGRAM_STATEMENT = 14
+
+# Lo siguiente que tiene que hacer el ciclo principal
+_PARSE_EXPRESSION = 1
+_PARSE_STATEMENT = 2
+_PARSE_BLOCK = 3
+_RETURN = 4
+
+
+class IterativeParser(Parser):
+    # Produce exactamente los mismos árboles que Parser, pero en lugar de que cada
+    # nivel de anidación sea una llamada recursiva, las construcciones a medio parsear
+    # se guardan en una pila propia, así que la profundidad solo está limitada por la memoria
+
+    def parse_program(self) -> Program:
+        program: Program = Program(statements=[])
+
+        assert self._current_token is not None
+        if self._current_token.token_type == TokenType.EOF:
+            return program
+
+        self._parse([(_PROGRAM_STATEMENT, program, None)], _PARSE_STATEMENT)
+
+        return program
+
+    def _parse(self, stack: List[Tuple[int, Any, Any]], action: int) -> Any:
+        precedence: Precedence = Precedence.LOWEST
+        value: Any = None
+
+        while True:
+            assert self._current_token is not None and self._peek_token is not None
+
+            if action == _PARSE_EXPRESSION:
+                token_type = self._current_token.token_type
+                action, value = _RETURN, None
+
+                if token_type == TokenType.MINUS or token_type == TokenType.NEGATION:
+                    prefix = Prefix(token=self._current_token,
+                                    operator=self._current_token.literal,
+                                    position=self._current_position)
+                    self._advance_tokens()
+
+                    stack.append((_EXPRESSION_LOOP, precedence, None))
+                    stack.append((_PREFIX_RIGHT, prefix, None))
+                    action, precedence = _PARSE_EXPRESSION, Precedence.PREFIX
+                elif token_type == TokenType.LPAREN:
+                    self._advance_tokens()
+
+                    stack.append((_EXPRESSION_LOOP, precedence, None))
+                    stack.append((_GROUPED, None, None))
+                    action, precedence = _PARSE_EXPRESSION, Precedence.LOWEST
+                elif token_type == TokenType.IF:
+                    if_expression = If(token=self._current_token, position=self._current_position)
+                    stack.append((_EXPRESSION_LOOP, precedence, None))
+
+                    if self._expected_token(TokenType.LPAREN):
+                        self._advance_tokens()
+
+                        stack.append((_IF_CONDITION, if_expression, None))
+                        action, precedence = _PARSE_EXPRESSION, Precedence.LOWEST
+                elif token_type == TokenType.FUNCTION:
+                    function = Function(token=self._current_token, position=self._current_position)
+                    stack.append((_EXPRESSION_LOOP, precedence, None))
+
+                    if self._expected_token(TokenType.LPAREN):
+                        function.parameters = self._parse_function_parameters()
+
+                        if self._expected_token(TokenType.LBRACE):
+                            stack.append((_FUNCTION_BODY, function, None))
+                            action = _PARSE_BLOCK
+                elif token_type in self._prefix_parse_fns:
+                    # Literales e identificadores no anidan nada, se parsean directamente
+                    value = self._prefix_parse_fns[token_type]()
+                    action, value, precedence = self._parse_infix_loop(stack, precedence, value)
+                else:
+                    message = f'No se encontro ninguna funcion para parsear {self._current_token.literal}'
+                    self._errors.append(message)
+            elif action == _PARSE_STATEMENT:
+                token_type = self._current_token.token_type
+                action = _PARSE_EXPRESSION
+                precedence = Precedence.LOWEST
+
+                if token_type == TokenType.LET:
+                    let_statement = LetStatement(token=self._current_token, position=self._current_position)
+
+                    if not self._expected_token(TokenType.IDENT):
+                        action, value = _RETURN, None
+                    else:
+                        let_statement.name = self._parse_identifier()
+
+                        if not self._expected_token(TokenType.ASSIGN):
+                            action, value = _RETURN, None
+                        else:
+                            self._advance_tokens()
+                            stack.append((_LET_VALUE, let_statement, None))
+                elif token_type == TokenType.RETURN:
+                    return_statement = ReturnStatement(token=self._current_token, position=self._current_position)
+                    self._advance_tokens()
+
+                    stack.append((_RETURN_VALUE, return_statement, None))
+                else:
+                    expression_statement = ExpressionStatement(token=self._current_token,
+                                                               position=self._current_position)
+                    stack.append((_EXPRESSION_STATEMENT, expression_statement, None))
+            elif action == _PARSE_BLOCK:
+                block = Block(token=self._current_token, statements=[], position=self._current_position)
+                self._advance_tokens()
+
+                if self._current_token.token_type == TokenType.RBRACE or \
+                        self._current_token.token_type == TokenType.EOF:
+                    action, value = _RETURN, block
+                else:
+                    stack.append((_BLOCK_STATEMENT, block, None))
+                    action = _PARSE_STATEMENT
+            else:
+                if not stack:
+                    return value
+
+                continuation, node, state = stack.pop()
+
+                if continuation == _EXPRESSION_LOOP:
+                    action, value, precedence = self._parse_infix_loop(stack, node, value)
+                elif continuation == _INFIX_RIGHT or continuation == _PREFIX_RIGHT:
+                    node.right = value
+                    value = node
+                elif continuation == _GROUPED:
+                    if not self._expected_token(TokenType.RPAREN):
+                        value = None
+                elif continuation == _CALL_ARGUMENT:
+                    if value:
+                        state.append(value)
+
+                    if self._peek_token.token_type == TokenType.COMMA:
+                        self._advance_tokens()
+                        self._advance_tokens()
+
+                        stack.append((_CALL_ARGUMENT, node, state))
+                        precedence = Precedence.LOWEST
+                        action = _PARSE_EXPRESSION
+                    else:
+                        node.arguments = state if self._expected_token(TokenType.RPAREN) else None
+                        value = node
+                elif continuation == _IF_CONDITION:
+                    node.condition = value
+                    value = None
+
+                    if self._expected_token(TokenType.RPAREN) and self._expected_token(TokenType.LBRACE):
+                        stack.append((_IF_CONSEQUENCE, node, None))
+                        action = _PARSE_BLOCK
+                elif continuation == _IF_CONSEQUENCE:
+                    node.consequence = value
+                    value = node
+
+                    if self._peek_token.token_type == TokenType.ELSE:
+                        self._advance_tokens()
+                        value = None
+
+                        if self._expected_token(TokenType.LBRACE):
+                            stack.append((_IF_ALTERNATIVE, node, None))
+                            action = _PARSE_BLOCK
+                elif continuation == _IF_ALTERNATIVE:
+                    node.alternative = value
+                    value = node
+                elif continuation == _FUNCTION_BODY:
+                    node.body = value
+                    value = node
+                elif continuation == _LET_VALUE or continuation == _RETURN_VALUE \
+                        or continuation == _EXPRESSION_STATEMENT:
+                    if continuation == _LET_VALUE:
+                        node.value = value
+                    elif continuation == _RETURN_VALUE:
+                        node.return_value = value
+                    else:
+                        node.expression = value
+
+                    if self._peek_token.token_type == TokenType.SEMICOLON:
+                        self._advance_tokens()
+
+                    value = node
+                elif continuation == _BLOCK_STATEMENT or continuation == _PROGRAM_STATEMENT:
+                    if value is not None:
+                        node.statements.append(value)
+
+                    self._advance_tokens()
+
+                    if self._current_token.token_type == TokenType.EOF or \
+                            (continuation == _BLOCK_STATEMENT and
+                             self._current_token.token_type == TokenType.RBRACE):
+                        value = node
+                    else:
+                        stack.append((continuation, node, None))
+                        action = _PARSE_STATEMENT
+
+    def _parse_infix_loop(self,
+                          stack: List[Tuple[int, Any, Any]],
+                          precedence: Precedence,
+                          left: Optional[Expression]) -> Tuple[int, Any, Precedence]:
+        assert self._peek_token is not None
+
+        while not self._peek_token.token_type == TokenType.SEMICOLON and \
+                precedence < self._peek_precedence():
+            if self._peek_token.token_type not in self._infix_parse_fns:
+                break
+
+            self._advance_tokens()
+
+            assert self._current_token is not None and left is not None
+            if self._current_token.token_type == TokenType.LPAREN:
+                call = Call(token=self._current_token, function=left, position=self._current_position)
+
+                if self._peek_token.token_type == TokenType.RPAREN:
+                    self._advance_tokens()
+                    call.arguments = []
+                    left = call
+                    continue
+
+                self._advance_tokens()
+
+                stack.append((_EXPRESSION_LOOP, precedence, None))
+                stack.append((_CALL_ARGUMENT, call, []))
+
+                return _PARSE_EXPRESSION, None, Precedence.LOWEST
+            else:
+                infix = Infix(token=self._current_token,
+                              operator=self._current_token.literal,
+                              left=left,
+                              position=self._current_position)
+                operator_precedence = self._current_precedence()
+
+                self._advance_tokens()
+
+                stack.append((_EXPRESSION_LOOP, precedence, None))
+                stack.append((_INFIX_RIGHT, infix, None))
+
+                return _PARSE_EXPRESSION, None, operator_precedence
+
+        return _RETURN, left, precedence
@@ -3,7 +3,10 @@ from typing import List
 
 from lpp.ast import Program
 from lpp.evaluator import evaluate
-from lpp.lexer import Lexer
+from lpp.lexer import (
+    IdentifierTable,
+    Lexer,
+)
 from lpp.parser import Parser
 from lpp.object import Environment
 
@@ -25,9 +28,10 @@ def _print_parse_errors(errors: List[str]):
 
 def start_repl() -> None:
     scanned: List[str] = []
+    identifiers: IdentifierTable = {}
     while (source := input('>> ')) != 'salir()':
         scanned.append(source)
-        lexer: Lexer = Lexer(' '.join(scanned))
+        lexer: Lexer = Lexer(' '.join(scanned), identifiers=identifiers)
         parser: Parser = Parser(lexer)
 
         program: Program = parser.parse_program()
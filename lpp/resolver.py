@@ -0,0 +1,431 @@
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import lpp.ast as ast
+from lpp.builtins import BUILTINS
+from lpp.evaluator import (
+    apply_function,
+    evaluate_prefix_expression,
+    infix_operation,
+    new_error,
+    NOT_A_FUNCTION,
+    to_boolean_object,
+    UNKNOW_IDENTIFIER,
+    FALSE,
+    NULL,
+    TRUE,
+)
+from lpp.object import (
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    new_integer,
+    Object,
+    ObjectType,
+    Return,
+    String,
+)
+
+
+# Un frame es una lista: en la posición 0 el frame del ámbito de afuera y después un
+# lugar por cada parámetro y variable del ámbito. Los lugares de las variables empiezan
+# en UNBOUND porque, igual que con Environment, una variable que todavía no se asigna
+# se busca en los ámbitos de afuera
+Frame = List[Any]
+
+
+class _Unbound:
+
+    def __repr__(self) -> str:
+        return 'UNBOUND'
+
+
+UNBOUND = _Unbound()
+
+
+class Binding(NamedTuple):
+    # Dónde puede estar el valor de un identificador, en orden: (profundidad, lugar).
+    # Si ninguno está asignado se usa fallback (una función builtin) o es un error
+    candidates: Tuple[Tuple[int, int], ...]
+    fallback: Optional[Builtin]
+
+
+class Resolution:
+
+    def __init__(self) -> None:
+        self.identifiers: Dict[ast.Identifier, Binding] = {}
+        self.lets: Dict[ast.LetStatement, int] = {}
+        self.frame_sizes: Dict[Union[ast.Program, ast.Function], int] = {}
+
+
+class _Scope:
+
+    def __init__(self, parent: Optional['_Scope'], parameters: List[str]) -> None:
+        self.parent = parent
+        self.parameters = set(parameters)
+        # Los argumentos se copian en orden a los primeros lugares; si un parámetro se
+        # repite el nombre se queda con el último, igual que en Environment
+        self.slots: Dict[str, int] = {parameter: index + 1 for index, parameter in enumerate(parameters)}
+        self.size = len(parameters)
+        # Las variables que ya se asignaron en una sentencia anterior del cuerpo (no
+        # dentro de un si, que puede no ejecutarse)
+        self.assigned: Set[str] = set()
+
+    def declare(self, name: str) -> None:
+        if name not in self.slots:
+            self.size += 1
+            self.slots[name] = self.size
+
+
+def resolve(program: ast.Program) -> Resolution:
+    resolver = _Resolver()
+    resolver.resolve_program(program)
+
+    return resolver.resolution
+
+
+class _Resolver:
+
+    def __init__(self) -> None:
+        self.resolution = Resolution()
+        self._scope: Optional[_Scope] = None
+
+    def resolve_program(self, program: ast.Program) -> None:
+        self._resolve_body(program, program.statements, [])
+
+    def _resolve_body(self,
+                      node: Union[ast.Program, ast.Function],
+                      statements: List[ast.Statement],
+                      parameters: List[str]) -> None:
+        scope = _Scope(self._scope, parameters)
+        self._declare(scope, statements)
+        self.resolution.frame_sizes[node] = scope.size
+
+        outer_scope = self._scope
+        self._scope = scope
+        for statement in statements:
+            self._resolve(statement)
+
+            if type(statement) == ast.LetStatement:
+                scope.assigned.add(statement.name.value)  # type: ignore
+        self._scope = outer_scope
+
+    def _declare(self, scope: _Scope, statements: List[ast.Statement]) -> None:
+        # Las variables de los bloques de si son del procedimiento que los contiene, las
+        # de los procedimientos anidados no
+        pending: List[Any] = list(reversed(statements))
+        while pending:
+            node = pending.pop()
+
+            if type(node) == list:
+                pending.extend(reversed(node))
+            elif node is None or type(node) == ast.Function:
+                continue
+            elif type(node) == ast.LetStatement:
+                assert node.name is not None
+                scope.declare(node.name.value)
+                pending.append(node.value)
+            else:
+                for child in _CHILDREN.get(type(node), ()):
+                    pending.append(getattr(node, child))
+
+    def _resolve(self, node: Optional[ast.ASTNode]) -> None:
+        assert self._scope is not None
+        node_type = type(node)
+
+        if node_type == ast.Identifier:
+            self.resolution.identifiers[node] = self._bind(node.value)  # type: ignore
+        elif node_type == ast.LetStatement:
+            assert isinstance(node, ast.LetStatement) and node.name is not None
+            self._resolve(node.value)
+            self.resolution.lets[node] = self._scope.slots[node.name.value]
+        elif node_type == ast.Function:
+            assert isinstance(node, ast.Function) and node.body is not None
+            self._resolve_body(node, node.body.statements, [parameter.value for parameter in node.parameters])
+        elif node_type == ast.Call:
+            assert isinstance(node, ast.Call)
+            self._resolve(node.function)
+            for argument in node.arguments or []:
+                self._resolve(argument)
+        else:
+            for child in _CHILDREN.get(node_type, ()):
+                value = getattr(node, child)
+
+                if type(value) == list:
+                    for item in value:
+                        self._resolve(item)
+                else:
+                    self._resolve(value)
+
+    def _bind(self, name: str) -> Binding:
+        candidates: List[Tuple[int, int]] = []
+
+        depth = 0
+        scope = self._scope
+        while scope is not None:
+            if name in scope.slots:
+                candidates.append((depth, scope.slots[name]))
+
+                # Un parámetro siempre está asignado, y una variable asignada en una
+                # sentencia anterior también (un procedimiento creado después de esa
+                # sentencia solo puede ejecutarse después), no hace falta seguir buscando
+                if name in scope.parameters or name in scope.assigned:
+                    break
+
+            scope = scope.parent
+            depth += 1
+
+        return Binding(tuple(candidates), BUILTINS.get(name))
+
+
+_CHILDREN: Dict[type, Tuple[str, ...]] = {
+    ast.Program: ('statements',),
+    ast.ReturnStatement: ('return_value',),
+    ast.ExpressionStatement: ('expression',),
+    ast.Prefix: ('right',),
+    ast.Infix: ('left', 'right'),
+    ast.Block: ('statements',),
+    ast.If: ('condition', 'consequence', 'alternative'),
+    ast.Call: ('function', 'arguments'),
+}
+
+
+_NO_ENVIRONMENT = Environment()
+
+
+class SlotFunction(Function):
+    __slots__ = ('frame', 'frame_size')
+
+    def __init__(self,
+                 parameters: List[ast.Identifier],
+                 body: ast.Block,
+                 frame: Frame,
+                 frame_size: int) -> None:
+        # Los nombres están en el frame, todos comparten el mismo ambiente vacío
+        super().__init__(parameters, body, _NO_ENVIRONMENT)
+        self.frame = frame
+        self.frame_size = frame_size
+
+
+class SlotEvaluator:
+    # Igual que lpp.evaluator pero los identificadores usan la resolución en lugar de
+    # buscarse por nombre en una cadena de Environment. Los nodos que tienen hijos
+    # despachan directamente con la tabla en lugar de pasar por evaluate
+
+    def __init__(self, resolution: Resolution) -> None:
+        self._identifiers = resolution.identifiers
+        self._lets = resolution.lets
+        self._frame_sizes = resolution.frame_sizes
+
+        self._evaluators: Dict[type, Callable[[Any, Frame], Optional[Object]]] = {
+            ast.Program: self._evaluate_program,
+            ast.ExpressionStatement: self._evaluate_expression_statement,
+            ast.Integer: self._evaluate_integer,
+            ast.Boolean: self._evaluate_boolean,
+            ast.Prefix: self._evaluate_prefix,
+            ast.Infix: self._evaluate_infix,
+            ast.Block: self._evaluate_block,
+            ast.If: self._evaluate_if,
+            ast.ReturnStatement: self._evaluate_return,
+            ast.LetStatement: self._evaluate_let,
+            ast.Identifier: self._evaluate_identifier,
+            ast.Function: self._evaluate_function,
+            ast.Call: self._evaluate_call,
+            ast.StringLiteral: self._evaluate_string,
+        }
+
+    def run(self, program: ast.Program) -> Optional[Object]:
+        frame: Frame = [None]
+        frame.extend([UNBOUND] * self._frame_sizes[program])
+
+        return self.evaluate(program, frame)
+
+    def evaluate(self, node: ast.ASTNode, frame: Frame) -> Optional[Object]:
+        try:
+            evaluator = self._evaluators[type(node)]
+        except KeyError:
+            return None
+
+        return evaluator(node, frame)
+
+    def _evaluate_program(self, program: ast.Program, frame: Frame) -> Optional[Object]:
+        result: Optional[Object] = None
+
+        for statement in program.statements:
+            result = self.evaluate(statement, frame)
+
+            if type(result) == Return:
+                return result._value  # type: ignore
+            elif type(result) == Error:
+                return result
+
+        return result
+
+    def _evaluate_expression_statement(self, node: ast.ExpressionStatement, frame: Frame) -> Optional[Object]:
+        expression = node.expression
+
+        return self._evaluators[type(expression)](expression, frame)
+
+    def _evaluate_integer(self, node: ast.Integer, frame: Frame) -> Optional[Object]:
+        constant = node.cache
+        if constant is None:
+            # Nodos que no salieron del parser (p.ej. los que crea lpp.optimizer)
+            assert node.value is not None
+            constant = node.cache = new_integer(node.value)
+
+        return constant
+
+    def _evaluate_boolean(self, node: ast.Boolean, frame: Frame) -> Optional[Object]:
+        assert node.value is not None
+        return to_boolean_object(node.value)
+
+    def _evaluate_string(self, node: ast.StringLiteral, frame: Frame) -> Optional[Object]:
+        constant = node.cache
+        if constant is None:
+            constant = node.cache = String(node.value)
+
+        return constant
+
+    def _evaluate_prefix(self, node: ast.Prefix, frame: Frame) -> Optional[Object]:
+        assert node.right is not None
+        right = self.evaluate(node.right, frame)
+
+        assert right is not None
+        return evaluate_prefix_expression(node.operator, right)
+
+    def _evaluate_infix(self, node: ast.Infix, frame: Frame) -> Optional[Object]:
+        evaluators = self._evaluators
+        left_node, right_node = node.left, node.right
+        left = evaluators[type(left_node)](left_node, frame)
+        right = evaluators[type(right_node)](right_node, frame)
+
+        # La misma caché que lpp.evaluator._evaluate_infix
+        operation = node.cache
+        if operation is not None and operation[0] is type(left) and operation[1] is type(right):
+            return operation[2](left, right)
+
+        operation = (type(left), type(right), infix_operation(node.operator, cast(Object, left), cast(Object, right)))
+        node.cache = operation
+
+        return operation[2](left, right)
+
+    def _evaluate_block(self, block: ast.Block, frame: Frame) -> Optional[Object]:
+        evaluators = self._evaluators
+        result: Optional[Object] = None
+
+        for statement in block.statements:
+            result = evaluators[type(statement)](statement, frame)
+
+            if type(result) is Return or type(result) is Error:
+                return result
+
+        return result
+
+    def _evaluate_if(self, node: ast.If, frame: Frame) -> Optional[Object]:
+        condition_node = node.condition
+        condition = self._evaluators[type(condition_node)](condition_node, frame)
+
+        if condition is TRUE or (condition is not FALSE and condition is not NULL):
+            return self._evaluate_block(cast(ast.Block, node.consequence), frame)
+        elif node.alternative is not None:
+            return self._evaluate_block(node.alternative, frame)
+        else:
+            return NULL
+
+    def _evaluate_return(self, node: ast.ReturnStatement, frame: Frame) -> Optional[Object]:
+        return_value = node.return_value
+
+        return Return(cast(Object, self._evaluators[type(return_value)](return_value, frame)))
+
+    def _evaluate_let(self, node: ast.LetStatement, frame: Frame) -> Optional[Object]:
+        value = node.value
+        frame[self._lets[node]] = self._evaluators[type(value)](value, frame)
+
+        return None
+
+    def _evaluate_identifier(self, node: ast.Identifier, frame: Frame) -> Optional[Object]:
+        candidates, fallback = self._identifiers[node]
+
+        # Casi siempre hay un solo lugar y está en el frame actual o en el de afuera
+        if len(candidates) == 1:
+            depth, slot = candidates[0]
+
+            if depth == 0:
+                value = frame[slot]
+            elif depth == 1:
+                value = frame[0][slot]
+            else:
+                target = frame
+                while depth:
+                    target = target[0]
+                    depth -= 1
+                value = target[slot]
+
+            if value is not UNBOUND:
+                return value
+            candidates = ()
+
+        for depth, slot in candidates:
+            target = frame
+            while depth:
+                target = target[0]
+                depth -= 1
+
+            value = target[slot]
+            if value is not UNBOUND:
+                return value
+
+        if fallback is not None:
+            return fallback
+
+        return new_error(UNKNOW_IDENTIFIER, [node.value])
+
+    def _evaluate_function(self, node: ast.Function, frame: Frame) -> Optional[Object]:
+        assert node.body is not None
+        return SlotFunction(node.parameters, node.body, frame, self._frame_sizes[node])
+
+    def _evaluate_call(self, node: ast.Call, frame: Frame) -> Optional[Object]:
+        evaluators = self._evaluators
+        function_node = node.function
+        function = evaluators[type(function_node)](function_node, frame)
+
+        args: List[Object] = []
+        for argument in node.arguments:  # type: ignore
+            args.append(evaluators[type(argument)](argument, frame))  # type: ignore
+
+        if type(function) is SlotFunction:
+            return self._apply(function, args)  # type: ignore
+        elif isinstance(function, Function) or type(function) == Builtin:
+            return apply_function(cast(Object, function), args)
+        else:
+            return new_error(NOT_A_FUNCTION, [cast(Object, function).type().name])
+
+    def _apply(self, function: SlotFunction, args: List[Object]) -> Object:
+        count = len(function.parameters)
+        if len(args) < count:
+            # Igual que extend_function_environment cuando faltan argumentos
+            raise IndexError('faltan argumentos')
+
+        # Una sola lista por llamada: el frame de afuera, los argumentos y las variables
+        frame: Frame = [UNBOUND] * (function.frame_size + 1)
+        frame[0] = function.frame
+        frame[1:count + 1] = args if len(args) == count else args[:count]
+
+        evaluated = self._evaluate_block(function.body, frame)
+
+        return evaluated._value if type(evaluated) is Return else evaluated  # type: ignore
+
+
+def evaluate_resolved(program: ast.Program) -> Optional[Object]:
+    return SlotEvaluator(resolve(program)).run(program)
@@ -0,0 +1,149 @@
+from time import perf_counter
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+)
+
+import lpp.ast as ast
+import lpp.evaluator as evaluator
+from lpp.closures import (
+    Code,
+    compile_node,
+)
+from lpp.evaluator import (
+    apply_function,
+    evaluate,
+    extend_function_environment,
+    TailCall,
+    unwrap_return_value,
+)
+from lpp.object import (
+    Environment,
+    Function,
+    Object,
+)
+
+
+DEFAULT_THRESHOLD: int = 1_000
+
+
+class Promotion(NamedTuple):
+    function: str
+    position: int
+    calls: int
+    seconds: float
+    compiled: bool
+    # El cuerpo ya lo había compilado otro Tiering sobre el mismo árbol
+    reused: bool = False
+
+
+class Tiering:
+    # Ejecución por niveles: los procedimientos empiezan en el evaluador de árbol y se
+    # cuentan las llamadas por cuerpo (todas las closures creadas por la misma literal
+    # procedimiento comparten el contador). Al llegar a threshold el cuerpo se compila
+    # con lpp.closures y se guarda en el cuerpo (Block.cache): las llamadas siguientes
+    # usan la versión compilada, y el código compilado la llama directamente sin pasar
+    # por el hook (ver lpp.closures.apply_compiled_function). Si la compilación falla
+    # el procedimiento se queda en el evaluador de árbol. Como el código queda en el
+    # árbol, otro Tiering que corra el mismo programa lo usa desde la primera llamada
+    # y solo registra la promoción
+
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.promotions: List[Promotion] = []
+
+        self._calls: Dict[ast.Block, int] = {}
+        self._failed: Set[ast.Block] = set()
+        self._start = perf_counter()
+        self._previous_hook: Any = None
+
+    def __enter__(self) -> 'Tiering':
+        self._previous_hook = evaluator.call_hook
+        evaluator.call_hook = self.apply
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        evaluator.call_hook = self._previous_hook
+
+    def run(self, program: ast.Program, env: Environment) -> Optional[Object]:
+        with self:
+            return evaluate(program, env)
+
+    def apply(self, fn: Function, args: List[Object]) -> Object:
+        # El mismo ciclo que call_function: la llamada de un regresa (TailCall) se hace
+        # aquí, sin crecer la pila de Python, en cualquiera de los dos niveles
+        while True:
+            body = fn.body
+
+            code = body.cache
+            if code is None:
+                calls = self._calls.get(body, 0) + 1
+                self._calls[body] = calls
+
+                if calls >= self.threshold and body not in self._failed:
+                    code = self._promote(fn, calls)
+            elif body not in self._calls:
+                self._calls[body] = 1
+                self._record(fn, 1, True, True)
+
+            extended_environment = extend_function_environment(fn, args)
+            evaluated = evaluate(body, extended_environment) if code is None else code(extended_environment)
+            extended_environment.release()
+
+            assert evaluated is not None
+            result = unwrap_return_value(evaluated)
+
+            if type(result) is not TailCall:
+                return result
+
+            tail_call = cast(TailCall, result)
+            if not isinstance(tail_call.fn, Function):
+                return apply_function(tail_call.fn, tail_call.args)
+
+            fn, args = cast(Function, tail_call.fn), tail_call.args
+
+    def calls(self, fn: Function) -> int:
+        return self._calls.get(fn.body, 0)
+
+    def report(self) -> str:
+        lines: List[str] = [f'{len(self.promotions)} procedimientos promovidos (umbral {self.threshold})']
+        for promotion in self.promotions:
+            if promotion.reused:
+                status = 'ya compilado'
+            else:
+                status = 'compilado' if promotion.compiled else 'falló la compilación'
+            lines.append(f'  {promotion.function} en la posición {promotion.position}: '
+                         f'{status} tras {promotion.calls} llamadas a los {promotion.seconds * 1000:.1f} ms')
+
+        return '\n'.join(lines)
+
+    def _promote(self, fn: Function, calls: int) -> Optional[Code]:
+        code: Optional[Code]
+        try:
+            code = compile_node(fn.body)
+        except Exception:
+            code = None
+
+        self._record(fn, calls, code is not None)
+
+        if code is None:
+            self._failed.add(fn.body)
+        else:
+            fn.body.cache = code
+
+        return code
+
+    def _record(self, fn: Function, calls: int, compiled: bool, reused: bool = False) -> None:
+        parameters = ', '.join(parameter.value for parameter in fn.parameters)
+        self.promotions.append(Promotion(function=f'procedimiento({parameters})',
+                                         position=fn.body.position,
+                                         calls=calls,
+                                         seconds=perf_counter() - self._start,
+                                         compiled=compiled,
+                                         reused=reused))
@@ -1,3 +1,4 @@
+from array import array
 from enum import (
     auto, # nos permite que automaticamente se asigne un valor al enum
     Enum,
@@ -6,7 +7,11 @@ from enum import (
 
 from typing import (
     Dict,
-    NamedTuple
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple
 )
 
 @unique
@@ -49,18 +54,85 @@ class Token(NamedTuple):
         return f'Type: {self.token_type}, Literal: {self.literal}'
 
 
-def lookup_token_type(literal: str) -> TokenType:
+# Los valores de TokenType son enteros pequeños (auto() empieza en 1), así que
+# caben en un byte y se pueden usar como índice de esta tabla
+_TOKEN_TYPES: List[TokenType] = [TokenType.ILLEGAL] + list(TokenType)
+
+
+class TokenBuffer:
+
+    def __init__(self,
+                source: str,
+                token_types: 'array[int]',
+                starts: 'array[int]',
+                ends: 'array[int]',
+                identifiers: Optional[Dict[str, str]] = None) -> None:
+        # En lugar de un Token por elemento guardamos el tipo como un byte y la
+        # literal como un rango (inicio, fin) dentro de la fuente
+        self._source = source
+        self._token_types = token_types
+        self._starts = starts
+        self._ends = ends
+        self._identifiers: Dict[str, str] = identifiers if identifiers is not None else {}
+        self._cursor = 0
+        self._token_start = 0
+
+    def __len__(self) -> int:
+        return len(self._token_types)
+
+    def __getitem__(self, index: int) -> Token:
+        return Token(self.token_type(index), self.literal(index))
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def token_type(self, index: int) -> TokenType:
+        return _TOKEN_TYPES[self._token_types[index]]
+
+    def literal(self, index: int) -> str:
+        literal = self._source[self._starts[index]:self._ends[index]]
+
+        if self._token_types[index] in _INTERNED_TOKEN_TYPES:
+            return self._identifiers.setdefault(literal, literal)
+
+        return literal
 
-    # Una variable keyword que es un diccionario que tiene como llaves strngs y como valores TokenType
-    keywords: Dict[str, TokenType] = {
-        'falso': TokenType.FALSE,
-        'procedimiento': TokenType.FUNCTION,
-        'regresa': TokenType.RETURN,
-        'si': TokenType.IF,
-        'si_no': TokenType.ELSE,
-        'variable': TokenType.LET,
-        'verdadero': TokenType.TRUE
-    }
+    def span(self, index: int) -> Tuple[int, int]:
+        return self._starts[index], self._ends[index]
 
+    # Permite que el Parser lea directamente del buffer como si fuera un Lexer
+    def next_token(self) -> Token:
+        token = self[self._cursor]
+        self._token_start = self._starts[self._cursor]
+        if self._cursor < len(self) - 1:
+            self._cursor += 1
+
+        return token
+
+    @property
+    def token_start(self) -> int:
+        return self._token_start
+
+    def rewind(self) -> None:
+        self._cursor = 0
+
+
+# Un diccionario que tiene como llaves strings (las palabras reservadas) y como valores TokenType
+KEYWORDS: Dict[str, TokenType] = {
+    'falso': TokenType.FALSE,
+    'procedimiento': TokenType.FUNCTION,
+    'regresa': TokenType.RETURN,
+    'si': TokenType.IF,
+    'si_no': TokenType.ELSE,
+    'variable': TokenType.LET,
+    'verdadero': TokenType.TRUE
+}
+
+
+def lookup_token_type(literal: str) -> TokenType:
     # Miramos si es una palabra reservada de nuestro lenguaje, si no lo es, entonces es un identificadir (un nombre de variable p.ej)
-    return keywords.get(literal, TokenType.IDENT)
\ No newline at end of file
+    return KEYWORDS.get(literal, TokenType.IDENT)
+
+
+_INTERNED_TOKEN_TYPES = frozenset([TokenType.IDENT.value, *[token_type.value for token_type in KEYWORDS.values()]])
\ No newline at end of file
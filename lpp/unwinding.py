@@ -0,0 +1,256 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+)
+
+import lpp.ast as ast
+from lpp.capture import free_variables
+from lpp.evaluator import (
+    apply_function,
+    evaluate_boolean,
+    evaluate_identifier,
+    evaluate_infix_expression,
+    evaluate_integer,
+    evaluate_prefix_expression,
+    evaluate_string,
+    extend_function_environment,
+    is_truthy,
+    new_error,
+    NOT_A_FUNCTION,
+    NULL,
+)
+from lpp.object import (
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Object,
+    Return,
+)
+
+
+# Evaluación en la que regresa y los errores que detienen un bloque salen con una
+# excepción hasta el procedimiento o el programa que los atrapa, en lugar de revisar el
+# resultado de cada sentencia y envolver cada valor de regresa en un Return.
+#
+# Dentro de una expresión los errores siguen siendo valores, igual que en
+# lpp.evaluator: solo una sentencia de expresión cuyo valor es un Error lanza
+# _ErrorSignal. Un si usado como valor (operando, argumento, valor de una variable...)
+# convierte las señales de su bloque en el Return o el Error que habría producido el
+# evaluador recursivo.
+
+
+class _ReturnSignal(Exception):
+    __slots__ = ('value',)
+
+    def __init__(self, value: Object) -> None:
+        self.value = value
+
+
+class _ErrorSignal(Exception):
+    __slots__ = ('error',)
+
+    def __init__(self, error: Error) -> None:
+        self.error = error
+
+
+Evaluator = Callable[[Any, Environment], Optional[Object]]
+
+
+def evaluate_unwinding(program: ast.Program, env: Environment) -> Optional[Object]:
+    result: Optional[Object] = None
+
+    try:
+        for statement in program.statements:
+            result = _evaluate(statement, env)
+    except _ReturnSignal as signal:
+        return signal.value
+    except _ErrorSignal as signal:
+        return signal.error
+
+    return result
+
+
+def _evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
+    try:
+        evaluator = _EVALUATORS[type(node)]
+    except KeyError:
+        return None
+
+    return evaluator(node, env)
+
+
+def _value(node: ast.ASTNode, env: Environment) -> Optional[Object]:
+    # Evalúa un nodo cuyo resultado se usa como valor
+    try:
+        evaluator = _VALUE_EVALUATORS[type(node)]
+    except KeyError:
+        return None
+
+    return evaluator(node, env)
+
+
+def _evaluate_expression_statement(node: ast.ExpressionStatement, env: Environment) -> Optional[Object]:
+    assert node.expression is not None
+    result = _evaluate(node.expression, env)
+
+    if type(result) is Error:
+        raise _ErrorSignal(result)  # type: ignore
+    elif type(result) is Return:
+        # Un Return que quedó guardado como valor (p.ej. variable x = si (c) { regresa 1 })
+        raise _ReturnSignal(result._value)  # type: ignore
+
+    return result
+
+
+def _evaluate_block(block: ast.Block, env: Environment) -> Optional[Object]:
+    result: Optional[Object] = None
+
+    for statement in block.statements:
+        result = _evaluate(statement, env)
+
+    return result
+
+
+def _evaluate_return(node: ast.ReturnStatement, env: Environment) -> Optional[Object]:
+    assert node.return_value is not None
+    value = _value(node.return_value, env)
+
+    assert value is not None
+    raise _ReturnSignal(value)
+
+
+def _evaluate_let(node: ast.LetStatement, env: Environment) -> Optional[Object]:
+    assert node.name is not None and node.value is not None
+    env[node.name.value] = _value(node.value, env)
+
+    return None
+
+
+def _evaluate_prefix(node: ast.Prefix, env: Environment) -> Optional[Object]:
+    assert node.right is not None
+    right = _value(node.right, env)
+
+    assert right is not None
+    return evaluate_prefix_expression(node.operator, right)
+
+
+def _evaluate_infix(node: ast.Infix, env: Environment) -> Optional[Object]:
+    assert node.left is not None and node.right is not None
+    left = _value(node.left, env)
+    right = _value(node.right, env)
+
+    assert left is not None and right is not None
+    return evaluate_infix_expression(node.operator, left, right)
+
+
+def _evaluate_if(node: ast.If, env: Environment) -> Optional[Object]:
+    assert node.condition is not None
+    condition = _value(node.condition, env)
+
+    assert condition is not None
+    if is_truthy(condition):
+        assert node.consequence is not None
+        return _evaluate_block(node.consequence, env)
+    elif node.alternative is not None:
+        return _evaluate_block(node.alternative, env)
+
+    return NULL
+
+
+def _evaluate_if_value(node: ast.If, env: Environment) -> Optional[Object]:
+    try:
+        return _evaluate_if(node, env)
+    except _ReturnSignal as signal:
+        return Return(signal.value)
+    except _ErrorSignal as signal:
+        return signal.error
+
+
+def _evaluate_function(node: ast.Function, env: Environment) -> Optional[Object]:
+    assert node.body is not None
+    env.capture(free_variables(node))
+
+    return Function(node.parameters, node.body, env)
+
+
+def _evaluate_call(node: ast.Call, env: Environment) -> Optional[Object]:
+    function = _value(node.function, env)
+
+    assert node.arguments is not None
+    args: List[Object] = []
+    for argument in node.arguments:
+        evaluated = _value(argument, env)
+
+        assert evaluated is not None
+        args.append(evaluated)
+
+    assert function is not None
+    if type(function) is Function:
+        return _call(function, args)  # type: ignore
+    elif isinstance(function, Function) or type(function) is Builtin:
+        return apply_function(function, args)
+
+    return new_error(NOT_A_FUNCTION, [function.type().name])
+
+
+def _call(function: Function, args: List[Object]) -> Optional[Object]:
+    extended_environment = extend_function_environment(function, args)
+
+    result: Optional[Object]
+    try:
+        result = _evaluate_tail(function.body.statements, extended_environment)
+    except _ReturnSignal as signal:
+        result = signal.value
+    except _ErrorSignal as signal:
+        result = signal.error
+
+    extended_environment.release()
+    return result
+
+
+def _evaluate_tail(statements: List[ast.Statement], env: Environment) -> Optional[Object]:
+    # La última sentencia de un procedimiento no necesita lanzar una señal: su valor
+    # ya es el resultado de la llamada
+    result: Optional[Object] = None
+
+    for index in range(len(statements) - 1):
+        result = _evaluate(statements[index], env)
+
+    if not statements:
+        return result
+
+    last = statements[-1]
+    if type(last) is ast.ReturnStatement:
+        return _value(last.return_value, env)  # type: ignore
+    elif type(last) is ast.ExpressionStatement:
+        result = _evaluate(last.expression, env)  # type: ignore
+
+        return result._value if type(result) is Return else result  # type: ignore
+
+    return _evaluate(last, env)
+
+
+_EVALUATORS: Dict[Type[ast.ASTNode], Evaluator] = {
+    ast.ExpressionStatement: _evaluate_expression_statement,
+    ast.Integer: evaluate_integer,
+    ast.Boolean: evaluate_boolean,
+    ast.Prefix: _evaluate_prefix,
+    ast.Infix: _evaluate_infix,
+    ast.Block: _evaluate_block,
+    ast.If: _evaluate_if,
+    ast.ReturnStatement: _evaluate_return,
+    ast.LetStatement: _evaluate_let,
+    ast.Identifier: evaluate_identifier,
+    ast.Function: _evaluate_function,
+    ast.Call: _evaluate_call,
+    ast.StringLiteral: evaluate_string,
+}
+
+# Como valor, un si atrapa las señales de su bloque
+_VALUE_EVALUATORS: Dict[Type[ast.ASTNode], Evaluator] = dict(_EVALUATORS)
+_VALUE_EVALUATORS[ast.If] = _evaluate_if_value
@@ -0,0 +1,202 @@
+from array import array
+from operator import (
+    add,
+    eq,
+    floordiv,
+    gt,
+    lt,
+    mul,
+    ne,
+    sub,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from lpp.builtins import BUILTINS
+from lpp.capture import free_variables
+from lpp.compiler import (
+    BytecodeFunction,
+    CodeObject,
+    OpCode,
+)
+from lpp.evaluator import (
+    apply_function,
+    evaluate_bang_operator_expression,
+    evaluate_infix_expression,
+    evaluate_minus_operator_expression,
+    new_error,
+    NOT_A_FUNCTION,
+    to_boolean_object,
+    UNKNOW_IDENTIFIER,
+    FALSE,
+    NULL,
+    TRUE,
+)
+from lpp.object import (
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Integer,
+    new_integer,
+    Object,
+    Return,
+)
+
+
+# Los códigos de operación como enteros simples para que las comparaciones del ciclo
+# principal no pasen por IntEnum
+_CONSTANT: int = OpCode.CONSTANT.value
+_TRUE: int = OpCode.TRUE.value
+_FALSE: int = OpCode.FALSE.value
+_NULL: int = OpCode.NULL.value
+_NONE: int = OpCode.NONE.value
+_POP: int = OpCode.POP.value
+_ADD: int = OpCode.ADD.value
+_NE: int = OpCode.NE.value
+_MINUS: int = OpCode.MINUS.value
+_BANG: int = OpCode.BANG.value
+_JUMP: int = OpCode.JUMP.value
+_JUMP_IF_FALSY: int = OpCode.JUMP_IF_FALSY.value
+_JUMP_IF_STOP: int = OpCode.JUMP_IF_STOP.value
+_GET_NAME: int = OpCode.GET_NAME.value
+_SET_NAME: int = OpCode.SET_NAME.value
+_FUNCTION: int = OpCode.FUNCTION.value
+_CALL: int = OpCode.CALL.value
+_RETURN_VALUE: int = OpCode.RETURN_VALUE.value
+_LEAVE: int = OpCode.LEAVE.value
+_HALT: int = OpCode.HALT.value
+
+# Operaciones infijas (de ADD a NE): la operación entre enteros, cómo se envuelve el
+# resultado y el operador para el caso general
+_INFIX_OPERATIONS: Dict[int, Tuple[Callable[[int, int], Any], Callable[[Any], Object], str]] = {
+    OpCode.ADD.value: (add, new_integer, '+'),
+    OpCode.SUB.value: (sub, new_integer, '-'),
+    OpCode.MUL.value: (mul, new_integer, '*'),
+    OpCode.DIV.value: (floordiv, new_integer, '/'),
+    OpCode.LT.value: (lt, to_boolean_object, '<'),
+    OpCode.GT.value: (gt, to_boolean_object, '>'),
+    OpCode.EQ.value: (eq, to_boolean_object, '=='),
+    OpCode.NE.value: (ne, to_boolean_object, '!='),
+}
+
+Frame = Tuple['array[int]', List[Any], int, Environment]
+
+
+class VirtualMachine:
+
+    def __init__(self, code: CodeObject, env: Environment) -> None:
+        self._code = code
+        self._env = env
+
+    def run(self) -> Optional[Object]:
+        stack: List[Any] = []
+        frames: List[Frame] = []
+        push = stack.append
+        pop = stack.pop
+
+        instructions = self._code.instructions
+        constants = self._code.constants
+        env = self._env
+        ip = 0
+
+        while True:
+            opcode = instructions[ip]
+            ip += 2
+
+            if opcode == _GET_NAME:
+                name = constants[instructions[ip - 1]]
+                try:
+                    push(env[name])
+                except KeyError:
+                    push(BUILTINS.get(name, new_error(UNKNOW_IDENTIFIER, [name])))
+            elif opcode == _CONSTANT:
+                push(constants[instructions[ip - 1]])
+            elif _ADD <= opcode <= _NE:
+                right = pop()
+                left = pop()
+                operation, wrap, operator = _INFIX_OPERATIONS[opcode]
+
+                if type(left) is Integer and type(right) is Integer:
+                    push(wrap(operation(left._value, right._value)))
+                else:
+                    push(evaluate_infix_expression(operator, left, right))
+            elif opcode == _JUMP_IF_FALSY:
+                condition = pop()
+                if condition is NULL or condition is FALSE:
+                    ip = instructions[ip - 1]
+            elif opcode == _JUMP_IF_STOP:
+                if type(stack[-1]) is Return or type(stack[-1]) is Error:
+                    ip = instructions[ip - 1]
+            elif opcode == _POP:
+                pop()
+            elif opcode == _CALL:
+                count = instructions[ip - 1]
+                args = stack[len(stack) - count:]
+                del stack[len(stack) - count:]
+                function = pop()
+
+                if type(function) is BytecodeFunction:
+                    frames.append((instructions, constants, ip, env))
+
+                    code = function.code
+                    env = Environment(outer=function.env)
+                    for index, parameter in enumerate(code.parameters):
+                        env[parameter] = args[index]
+
+                    instructions = code.instructions
+                    constants = code.constants
+                    ip = 0
+                elif type(function) is Builtin:
+                    push(function.fn(*args))
+                elif type(function) is Function:
+                    push(apply_function(function, args))
+                else:
+                    push(new_error(NOT_A_FUNCTION, [function.type().name]))
+            elif opcode == _LEAVE:
+                if type(stack[-1]) is Return:
+                    stack[-1] = stack[-1]._value
+
+                env.release()
+                instructions, constants, ip, env = frames.pop()
+            elif opcode == _RETURN_VALUE:
+                push(Return(pop()))
+            elif opcode == _JUMP:
+                ip = instructions[ip - 1]
+            elif opcode == _TRUE:
+                push(TRUE)
+            elif opcode == _FALSE:
+                push(FALSE)
+            elif opcode == _NULL:
+                push(NULL)
+            elif opcode == _NONE:
+                push(None)
+            elif opcode == _MINUS:
+                right = pop()
+                if type(right) is Integer:
+                    push(new_integer(-right._value))
+                else:
+                    push(evaluate_minus_operator_expression(right))
+            elif opcode == _BANG:
+                push(evaluate_bang_operator_expression(pop()))
+            elif opcode == _SET_NAME:
+                env[constants[instructions[ip - 1]]] = pop()
+                push(None)
+            elif opcode == _FUNCTION:
+                function_code = constants[instructions[ip - 1]]
+                env.capture(free_variables(function_code.node))
+                push(BytecodeFunction(function_code, env))
+            elif opcode == _HALT:
+                result = pop()
+                if type(result) is Return:
+                    return result._value
+
+                return result
+            else:
+                raise ValueError(f'Código de operación desconocido: {opcode}')
@@ -1,9 +1,114 @@
+from argparse import ArgumentParser
+from sys import stderr
+from typing import Optional
+
+from lpp import __version__
+from lpp.cache import (
+    ASTCache,
+    DEFAULT_CACHE_DIRECTORY,
+)
+from lpp.codegen import emit_python
+from lpp.engine import (
+    Engine,
+    execute,
+)
+from lpp.inference import infer_types
+from lpp.object import Environment
+from lpp.optimizer import (
+    DEFAULT_INLINE_THRESHOLD,
+    optimize,
+)
 from lpp.repl import start_repl
+from lpp.tiering import (
+    DEFAULT_THRESHOLD,
+    Tiering,
+)
+
+
+def run_file(file_path: str,
+             cache: ASTCache,
+             engine: Engine = Engine.TREE,
+             python_source: bool = False,
+             tiering: Optional[Tiering] = None,
+             optimized: bool = False,
+             inline_threshold: int = DEFAULT_INLINE_THRESHOLD) -> None:
+    with open(file_path, encoding='utf-8') as source_file:
+        source = source_file.read()
+
+    program, errors = cache.parse(source)
+    if errors:
+        for error in errors:
+            print(error, file=stderr)
+
+        return
+
+    if optimized:
+        program = optimize(program, inline_threshold)
+        infer_types(program)
+
+    if python_source:
+        print(emit_python(program))
+
+        return
+
+    if engine == Engine.PYTHON and not optimized:
+        # El código en cache corresponde al árbol sin optimizar
+        evaluated = cache.python_program(source, program).run()
+    elif engine == Engine.TIERED and tiering is not None:
+        evaluated = tiering.run(program, Environment())
+    else:
+        evaluated = execute(program, Environment(), engine)
+
+    if evaluated is not None:
+        print(evaluated.inspect())
+
 
 def main() -> None:
-    print('LPP 0.0.1')
-    start_repl()
+    argument_parser = ArgumentParser(description='Lenguaje de Programación Platzi')
+    argument_parser.add_argument('file', nargs='?', help='programa .lpp a ejecutar')
+    argument_parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIRECTORY,
+                                 help='directorio del cache de árboles sintácticos')
+    argument_parser.add_argument('--cache-stats', action='store_true',
+                                 help='imprime los aciertos y fallos del cache')
+    argument_parser.add_argument('--engine', choices=[engine.value for engine in Engine],
+                                 default=Engine.TREE.value,
+                                 help='motor de ejecución')
+    argument_parser.add_argument('--emit-python', action='store_true',
+                                 help='imprime el código de Python generado en lugar de ejecutar')
+    argument_parser.add_argument('-O', '--optimize', action='store_true',
+                                 help='pliega constantes, elimina código muerto y especializa operaciones antes de ejecutar')
+    argument_parser.add_argument('--inline-threshold', type=int, default=DEFAULT_INLINE_THRESHOLD,
+                                 help='nodos máximos de un procedimiento que se expande en sus llamadas (con -O)')
+    argument_parser.add_argument('--tiering-threshold', type=int, default=DEFAULT_THRESHOLD,
+                                 help='llamadas antes de compilar un procedimiento (motor niveles)')
+    argument_parser.add_argument('--tiering-stats', action='store_true',
+                                 help='imprime los procedimientos promovidos (motor niveles)')
+    arguments = argument_parser.parse_args()
+
+    if arguments.file is None:
+        print(f'LPP {__version__}')
+        start_repl()
+
+        return
+
+    cache = ASTCache(arguments.cache_dir)
+    tiering = Tiering(arguments.tiering_threshold)
+    run_file(arguments.file,
+             cache,
+             Engine(arguments.engine),
+             arguments.emit_python,
+             tiering,
+             arguments.optimize,
+             arguments.inline_threshold)
+
+    if arguments.cache_stats:
+        print(f'cache: {cache.hits} aciertos, {cache.misses} fallos', file=stderr)
+        if cache.python_hits or cache.python_misses:
+            print(f'cache de Python: {cache.python_hits} aciertos, {cache.python_misses} fallos', file=stderr)
+
+    if arguments.tiering_stats:
+        print(tiering.report(), file=stderr)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,111 @@
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+from unittest import TestCase
+
+from lpp.arena import (
+    Arena,
+    ArenaFunction,
+    evaluate_arena,
+)
+from lpp.ast import Program
+from lpp.evaluator import evaluate
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.parser import (
+    IterativeParser,
+    Parser,
+)
+
+
+class ArenaTest(TestCase):
+
+    def test_round_trip(self) -> None:
+        for source in self._sources():
+            program: Program = Parser(Lexer(source)).parse_program()
+            arena = Arena.from_program(program)
+
+            self.assertEquals(str(arena.to_program()), str(program))
+            self.assertEquals(str(Arena.from_bytes(arena.to_bytes()).to_program()), str(program))
+
+    def test_positions_and_literals(self) -> None:
+        program: Program = Parser(Lexer('variable x = 5; x + x + 5;')).parse_program()
+        arena = Arena.from_program(program)
+
+        self.assertEquals(arena.root, len(arena) - 1)
+        self.assertEquals(sorted(arena.literals, key=str), ['+', 5, 'x'])
+
+        restored = arena.to_program()
+        self.assertEquals([statement.position for statement in restored.statements],
+                          [statement.position for statement in program.statements])
+
+    def test_deep_program(self) -> None:
+        depth: int = 50_000
+        program: Program = IterativeParser(Lexer('-' * depth + '1;')).parse_program()
+
+        arena = Arena.from_program(program)
+        restored = Arena.from_bytes(arena.to_bytes()).to_program()
+
+        self.assertEquals(len(arena), depth + 3)
+        self.assertEquals(len(restored.statements), 1)
+
+    def test_evaluation(self) -> None:
+        for source in self._sources():
+            program: Program = Parser(Lexer(source)).parse_program()
+
+            expected: Optional[Object] = evaluate(program, Environment())
+            evaluated: Optional[Object] = evaluate_arena(Arena.from_program(program), Environment())
+
+            self.assertEquals(self._inspect(evaluated), self._inspect(expected))
+
+    def test_function_object(self) -> None:
+        source: str = 'procedimiento(x, y) { regresa x + y; };'
+        arena = Arena.from_program(Parser(Lexer(source)).parse_program())
+
+        evaluated = evaluate_arena(arena, Environment())
+
+        self.assertIsInstance(evaluated, ArenaFunction)
+        assert isinstance(evaluated, ArenaFunction)
+        self.assertEquals([str(parameter) for parameter in evaluated.parameters], ['x', 'y'])
+        self.assertEquals(str(evaluated.body), 'regresa (x + y);')
+
+    def test_functions_from_another_arena(self) -> None:
+        env = Environment()
+        definitions = Arena.from_program(Parser(Lexer('variable suma = procedimiento(x, y) { x + y };')).parse_program())
+        evaluate_arena(definitions, env)
+
+        calls = Arena.from_program(Parser(Lexer('variable z = 10; suma(z, 5) * 2;')).parse_program())
+        evaluated = evaluate_arena(calls, env)
+
+        self.assertEquals(self._inspect(evaluated), ('INTEGER', '30'))
+
+    def _inspect(self, evaluated: Optional[Object]) -> Optional[Tuple[str, str]]:
+        if evaluated is None:
+            return None
+
+        return evaluated.type().name, evaluated.inspect()
+
+    def _sources(self) -> List[str]:
+        return [
+            '',
+            '5 + 5 * 2 - -3;',
+            '"Hola" + " " + "mundo!";',
+            '!verdadero == falso; 1 < 2 != (3 > 4);',
+            'variable x = 5; regresa x * 2; 9;',
+            'si (10 > 1) { si (verdadero) { regresa 10; } regresa 1; }',
+            'si (1 > 2) { 10 } si_no { 20 };',
+            'si (falso) { 10 };',
+            '5 + verdadero; 5;',
+            '-verdadero;',
+            'foobar;',
+            'longitud("cuatro");',
+            'variable identidad = procedimiento(x) { x; }; identidad(5);',
+            'variable doble = procedimiento(x) { regresa x * 2; }; doble(5);',
+            'procedimiento(x) { x; }(5)',
+            '5();',
+        ]
@@ -66,4 +66,16 @@ class ASTTest(TestCase):
 
         program_str = str(program)
 
-        self.assertEquals(program_str, 'variable cinco = 5;')
\ No newline at end of file
+        self.assertEquals(program_str, 'variable cinco = 5;')
+
+    def test_nodes_use_slots(self) -> None:
+        identifier: Identifier = Identifier(
+            token=Token(TokenType.IDENT, literal='cinco'),
+            value='cinco',
+            position=9
+        )
+
+        self.assertFalse(hasattr(identifier, '__dict__'))
+        self.assertFalse(hasattr(identifier, 'token'))
+        self.assertEquals(identifier.position, 9)
+        self.assertEquals(identifier.token_literal(), 'cinco')
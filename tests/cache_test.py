@@ -0,0 +1,138 @@
+from os import listdir
+from tempfile import TemporaryDirectory
+from typing import (
+    cast,
+    List,
+)
+from unittest import TestCase
+
+from lpp.ast import (
+    ExpressionStatement,
+    Infix,
+    Integer,
+    Prefix,
+    Program,
+    StringLiteral,
+)
+from lpp.cache import (
+    ASTCache,
+    dump_program,
+    load_program,
+)
+from lpp.evaluator import (
+    evaluate_integer,
+    evaluate_string,
+)
+from lpp.lexer import Lexer
+from lpp.object import Environment
+from lpp.parser import (
+    IterativeParser,
+    Parser,
+)
+
+
+class CacheTest(TestCase):
+
+    def test_serialization_round_trip(self) -> None:
+        sources: List[str] = [
+            '',
+            'variable x = 5; regresa x;',
+            '''
+                variable suma = procedimiento(x, y) {
+                    regresa x + y * -(x - 1);
+                };
+                si (suma(1, 2) > !verdadero) { 10 } si_no { suma(suma(1, 2), 3) };
+                procedimiento() { regresa falso == (5 < 4); }();
+            ''',
+        ]
+
+        for source in sources:
+            program: Program = Parser(Lexer(source)).parse_program()
+            loaded: Program = load_program(dump_program(program))
+
+            self.assertEquals(str(loaded), str(program))
+            self.assertEquals(dump_program(loaded), dump_program(program))
+
+    def test_loaded_literals_are_pooled(self) -> None:
+        program: Program = Parser(Lexer('"a" + "a"; -7;')).parse_program()
+        loaded: Program = load_program(dump_program(program))
+
+        strings = cast(Infix, cast(ExpressionStatement, loaded.statements[0]).expression)
+        left = cast(StringLiteral, strings.left)
+        assert left.cache is not None
+        self.assertEquals(left.cache.inspect(), 'a')
+        self.assertIs(left.cache, cast(StringLiteral, strings.right).cache)
+        self.assertIsNone(strings.cache)
+
+        # Evaluar una literal regresa el objeto del programa
+        self.assertIs(evaluate_string(left, Environment()), left.cache)
+
+        minus = cast(Prefix, cast(ExpressionStatement, loaded.statements[1]).expression)
+        seven = cast(Integer, minus.right)
+        assert seven.cache is not None
+        self.assertEquals(seven.cache.inspect(), '7')
+        self.assertIs(evaluate_integer(seven, Environment()), seven.cache)
+
+    def test_deep_program(self) -> None:
+        depth: int = 50_000
+        program: Program = IterativeParser(Lexer('-' * depth + '1;')).parse_program()
+
+        loaded: Program = load_program(dump_program(program))
+
+        expression = cast(ExpressionStatement, loaded.statements[0])
+        self.assertIsInstance(expression, ExpressionStatement)
+
+        nesting: int = 0
+        node = expression.expression
+        while isinstance(node, Prefix):
+            node = node.right
+            nesting += 1
+
+        self.assertEquals(nesting, depth)
+
+    def test_cache_hits_and_misses(self) -> None:
+        source: str = 'variable doble = procedimiento(x) { x * 2 }; doble(5);'
+
+        with TemporaryDirectory() as directory:
+            cache = ASTCache(directory)
+
+            program, errors = cache.parse(source)
+            self.assertEquals(errors, [])
+            self.assertEquals((cache.hits, cache.misses), (0, 1))
+            self.assertEquals(len(listdir(directory)), 1)
+
+            cached_program, errors = ASTCache(directory).parse(source)
+            self.assertEquals(errors, [])
+            self.assertEquals(str(cached_program), str(program))
+
+            cache.parse(source)
+            cache.parse(source + ' ')
+            self.assertEquals((cache.hits, cache.misses), (1, 2))
+
+    def test_programs_with_errors_are_not_cached(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = ASTCache(directory)
+
+            for _ in range(2):
+                _, errors = cache.parse('variable x 5;')
+                self.assertEquals(len(errors), 1)
+
+            self.assertEquals((cache.hits, cache.misses), (0, 2))
+            self.assertEquals(listdir(directory), [])
+
+    def test_python_program_cache(self) -> None:
+        source: str = 'variable doble = procedimiento(x) { x * 2 }; doble(21);'
+
+        with TemporaryDirectory() as directory:
+            cache = ASTCache(directory)
+            program, _ = cache.parse(source)
+
+            for _ in range(2):
+                evaluated = cache.python_program(source, program).run()
+
+                assert evaluated is not None
+                self.assertEquals(evaluated.inspect(), '42')
+
+            self.assertEquals((cache.hits, cache.misses), (0, 1))
+            self.assertEquals((cache.python_hits, cache.python_misses), (1, 1))
+            self.assertEquals(len(listdir(directory)), 2)
@@ -0,0 +1,81 @@
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+from unittest import TestCase
+
+from lpp.arena import (
+    Arena,
+    ArenaFunction,
+    evaluate_arena,
+)
+from lpp.ast import (
+    ExpressionStatement,
+    Function,
+    Program,
+)
+from lpp.capture import free_variables
+from lpp.engine import (
+    Engine,
+    execute,
+)
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Function as FunctionObject,
+)
+from lpp.parser import Parser
+
+
+class CaptureTest(TestCase):
+
+    def test_free_variables(self) -> None:
+        tests: List[Tuple[str, List[str]]] = [
+            ('procedimiento(x) { x + 1 };', []),
+            ('procedimiento(x) { x + y };', ['y']),
+            ('procedimiento() { variable y = 1; y };', ['y']),
+            ('procedimiento() { variable y = z; };', ['z']),
+            ('procedimiento(x) { procedimiento(y) { x + y + z } };', ['z']),
+            ('procedimiento(x) { si (a) { regresa b; } si_no { c(x, d) } };', ['a', 'b', 'c', 'd']),
+        ]
+
+        for source, expected in tests:
+            program: Program = Parser(Lexer(source)).parse_program()
+            function = cast(Function, cast(ExpressionStatement, program.statements[0]).expression)
+
+            self.assertEquals(sorted(free_variables(function)), expected)
+            self.assertIs(function.cache, free_variables(function))
+
+            arena = Arena.from_program(program)
+            self.assertEquals(sorted(arena.free_variables(arena.first[arena.root - 1])), expected)
+
+    def test_closures_retain_free_variables(self) -> None:
+        source: str = '''
+            variable crea = procedimiento(n) {
+                variable mensaje = "una cadena que nadie vuelve a leer";
+                variable doble = n * 2;
+                procedimiento(x) { x + doble };
+            };
+            crea(5);
+        '''
+
+        for engine in [Engine.TREE, Engine.CLOSURES, Engine.BYTECODE, Engine.ITERATIVE, Engine.UNWINDING]:
+            program: Program = Parser(Lexer(source)).parse_program()
+            closure = execute(program, Environment(), engine)
+
+            self.assertIsInstance(closure, FunctionObject)
+            self.assertEquals(sorted(cast(FunctionObject, closure).env._store), ['doble'])
+
+        arena = Arena.from_program(Parser(Lexer(source)).parse_program())
+        closure = evaluate_arena(arena, Environment())
+
+        self.assertIsInstance(closure, ArenaFunction)
+        self.assertEquals(sorted(cast(ArenaFunction, closure).env._store), ['doble'])
+
+    def test_program_environment_is_kept(self) -> None:
+        env = Environment()
+        program: Program = Parser(Lexer('variable a = 1; variable f = procedimiento() { 2 };')).parse_program()
+        execute(program, env, Engine.TREE)
+
+        self.assertEquals(sorted(env._store), ['a', 'f'])
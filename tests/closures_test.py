@@ -0,0 +1,47 @@
+from typing import Optional
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from lpp.ast import Program
+from lpp.closures import (
+    compile_program,
+    CompiledFunction,
+)
+from lpp.engine import Engine
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.parser import Parser
+
+
+class ClosuresEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: Engine = Engine.CLOSURES
+
+
+class ClosuresTest(TestCase):
+
+    def test_compile_once_run_many(self) -> None:
+        source: str = 'variable doble = procedimiento(x) { x * 2 }; doble(doble(3));'
+        program: Program = Parser(Lexer(source)).parse_program()
+
+        code = compile_program(program)
+
+        for _ in range(3):
+            evaluated: Optional[Object] = code(Environment())
+
+            assert evaluated is not None
+            self.assertEquals(evaluated.inspect(), '12')
+
+    def test_function_object(self) -> None:
+        source: str = 'procedimiento(x, y) { x + y };'
+        program: Program = Parser(Lexer(source)).parse_program()
+
+        evaluated = compile_program(program)(Environment())
+
+        self.assertIsInstance(evaluated, CompiledFunction)
+        assert isinstance(evaluated, CompiledFunction)
+        self.assertEquals(evaluated.names, ['x', 'y'])
+        self.assertEquals(str(evaluated.body), '(x + y)')
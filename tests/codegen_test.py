@@ -0,0 +1,97 @@
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from lpp.ast import Program
+from lpp.codegen import (
+    compile_python,
+    emit_python,
+    PythonFunction,
+    PythonProgram,
+)
+from lpp.engine import Engine
+from lpp.evaluator import evaluate
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.parser import Parser
+
+
+class PythonEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: Engine = Engine.PYTHON
+
+
+class CodegenTest(TestCase):
+
+    def test_same_results_as_evaluator(self) -> None:
+        sources: List[str] = [
+            '0; si (0) { 1 } si_no { 2 };',
+            'si ("") { 1 };',
+            '!0; !nulo; -(-5);',
+            '1 == verdadero; 1 != verdadero; verdadero == verdadero; "a" == "a"; "a" != "b";',
+            '5 / 2; -7 / 2;',
+            '"a" < "b";',
+            'variable x = 5 + verdadero; x; 10;',
+            'variable x = si (verdadero) { regresa 3; }; x; 10;',
+            'variable x = 1; variable f = procedimiento() { variable y = x; variable x = 2; y + x }; f();',
+            'variable f = procedimiento() { g() }; f();',
+            'variable f = procedimiento(x) { x }; f(1, 2, 3);',
+            'variable f = procedimiento() { 1 }; f(1, 2);',
+            'procedimiento(x, x) { x }(1, 2);',
+            'variable f = procedimiento(x) { si (x > 1) { variable a = 10; a } si_no { 0 } }; f(2) + f(1);',
+            'variable x = si (verdadero) { variable a = 2; variable b = a * 3; b } si_no { 1 }; x;',
+            'variable f = procedimiento() { 5 + falso; 1 }; f();',
+            'variable f = procedimiento() { si (verdadero) { 5 + falso; 1 } 2 }; f();',
+            'longitud("hola") + 1; longitud(1);',
+            'variable l = longitud; l("abc");',
+            '1(2);',
+            'variable f = procedimiento(x) { procedimiento(y) { x * y } }; f(3)(4);',
+        ]
+
+        for source in sources:
+            program: Program = Parser(Lexer(source)).parse_program()
+
+            expected = evaluate(program, Environment())
+            generated = compile_python(program).run()
+
+            self.assertEquals(self._inspect(generated), self._inspect(expected), source)
+
+    def test_function_result(self) -> None:
+        program: Program = Parser(Lexer('procedimiento(x, y) { x + y };')).parse_program()
+
+        evaluated = compile_python(program).run()
+
+        self.assertIsInstance(evaluated, PythonFunction)
+        self.assertEquals(evaluated.inspect(), 'procedimiento(x, y) {\n (x + y)\n}')  # type: ignore
+
+    def test_emit_python(self) -> None:
+        program: Program = Parser(Lexer('variable x = 2; x * 3;')).parse_program()
+
+        source = emit_python(program)
+
+        self.assertIn('def _programa():', source)
+        self.assertIn('x_0 = 2', source)
+        compile(source, '<lpp>', 'exec')
+
+    def test_serialization(self) -> None:
+        source: str = 'variable doble = procedimiento(x) { x * 2 }; doble;'
+        program: Program = Parser(Lexer(source)).parse_program()
+
+        loaded = PythonProgram.from_bytes(compile_python(program).to_bytes(), program)
+        evaluated = loaded.run()
+
+        self.assertIsInstance(evaluated, PythonFunction)
+        self.assertEquals(str(evaluated.body), '(x * 2)')  # type: ignore
+
+    def _inspect(self, evaluated: Optional[Object]) -> Optional[Tuple[str, str]]:
+        if evaluated is None:
+            return None
+
+        return evaluated.type().name, evaluated.inspect()
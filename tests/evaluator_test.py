@@ -10,7 +10,11 @@ from unittest import TestCase
 from lpp import parser
 
 from lpp.ast import Program
-from lpp.evaluator import NULL, evaluate
+from lpp.engine import (
+    Engine,
+    execute,
+)
+from lpp.evaluator import NULL
 from lpp.lexer import Lexer
 from lpp.object import (
     Integer,
@@ -25,7 +29,9 @@ from lpp.parser import Parser
 
 
 class EvaluatorTest(TestCase):
-    
+
+    engine: Engine = Engine.TREE
+
     def test_integer_evaluation(self) -> None:
         tests: List[Tuple[str, int]] = [
             ('5', 5),
@@ -232,6 +238,138 @@ class EvaluatorTest(TestCase):
             evaluated = self._evaluate_tests(source)
             self._test_integer_object(evaluated, expected)
 
+    def test_recursion(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('''
+                 variable factorial = procedimiento(n) {
+                     si (n < 2) {
+                         regresa 1;
+                     }
+                     regresa n * factorial(n - 1);
+                 };
+                 factorial(5);
+             ''', 120),
+            ('''
+                 variable fibonacci = procedimiento(n) {
+                     si (n < 2) {
+                         regresa n;
+                     }
+                     regresa fibonacci(n - 1) + fibonacci(n - 2);
+                 };
+                 fibonacci(15);
+             ''', 610),
+            ('''
+                 variable resta = procedimiento(x, y) {
+                     regresa x - y;
+                 };
+                 resta(10, 3);
+             ''', 7),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
+    def test_tail_calls(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('''
+                 variable suma = procedimiento(n, acc) {
+                     si (n == 0) {
+                         regresa acc;
+                     }
+                     regresa suma(n - 1, acc + n);
+                 };
+                 suma(50, 0);
+             ''', 1275),
+            ('''
+                 variable par = procedimiento(n) {
+                     si (n == 0) {
+                         regresa 1;
+                     }
+                     regresa impar(n - 1);
+                 };
+                 variable impar = procedimiento(n) {
+                     si (n == 0) {
+                         regresa 0;
+                     }
+                     regresa par(n - 1);
+                 };
+                 par(21);
+             ''', 0),
+            ('''
+                 variable medida = procedimiento(s) {
+                     regresa longitud(s);
+                 };
+                 medida("hola");
+             ''', 4),
+            ('''
+                 variable doble = procedimiento(x) { x * 2 };
+                 regresa doble(4);
+                 10;
+             ''', 8),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
+    def test_closures(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('''
+                 variable sumador = procedimiento(x) {
+                     procedimiento(y) { x + y };
+                 };
+                 variable suma_dos = sumador(2);
+                 suma_dos(3);
+             ''', 5),
+            ('''
+                 variable base = 10;
+                 variable escala = procedimiento(x) { x * base };
+                 escala(4);
+             ''', 40),
+            ('''
+                 variable crea = procedimiento(x) {
+                     variable basura = "no se usa";
+                     procedimiento(y) {
+                         variable otra = "tampoco";
+                         procedimiento(z) { x + y + z };
+                     };
+                 };
+                 crea(1)(2)(3);
+             ''', 6),
+            ('''
+                 variable crea = procedimiento(n) {
+                     variable f = procedimiento() { n };
+                     variable n = n + 1;
+                     f;
+                 };
+                 crea(1)();
+             ''', 2),
+            ('''
+                 variable crea = procedimiento() {
+                     variable suma = procedimiento(k) {
+                         si (k < 1) {
+                             regresa 0;
+                         }
+                         regresa k + suma(k - 1);
+                     };
+                     suma;
+                 };
+                 crea()(4);
+             ''', 10),
+            ('''
+                 variable x = 1;
+                 variable crea = procedimiento() { procedimiento() { x } };
+                 variable f = crea();
+                 variable x = 2;
+                 f();
+             ''', 2),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
     def test_string_evaluation(self) -> None:
         tests: List[Tuple[str, str]] = [
             ('"Hello world!"', 'Hello world!'),
@@ -260,6 +398,23 @@ class EvaluatorTest(TestCase):
             evaluated = self._evaluate_tests(source)
             self._test_string_object(evaluated, expected)
 
+    def test_operand_types_change(self) -> None:
+        # La misma expresión con operandos de distintos tipos en cada llamada
+        source: str = '''
+            variable suma = procedimiento(a, b) { a + b };
+            variable igual = procedimiento(a, b) { a == b };
+            variable x = suma(1, 2);
+            variable y = suma("a", "b");
+            variable z = si (igual(1, 1)) { igual("a", "a") };
+            variable w = si (z) { igual(verdadero, verdadero) };
+            si (w) { suma(x, y) };
+        '''
+        evaluated = self._evaluate_tests(source)
+        self._test_error_object(evaluated, 'Discrepancia de tipos: INTEGER + STRING')
+
+        evaluated = self._evaluate_tests(source.replace('suma(x, y)', 'suma(y, "c")'))
+        self._test_string_object(evaluated, 'abc')
+
     def test_string_comparison(self) -> None:
         tests: List[Tuple[str, bool]] = [
             ('"a" == "a"', True),
@@ -314,7 +469,7 @@ class EvaluatorTest(TestCase):
         program: Program = parser.parse_program()
         env: Environment = Environment()
 
-        evaluated = evaluate(program, env)
+        evaluated = execute(program, env, self.engine)
 
         assert evaluated is not None
         return evaluated
@@ -329,4 +484,39 @@ class EvaluatorTest(TestCase):
         self.assertIsInstance(evaluated, Integer)
 
         evaluated = cast(Integer, evaluated)
-        self.assertEquals(evaluated._value, expected)
\ No newline at end of file
+        self.assertEquals(evaluated._value, expected)
+
+class TailCallTest(TestCase):
+
+    def test_deep_tail_recursion(self) -> None:
+        # Mucho más profundo que el límite de recursión de Python
+        tests: List[Tuple[str, int]] = [
+            ('''
+                 variable suma = procedimiento(n, acc) {
+                     si (n == 0) {
+                         regresa acc;
+                     }
+                     regresa suma(n - 1, acc + n);
+                 };
+                 suma(20000, 0);
+             ''', 200010000),
+            ('''
+                 variable c = procedimiento(n) {
+                     si (n == 0) {
+                         regresa 0;
+                     }
+                     regresa c(n - 1);
+                 };
+                 c(20000);
+             ''', 0),
+        ]
+
+        for engine in [Engine.TREE, Engine.TIERED]:
+            for source, expected in tests:
+                program: Program = Parser(Lexer(source)).parse_program()
+
+                evaluated = execute(program, Environment(), engine)
+
+                assert evaluated is not None
+                self.assertIsInstance(evaluated, Integer)
+                self.assertEquals(cast(Integer, evaluated)._value, expected)
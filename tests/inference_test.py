@@ -0,0 +1,177 @@
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from lpp.ast import (
+    Block,
+    ExpressionStatement,
+    Function,
+    Identifier,
+    Infix,
+    LetStatement,
+    Program,
+)
+from lpp.engine import (
+    Engine,
+    execute,
+)
+from lpp.evaluator import evaluate
+from lpp.inference import (
+    _walk,
+    infer_types,
+    InferenceReport,
+)
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Error,
+    Integer,
+    Object,
+    String,
+)
+from lpp.parser import Parser
+
+
+class InferredEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    def _evaluate_tests(self, source: str) -> Object:
+        program: Program = Parser(Lexer(source)).parse_program()
+        infer_types(program)
+
+        evaluated = evaluate(program, Environment())
+
+        assert evaluated is not None
+        return evaluated
+
+
+class InferredClosuresTest(evaluator_test.EvaluatorTest):
+
+    def _evaluate_tests(self, source: str) -> Object:
+        program: Program = Parser(Lexer(source)).parse_program()
+        infer_types(program)
+
+        evaluated = execute(program, Environment(), Engine.CLOSURES)
+
+        assert evaluated is not None
+        return evaluated
+
+
+class InferenceTest(TestCase):
+
+    def test_integer_operations(self) -> None:
+        source: str = '''
+            variable fibonacci = procedimiento(n) {
+                si (n < 2) {
+                    regresa n;
+                }
+                regresa fibonacci(n - 1) + fibonacci(n - 2);
+            };
+            fibonacci(10);
+        '''
+        program, report = self._infer(source)
+
+        self.assertEquals(report, InferenceReport(4, 4, 0, 3))
+        for node in self._infix_nodes(program):
+            assert node.cache is not None
+            self.assertIs(node.cache[0], Integer)
+            self.assertIs(node.cache[1], Integer)
+
+    def test_string_operations(self) -> None:
+        source: str = '''
+            variable saluda = procedimiento(nombre) { "hola " + nombre };
+            saluda("mundo") == "hola mundo";
+        '''
+        program, report = self._infer(source)
+
+        self.assertEquals(report, InferenceReport(2, 0, 2))
+        for node in self._infix_nodes(program):
+            assert node.cache is not None
+            self.assertIs(node.cache[0], String)
+
+    def test_unspecialized_operations(self) -> None:
+        tests: List[Tuple[str, InferenceReport]] = [
+            # El procedimiento se usa como valor, sus parámetros pueden ser lo que sea
+            ('variable f = procedimiento(x) { x + 1 }; variable g = f; f(1);', InferenceReport(1, 0, 0)),
+            ('variable f = procedimiento(x) { x + 1 }; f(1); f("a");', InferenceReport(1, 0, 0)),
+            ('variable x = 1; variable x = "a"; x + x;', InferenceReport(1, 0, 0)),
+            ('1 == verdadero;', InferenceReport(1, 0, 0)),
+            ('"a" - "b";', InferenceReport(1, 0, 0)),
+            ('longitud("a") + 1;', InferenceReport(1, 0, 0)),
+            ('procedimiento(x) { x * 2 }(3);', InferenceReport(1, 0, 0)),
+            ('variable x = si (verdadero) { regresa 1; }; x + 1;', InferenceReport(1, 0, 0)),
+        ]
+
+        for source, expected in tests:
+            _, report = self._infer(source)
+            self.assertEquals(report, expected)
+
+    def test_exact_operations(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('variable f = procedimiento(x) { x * x - 2 * -x }; f(3); f(4 + 1);', 4),
+            ('variable f = procedimiento(x) { procedimiento(y) { x * y } }; f(3)(4);', 0),
+            ('variable f = procedimiento(x) { procedimiento() { x * 2 } }; f(3)();', 1),
+            # Una llamada sin el argumento o con uno que puede no ser entero
+            ('variable f = procedimiento(x, y) { x + y }; f(1, 2); f(1);', 0),
+            ('variable f = procedimiento(n) { n + 1 }; variable m = 1; f(m);', 0),
+            ('variable f = procedimiento(n) { n + 1 }; f(longitud("a"));', 0),
+            # El nombre del parámetro se vuelve a asignar o está repetido
+            ('variable f = procedimiento(x) { variable x = 2; x + 1 }; f(1);', 0),
+            ('variable f = procedimiento(x) { procedimiento() { variable x = 2; x } }; f(1)() + 1;', 0),
+            ('variable f = procedimiento(x, x) { x + 1 }; f(1, 2);', 0),
+            ('variable f = procedimiento(a, b) { si (b < 1) { regresa a; } f(a + 1, b - 1) }; f(0, 3);', 3),
+        ]
+
+        for source, expected in tests:
+            _, report = self._infer(source)
+            self.assertEquals(report.exact_nodes, expected)
+
+    def test_guard(self) -> None:
+        # x se lee antes de asignarse: la inferencia dice entero pero es un error, y el
+        # evaluador lo detecta al comparar los tipos de los operandos
+        source: str = '''
+            variable f = procedimiento() { x + 1 };
+            variable resultado = f();
+            variable x = 1;
+            resultado;
+        '''
+        for engine in [Engine.TREE, Engine.CLOSURES]:
+            program, report = self._infer(source)
+            self.assertEquals(report.integer_nodes, 1)
+
+            evaluated = execute(program, Environment(), engine)
+
+            self.assertIsInstance(evaluated, Error)
+            self.assertEquals(cast(Error, evaluated).message, 'Discrepancia de tipos: ERROR + INTEGER')
+
+    def test_exact_operations_guard(self) -> None:
+        # Si un parámetro marcado como entero no lo es, las closures sin revisión de
+        # tipos regresan a la evaluación genérica en lugar de fallar en Python
+        program, report = self._infer('variable f = procedimiento(n) { n + 1 }; f("a");')
+        self.assertEquals(report.exact_nodes, 0)
+
+        function = cast(Function, cast(LetStatement, program.statements[0]).value)
+        addition = cast(Infix, cast(ExpressionStatement, cast(Block, function.body).statements[0]).expression)
+        cast(Identifier, addition.left).cache = Integer
+
+        evaluated = execute(program, Environment(), Engine.CLOSURES)
+
+        self.assertIsInstance(evaluated, Error)
+        self.assertEquals(cast(Error, evaluated).message, 'Discrepancia de tipos: STRING + INTEGER')
+
+    def test_share(self) -> None:
+        self.assertEquals(InferenceReport(0, 0, 0).share(), 0.0)
+        self.assertEquals(InferenceReport(4, 2, 1).share(), 0.75)
+        self.assertEquals(str(InferenceReport(4, 2, 1, 1)),
+                          '3 de 4 operaciones especializadas (75%): 2 entre enteros (1 sin revisar tipos), 1 entre cadenas')
+
+    def _infer(self, source: str) -> Tuple[Program, InferenceReport]:
+        program: Program = Parser(Lexer(source)).parse_program()
+
+        return program, infer_types(program)
+
+    def _infix_nodes(self, program: Program) -> List[Infix]:
+        return [cast(Infix, node) for node in _walk(program) if type(node) == Infix]
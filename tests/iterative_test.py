@@ -0,0 +1,68 @@
+from typing import cast
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from lpp.ast import Program
+from lpp.engine import Engine
+from lpp.iterative import (
+    DEFAULT_MAX_DEPTH,
+    evaluate_iterative,
+)
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Error,
+    Integer,
+    Object,
+)
+from lpp.parser import Parser
+
+
+class IterativeEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: Engine = Engine.ITERATIVE
+
+
+class IterativeTest(TestCase):
+
+    _SUM: str = '''
+        variable suma = procedimiento(n) {
+            si (n == 0) {
+                regresa 0;
+            }
+            regresa n + suma(n - 1);
+        };
+        suma(N);
+    '''
+
+    def test_deep_recursion(self) -> None:
+        # Recursión que no es de cola, mucho más profunda que el límite de Python
+        evaluated = self._evaluate(self._SUM.replace('N', '50000'))
+
+        self.assertIsInstance(evaluated, Integer)
+        self.assertEquals(cast(Integer, evaluated)._value, 1250025000)
+
+    def test_deeply_nested_expression(self) -> None:
+        evaluated = self._evaluate('1' + ' + 1' * 20000 + ';')
+
+        self.assertIsInstance(evaluated, Integer)
+        self.assertEquals(cast(Integer, evaluated)._value, 20001)
+
+    def test_max_depth(self) -> None:
+        evaluated = self._evaluate(self._SUM.replace('N', '200'), max_depth=100)
+
+        self.assertIsInstance(evaluated, Error)
+        self.assertEquals(cast(Error, evaluated).message, 'Profundidad máxima de llamadas excedida: 100')
+
+        evaluated = self._evaluate(self._SUM.replace('N', '99'), max_depth=100)
+
+        self.assertIsInstance(evaluated, Integer)
+        self.assertEquals(cast(Integer, evaluated)._value, 4950)
+
+    def _evaluate(self, source: str, max_depth: int = DEFAULT_MAX_DEPTH) -> Object:
+        program: Program = Parser(Lexer(source)).parse_program()
+
+        evaluated = evaluate_iterative(program, Environment(), max_depth)
+
+        assert evaluated is not None
+        return evaluated
@@ -1,13 +1,29 @@
+from io import StringIO
+from mmap import (
+    ACCESS_READ,
+    mmap,
+)
+from random import Random
+from tempfile import TemporaryFile
 from unittest import TestCase
-from typing import List
+from typing import (
+    List,
+    Union,
+)
 from lpp import token
 
 from lpp.token import (
     Token,
+    TokenBuffer,
     TokenType
 )
 
-from lpp.lexer import Lexer
+from lpp.lexer import (
+    Lexer,
+    lex_parallel,
+    RegexLexer,
+    tokenize,
+)
 
 class LexerTest(TestCase):
 
@@ -236,4 +252,121 @@ class LexerTest(TestCase):
             Token(TokenType.SEMICOLON, ';'),
         ]
 
-        self.assertEquals(tokens, expected_tokens)
\ No newline at end of file
+        self.assertEquals(tokens, expected_tokens)
+
+    def test_regex_lexer_differential(self) -> None:
+        sources: List[str] = [
+            '''
+                variable suma = procedimiento(x, y) {
+                    regresa x + y;
+                };
+                si (suma(1, 2) != 3) { falso } si_no { verdadero };
+                variable año_2 = "Hola mundo" == "Hola";
+            ''',
+            'si_no sino si_ si1 variable2 verdadero_ __',
+            '"sin cerrar',
+            '¡¿@ 12abc !== ===',
+        ]
+
+        alphabet: List[str] = list('abcsinoáñ_019 \n\t"=!+-*/<>(){},;¡@') + ['si', 'si_no', 'falso', '==', '٣']
+        random = Random(0)
+        for _ in range(500):
+            sources.append(''.join(random.choice(alphabet) for _ in range(random.randint(0, 40))))
+
+        for source in sources:
+            self.assertEquals(self._tokenize(Lexer(source)),
+                              self._tokenize(RegexLexer(source)))
+
+    def test_streaming_sources(self) -> None:
+        source: str = '''
+            variable año = "cadena que cruza pedazos ñÑ";
+            si (año == "x") { regresa verdadero; } si_no { regresa falso; }
+            variable resultado_largo = 12345 != 678;
+        '''
+        expected_tokens = self._tokenize(Lexer(source))
+
+        with TemporaryFile() as file:
+            file.write(source.encode('utf-8'))
+            file.flush()
+
+            with mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+                for chunk_size in (1, 2, 3, 7, 64):
+                    self.assertEquals(self._tokenize(Lexer.from_file(StringIO(source), chunk_size)),
+                                      expected_tokens)
+                    self.assertEquals(self._tokenize(Lexer.from_mmap(buffer, chunk_size)),
+                                      expected_tokens)
+
+    def test_token_buffer(self) -> None:
+        source: str = '''
+            variable saludo = procedimiento(nombre) {
+                regresa "Hola " + nombre + "!";
+            };
+            saludo("David") != 10;
+        '''
+        buffer = tokenize(source)
+        expected_tokens = self._tokenize(Lexer(source))
+
+        self.assertEquals(len(buffer), len(expected_tokens))
+        self.assertEquals(list(buffer), expected_tokens)
+        self.assertEquals(buffer.token_type(3), TokenType.FUNCTION)
+        self.assertEquals(buffer.literal(1), 'saludo')
+
+        start, end = buffer.span(1)
+        self.assertEquals(source[start:end], 'saludo')
+
+        self.assertEquals(self._tokenize(buffer), expected_tokens)
+        self.assertEquals(buffer.next_token(), Token(TokenType.EOF, ''))
+
+    def test_interned_identifiers(self) -> None:
+        source: str = '''
+            variable contador = 1;
+            variable otro = contador + contador;
+            si (otro) { contador } si_no { otro };
+        '''
+        lexer = Lexer(source)
+        tokens = self._tokenize(lexer)
+
+        identifiers: List[str] = [token.literal for token in tokens if token.token_type == TokenType.IDENT]
+        self.assertEquals(len(identifiers), 7)
+        self.assertEquals(lexer.interned_identifiers, 2)
+
+        contador, *rest = [literal for literal in identifiers if literal == 'contador']
+        for literal in rest:
+            self.assertIs(literal, contador)
+
+        lets: List[str] = [token.literal for token in tokens if token.token_type == TokenType.LET]
+        self.assertIs(lets[0], lets[1])
+
+        # La tabla se puede compartir entre varios lexers
+        other = Lexer('contador + nuevo', identifiers=lexer._identifiers)
+        self.assertIs(other.next_token().literal, contador)
+        self.assertEquals(other.interned_identifiers, 2)
+        other.next_token()
+        other.next_token()
+        self.assertEquals(other.interned_identifiers, 3)
+
+        buffer = tokenize(source)
+        self.assertIs(buffer.literal(1), buffer.literal(8))
+
+    def test_lex_parallel(self) -> None:
+        source: str = '''
+            variable texto = "un string
+            con saltos de
+            línea";
+            variable suma = procedimiento(x, y) {
+                regresa x + y;
+            };
+        ''' * 50 + '"sin cerrar\n al final'
+        expected_tokens = list(tokenize(source))
+
+        for workers in (1, 2, 3):
+            self.assertEquals(list(lex_parallel(source, workers=workers)), expected_tokens)
+
+        self.assertEquals(list(lex_parallel('', workers=2)), [Token(TokenType.EOF, '')])
+
+    def _tokenize(self, lexer: Union[Lexer, TokenBuffer]) -> List[Token]:
+        tokens: List[Token] = [lexer.next_token()]
+        while tokens[-1].token_type != TokenType.EOF:
+            tokens.append(lexer.next_token())
+
+        return tokens
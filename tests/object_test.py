@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from lpp.object import (
+    Boolean,
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Integer,
+    new_integer,
+    Null,
+    Return,
+    SMALL_INTEGER_MAX,
+    SMALL_INTEGER_MIN,
+    String,
+)
+
+
+class ObjectTest(TestCase):
+
+    def test_small_integers_are_shared(self) -> None:
+        for value in [SMALL_INTEGER_MIN, -1, 0, 1, 10, SMALL_INTEGER_MAX]:
+            self.assertIs(new_integer(value), new_integer(value))
+            self.assertEquals(new_integer(value)._value, value)
+
+    def test_big_integers(self) -> None:
+        for value in [SMALL_INTEGER_MIN - 1, SMALL_INTEGER_MAX + 1, 10 ** 20]:
+            integer = new_integer(value)
+
+            self.assertIsInstance(integer, Integer)
+            self.assertEquals(integer._value, value)
+            self.assertIsNot(integer, new_integer(value))
+
+    def test_objects_use_slots(self) -> None:
+        objects = [
+            Integer(1),
+            Boolean(True),
+            Null(),
+            Return(Integer(1)),
+            Error('error'),
+            Function([], None, Environment()),  # type: ignore
+            String('hola'),
+            Builtin(fn=lambda *args: Null()),
+            Environment(),
+        ]
+
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
@@ -0,0 +1,155 @@
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from lpp.ast import Program
+from lpp.evaluator import evaluate
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.optimizer import optimize
+from lpp.parser import (
+    IterativeParser,
+    Parser,
+)
+
+
+class OptimizedEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    def _evaluate_tests(self, source: str) -> Object:
+        program: Program = optimize(Parser(Lexer(source)).parse_program())
+
+        evaluated = evaluate(program, Environment())
+
+        assert evaluated is not None
+        return evaluated
+
+
+class OptimizerTest(TestCase):
+
+    def test_optimized_programs(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('2 * 3 + 4;', '10'),
+            ('-(5 - 10);', '5'),
+            ('!verdadero; !5;', 'falsofalso'),
+            ('"a" + "b" == "ab";', 'verdadero'),
+            ('1 == verdadero;', 'falso'),
+            ('5 + verdadero;', '(5 + verdadero)'),
+            ('-"a";', '(-a)'),
+            ('5 / 0;', '(5 / 0)'),
+            ('variable x = 2 * 5; x * x;', 'variable x = 10;100'),
+            ('x; variable x = 2; x;', 'xvariable x = 2;2'),
+            ('variable x = 1; variable x = 2; x;', 'variable x = 1;variable x = 2;x'),
+            ('variable x = 1; variable f = procedimiento(x) { x }; x;',
+             'variable x = 1;variable f = procedimiento(x) x;x'),
+            ('variable x = 1; variable f = procedimiento(y) { x + y }; f(x);',
+             'variable x = 1;variable f = procedimiento(y) (1 + y);2'),
+            ('si (verdadero) { variable y = 3; } y;', 'variable y = 3;y'),
+            ('si (1 < 2) { 10 } si_no { 20 };', '10'),
+            ('variable x = si (falso) { 10 } si_no { 20 };', 'variable x = 20;'),
+            ('si (falso) { 10 }; 5;', '5'),
+            ('si (falso) { 10 };', 'si falso '),
+            ('variable f = procedimiento(x) { regresa x; x + 1; }; f(1);',
+             'variable f = procedimiento(x) regresa x;;1'),
+            ('si (verdadero) { regresa 1; } 2;', 'regresa 1;'),
+            ('si (y) { 1 + 1 } si_no { 2 * 2 };', 'si y 2si_no 4'),
+        ]
+
+        for source, expected in tests:
+            program: Program = optimize(Parser(Lexer(source)).parse_program())
+
+            self.assertEquals(str(program), expected, source)
+
+    def test_inlining(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('variable d = procedimiento(x) { regresa x * 2; }; variable f = procedimiento(n) { d(n - 1) }; f(y);',
+             'variable d = procedimiento(x) regresa (x * 2);;variable f = procedimiento(n) ((n - 1) * 2);((y - 1) * 2)'),
+            ('variable d = procedimiento(x) { x * 2 }; d(3);', 'variable d = procedimiento(x) (x * 2);6'),
+            # Antes de asignarse, con otra asignación, con más o menos argumentos
+            ('d(1); variable d = procedimiento(x) { x * 2 };', 'd(1)variable d = procedimiento(x) (x * 2);'),
+            ('variable d = procedimiento(x) { x * 2 }; variable d = procedimiento(x) { x }; d(1);',
+             'variable d = procedimiento(x) (x * 2);variable d = procedimiento(x) x;d(1)'),
+            ('variable d = procedimiento(x) { x * 2 }; d(1, 2); d();',
+             'variable d = procedimiento(x) (x * 2);d(1, 2)d()'),
+            # Cuerpos que dependen del ambiente o que llaman procedimientos
+            ('variable f = procedimiento(x) { x * k }; f(1);', 'variable f = procedimiento(x) (x * k);f(1)'),
+            ('variable f = procedimiento(x) { f(x) }; f(1);', 'variable f = procedimiento(x) f(x);f(1)'),
+            # Argumentos que se evaluarían distinto
+            ('variable c = procedimiento(x) { x * x }; c(g(1)); c(y);',
+             'variable c = procedimiento(x) (x * x);c(g(1))(y * y)'),
+            ('variable k = procedimiento(x, y) { x }; k(1, g(2)); k(1, y);',
+             'variable k = procedimiento(x, y) x;k(1, g(2))1'),
+            ('variable s = procedimiento(a, b) { a - b }; s(g(1), g(2)); s(g(1), 2);',
+             'variable s = procedimiento(a, b) (a - b);s(g(1), g(2))(g(1) - 2)'),
+            ('variable n = procedimiento(x) { -x }; n(si (y) { 1 });',
+             'variable n = procedimiento(x) (-x);n(si y 1)'),
+        ]
+
+        for source, expected in tests:
+            program: Program = optimize(Parser(Lexer(source)).parse_program())
+
+            self.assertEquals(str(program), expected, source)
+
+    def test_inline_threshold(self) -> None:
+        source: str = 'variable d = procedimiento(x) { x * 2 }; d(y);'
+
+        for threshold, expected in [(0, 'd(y)'), (2, 'd(y)'), (3, '(y * 2)')]:
+            program: Program = optimize(Parser(Lexer(source)).parse_program(), inline_threshold=threshold)
+
+            self.assertEquals(str(program), f'variable d = procedimiento(x) (x * 2);{expected}')
+
+    def test_same_results_as_unoptimized(self) -> None:
+        sources: List[str] = [
+            'variable x = 5; si (x > 3) { variable y = x * 2; y } si_no { 0 };',
+            'si (verdadero) { 5 + verdadero; 1 } 2;',
+            'si (verdadero) { variable a = 1; } 7;',
+            'variable f = procedimiento() { si (1 > 0) { regresa 3; } 4 }; f();',
+            'variable a = "x"; longitud(a + a + "y");',
+            'variable x = 1; variable f = procedimiento() { x }; variable g = procedimiento(x) { f() }; g(2);',
+            'variable d = procedimiento(x) { x * 2 }; d("a");',
+            'variable d = procedimiento(x) { x * 2 }; d(z);',
+            'variable d = procedimiento(x) { x * 2 }; d(procedimiento() { 1 }());',
+            'variable s = procedimiento(a, b) { a - b }; variable g = procedimiento(n) { n }; s(g(1), 2);',
+            '''
+                variable doble = procedimiento(x) { regresa x * 2; };
+                variable suma = procedimiento(n) {
+                    si (n < 1) {
+                        regresa 0;
+                    }
+                    regresa doble(n) + suma(n - 1);
+                };
+                suma(10);
+            ''',
+        ]
+
+        for source in sources:
+            program: Program = Parser(Lexer(source)).parse_program()
+
+            expected = self._inspect(evaluate(program, Environment()))
+            optimized = self._inspect(evaluate(optimize(program), Environment()))
+
+            self.assertEquals(optimized, expected, source)
+
+    def test_original_program_is_not_modified(self) -> None:
+        program: Program = Parser(Lexer('variable x = 1 + 2; x;')).parse_program()
+
+        optimize(program)
+
+        self.assertEquals(str(program), 'variable x = (1 + 2);x')
+
+    def test_deep_program_is_left_unchanged(self) -> None:
+        program: Program = IterativeParser(Lexer('-' * 50_000 + '1;')).parse_program()
+
+        self.assertIs(optimize(program), program)
+
+    def _inspect(self, evaluated: Optional[Object]) -> Optional[Tuple[str, str]]:
+        if evaluated is None:
+            return None
+
+        return evaluated.type().name, evaluated.inspect()
@@ -26,8 +26,14 @@ from typing import (
     Tuple
 )
 
-from lpp.lexer import Lexer
-from lpp.parser import Parser
+from lpp.lexer import (
+    Lexer,
+    tokenize,
+)
+from lpp.parser import (
+    IterativeParser,
+    Parser,
+)
 
 
 class ParserTest(TestCase):
@@ -263,6 +269,106 @@ class ParserTest(TestCase):
             self._test_program_statements(parser, program, expected_statement_count)
             self.assertEquals(str(program), expected_result)
 
+    def test_parse_token_buffer(self) -> None:
+        source: str = '''
+            procedimiento(x, y) {
+                variable suma = x + y;
+                regresa suma;
+            }(1, 2);
+            si (suma(1, 2) > 2) { verdadero } si_no { -3 * 5 };
+        '''
+        expected_program: Program = Parser(Lexer(source)).parse_program()
+
+        parser: Parser = Parser(tokenize(source))
+        program: Program = parser.parse_program()
+
+        self._test_program_statements(parser, program, 2)
+        self.assertEquals(str(program), str(expected_program))
+
+    def test_iterative_parser(self) -> None:
+        sources: List[str] = [
+            '''
+                variable suma = procedimiento(x, y) {
+                    regresa x + y * -(x - 1);
+                };
+                si (suma(1, 2) > !verdadero) { 10 } si_no { suma(suma(1, 2), 3) };
+                procedimiento() { regresa falso == (5 < 4); }();
+                variable nada = procedimiento() {}();
+            ''',
+            'a + b * c + d / e - f; 3 - 4 * 5 == 3 * 1 + 4 * 5; !-a',
+            'variable x 5; variable = 10; regresa ; 1 + ;',
+            'si (x { 1 } si_no 2; procedimiento x) {}; (1 + 2; } 5',
+        ]
+
+        for source in sources:
+            parser: Parser = Parser(Lexer(source))
+            program: Program = parser.parse_program()
+
+            iterative_parser: Parser = IterativeParser(Lexer(source))
+            iterative_program: Program = iterative_parser.parse_program()
+
+            self.assertEquals(str(iterative_program), str(program))
+            self.assertEquals(iterative_parser.errors, parser.errors)
+
+    def test_iterative_parser_deep_nesting(self) -> None:
+        depth: int = 100_000
+        test_sources: List[Tuple[str, Type]] = [
+            ('-' * depth + '1;', Prefix),
+            ('(' * depth + '1' + ')' * depth + ';', Integer),
+            ('f(' * depth + '1' + ')' * depth + ';', Call),
+            ('si (x) { ' * depth + '1' + ' }' * depth, If),
+        ]
+
+        for source, expected_type in test_sources:
+            parser: Parser = IterativeParser(Lexer(source))
+            program: Program = parser.parse_program()
+
+            self._test_program_statements(parser, program)
+
+            expression = cast(ExpressionStatement, program.statements[0]).expression
+            self.assertIsInstance(expression, expected_type)
+
+            nesting: int = 0
+            while isinstance(expression, (Prefix, Call, If)):
+                if isinstance(expression, Prefix):
+                    expression = expression.right
+                elif isinstance(expression, Call):
+                    assert expression.arguments is not None
+                    expression = expression.arguments[0]
+                else:
+                    assert expression.consequence is not None
+                    expression = cast(ExpressionStatement,
+                                      expression.consequence.statements[0]).expression
+                nesting += 1
+
+            self.assertIsInstance(expression, Integer)
+            if expected_type != Integer:
+                self.assertEquals(nesting, depth)
+
+    def test_node_positions(self) -> None:
+        source: str = 'variable x = 5;\nsuma(x, "a") * -2;'
+
+        for parser in (Parser(Lexer(source)), Parser(tokenize(source)), IterativeParser(Lexer(source))):
+            program: Program = parser.parse_program()
+
+            let_statement = cast(LetStatement, program.statements[0])
+            self.assertEquals(let_statement.position, 0)
+            assert let_statement.name is not None and let_statement.value is not None
+            self.assertEquals(let_statement.name.position, 9)
+            self.assertEquals(let_statement.value.position, 13)
+
+            infix = cast(Infix, cast(ExpressionStatement, program.statements[1]).expression)
+            self.assertEquals(infix.position, 29)
+
+            call = cast(Call, infix.left)
+            self.assertEquals(call.position, 20)
+            self.assertEquals(call.function.position, 16)
+            assert call.arguments is not None
+            self.assertEquals([argument.position for argument in call.arguments], [21, 25])
+
+            prefix = cast(Prefix, infix.right)
+            self.assertEquals((prefix.position, cast(Expression, prefix.right).position), (31, 32))
+
     def test_call_expression(self) -> None:
         source: str = 'suma(1, 2 * 3, 4 + 5);'
         lexer: Lexer = Lexer(source)
@@ -418,6 +524,30 @@ class ParserTest(TestCase):
         self.assertIsInstance(string_literal, StringLiteral)
         self.assertEquals(string_literal.value, 'hello world!')
 
+    def test_constant_pool(self) -> None:
+        source: str = '"hola" + "hola"; 2000 * 2000 - 5;'
+        parser: Parser = Parser(Lexer(source))
+
+        program: Program = parser.parse_program()
+
+        strings = cast(Infix, cast(ExpressionStatement, program.statements[0]).expression)
+        left = cast(StringLiteral, strings.left)
+        right = cast(StringLiteral, strings.right)
+        assert left.cache is not None
+        self.assertEquals(left.cache.inspect(), 'hola')
+        self.assertIs(left.cache, right.cache)
+        self.assertIsNone(strings.cache)
+
+        subtraction = cast(Infix, cast(ExpressionStatement, program.statements[1]).expression)
+        multiplication = cast(Infix, subtraction.left)
+        first = cast(Integer, multiplication.left)
+        assert first.cache is not None
+        self.assertEquals(first.cache.inspect(), '2000')
+        self.assertIs(first.cache, cast(Integer, multiplication.right).cache)
+
+        # hola, 2000 y 5
+        self.assertEquals(len(parser.constants), 3)
+
     def _test_boolean(self,
                     expression: Expression,
                     expected_value: bool) -> None:
@@ -425,7 +555,7 @@ class ParserTest(TestCase):
 
         boolean = cast(Boolean, expression)
         self.assertEquals(boolean.value, expected_value)
-        self.assertEquals(boolean.token.literal, 'verdadero' if expected_value else 'falso')
+        self.assertEquals(boolean.token_literal(), 'verdadero' if expected_value else 'falso')
 
     def test_infix_expressions(self) -> None:
         source: str = '''
@@ -532,7 +662,7 @@ class ParserTest(TestCase):
         # Comprobamos que el valor del identifier sea el expected_value ("foobar")
         self.assertEquals(identifier.value, expected_value)
         # Comprobamos que la literal del token sea el expected_value
-        self.assertEquals(identifier.token.literal, expected_value)
+        self.assertEquals(identifier.token_literal(), expected_value)
 
     def _test_integer(self,
                     expression: Expression,
@@ -543,4 +673,4 @@ class ParserTest(TestCase):
         # Hacemos nuestro cast para que podamos acceder a value
         integer = cast(Integer, expression)
         self.assertEquals(integer.value, expected_value)
-        self.assertEquals(integer.token.literal, str(expected_value))
\ No newline at end of file
+        self.assertEquals(integer.token_literal(), str(expected_value))
\ No newline at end of file
@@ -0,0 +1,165 @@
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from lpp.ast import (
+    Call,
+    ExpressionStatement,
+    Function,
+    Identifier,
+    LetStatement,
+    Program,
+)
+from lpp.builtins import BUILTINS
+from lpp.engine import Engine
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Error,
+    Integer,
+)
+from lpp.parser import Parser
+from lpp.resolver import (
+    evaluate_resolved,
+    resolve,
+    Resolution,
+    SlotFunction,
+)
+
+
+class SlotsEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: Engine = Engine.SLOTS
+
+
+class ResolverTest(TestCase):
+
+    def test_slots(self) -> None:
+        source: str = '''
+            variable a = 1;
+            variable suma = procedimiento(x, y) {
+                variable z = x + y;
+                z + a
+            };
+        '''
+        program, resolution = self._resolve(source)
+
+        self.assertEquals(resolution.frame_sizes[program], 2)
+        self.assertEquals(resolution.lets[cast(LetStatement, program.statements[0])], 1)
+        self.assertEquals(resolution.lets[cast(LetStatement, program.statements[1])], 2)
+
+        function = cast(Function, cast(LetStatement, program.statements[1]).value)
+        self.assertEquals(resolution.frame_sizes[function], 3)
+
+        assert function.body is not None
+        body = function.body.statements
+        self.assertEquals(resolution.lets[cast(LetStatement, body[0])], 3)
+
+        expected_candidates: List[Tuple[Tuple[int, int], ...]] = [
+            ((0, 3),),
+            # a está en el frame del programa, un nivel afuera
+            ((1, 1),),
+        ]
+        expression = cast(ExpressionStatement, body[1]).expression
+        for identifier, expected in zip([expression.left, expression.right], expected_candidates):  # type: ignore
+            self.assertEquals(resolution.identifiers[cast(Identifier, identifier)].candidates, expected)
+
+    def test_parameters_end_the_search(self) -> None:
+        source: str = '''
+            variable x = 1;
+            variable f = procedimiento(x) { x };
+        '''
+        program, resolution = self._resolve(source)
+
+        function = cast(Function, cast(LetStatement, program.statements[1]).value)
+        assert function.body is not None
+        identifier = cast(ExpressionStatement, function.body.statements[0]).expression
+
+        binding = resolution.identifiers[cast(Identifier, identifier)]
+        self.assertEquals(binding.candidates, ((0, 1),))
+
+    def test_builtins_are_static(self) -> None:
+        program, resolution = self._resolve('longitud;')
+        identifier = cast(ExpressionStatement, program.statements[0]).expression
+
+        binding = resolution.identifiers[cast(Identifier, identifier)]
+        self.assertEquals(binding.candidates, ())
+        self.assertIs(binding.fallback, BUILTINS['longitud'])
+
+    def test_unassigned_variables_use_outer_scope(self) -> None:
+        # Igual que con Environment, antes de asignar z dentro del procedimiento se usa
+        # la z de afuera
+        source: str = '''
+            variable z = 5;
+            variable f = procedimiento() {
+                variable y = z;
+                variable z = 10;
+                y + z
+            };
+            f();
+        '''
+        evaluated = evaluate_resolved(Parser(Lexer(source)).parse_program())
+
+        assert evaluated is not None
+        self.assertIsInstance(evaluated, Integer)
+        self.assertEquals(evaluated.inspect(), '15')
+
+    def test_assigned_variables_end_the_search(self) -> None:
+        source: str = '''
+            variable x = 1;
+            variable f = procedimiento() {
+                variable y = x;
+                variable x = 2;
+                x + y
+            };
+        '''
+        program, resolution = self._resolve(source)
+
+        function = cast(Function, cast(LetStatement, program.statements[1]).value)
+        assert function.body is not None
+        body = function.body.statements
+
+        # Al leer y ya se asignó la x del programa; la x del procedimiento puede no estar
+        # asignada todavía
+        before = cast(Identifier, cast(LetStatement, body[0]).value)
+        self.assertEquals(resolution.identifiers[before].candidates, ((0, 2), (1, 1)))
+
+        expression = cast(ExpressionStatement, body[2]).expression
+        for identifier in [expression.left, expression.right]:  # type: ignore
+            self.assertEquals(len(resolution.identifiers[cast(Identifier, identifier)].candidates), 1)
+
+    def test_repeated_parameters(self) -> None:
+        program, resolution = self._resolve('procedimiento(x, x) { variable y = x; y }(1, 2);')
+
+        function = cast(Call, cast(ExpressionStatement, program.statements[0]).expression).function
+        self.assertEquals(resolution.frame_sizes[cast(Function, function)], 3)
+
+        evaluated = evaluate_resolved(program)
+        assert evaluated is not None
+        self.assertEquals(evaluated.inspect(), '2')
+
+    def test_function_object(self) -> None:
+        evaluated = evaluate_resolved(Parser(Lexer('procedimiento(x) { x };')).parse_program())
+
+        self.assertIsInstance(evaluated, SlotFunction)
+        self.assertIsInstance(cast(SlotFunction, evaluated).env, Environment)
+        self.assertEquals(evaluated.inspect(), 'procedimiento(x) {\n x\n}')  # type: ignore
+
+        # Los procedimientos no crean un ambiente cada uno
+        other = evaluate_resolved(Parser(Lexer('procedimiento(y) { y };')).parse_program())
+        self.assertIs(cast(SlotFunction, other).env, cast(SlotFunction, evaluated).env)
+
+    def test_unknown_identifier(self) -> None:
+        evaluated = evaluate_resolved(Parser(Lexer('variable f = procedimiento() { x }; f();')).parse_program())
+
+        self.assertIsInstance(evaluated, Error)
+        self.assertEquals(cast(Error, evaluated).message, 'Identificador no encontrado: x')
+
+    def _resolve(self, source: str) -> Tuple[Program, Resolution]:
+        program: Program = Parser(Lexer(source)).parse_program()
+
+        return program, resolve(program)
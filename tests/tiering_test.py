@@ -0,0 +1,109 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import tests.evaluator_test as evaluator_test
+from lpp.ast import Program
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.parser import Parser
+from lpp.tiering import Tiering
+
+
+class TieredEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    def _evaluate_tests(self, source: str) -> Object:
+        program: Program = Parser(Lexer(source)).parse_program()
+
+        # Con umbral 1 todas las llamadas pasan por la versión compilada
+        evaluated = Tiering(threshold=1).run(program, Environment())
+
+        assert evaluated is not None
+        return evaluated
+
+
+class TieringTest(TestCase):
+
+    _FIBONACCI: str = '''
+        variable fibonacci = procedimiento(n) {
+            si (n < 2) {
+                regresa n;
+            }
+            regresa fibonacci(n - 1) + fibonacci(n - 2);
+        };
+        variable doble = procedimiento(x) { x * 2 };
+        doble(fibonacci(10));
+    '''
+
+    def test_promotion(self) -> None:
+        tiering = Tiering(threshold=10)
+        evaluated = tiering.run(self._program(), Environment())
+
+        assert evaluated is not None
+        self.assertEquals(evaluated.inspect(), '110')
+
+        self.assertEquals(len(tiering.promotions), 1)
+        promotion = tiering.promotions[0]
+        self.assertEquals(promotion.function, 'procedimiento(n)')
+        self.assertEquals(promotion.calls, 10)
+        self.assertTrue(promotion.compiled)
+        self.assertIn('1 procedimientos promovidos', tiering.report())
+
+    def test_program_shared_by_two_tierings(self) -> None:
+        program: Program = self._program()
+        Tiering(threshold=10).run(program, Environment())
+
+        # El segundo usa el código que dejó el primero y lo reporta
+        tiering = Tiering(threshold=10)
+        evaluated = tiering.run(program, Environment())
+
+        assert evaluated is not None
+        self.assertEquals(evaluated.inspect(), '110')
+
+        self.assertEquals(len(tiering.promotions), 1)
+        promotion = tiering.promotions[0]
+        self.assertEquals(promotion.function, 'procedimiento(n)')
+        self.assertEquals(promotion.calls, 1)
+        self.assertTrue(promotion.compiled)
+        self.assertTrue(promotion.reused)
+        self.assertIn('1 procedimientos promovidos', tiering.report())
+        self.assertIn('ya compilado', tiering.report())
+
+    def test_compilation_failure_falls_back(self) -> None:
+        tiering = Tiering(threshold=10)
+
+        with patch('lpp.tiering.compile_node', side_effect=RecursionError):
+            evaluated = tiering.run(self._program(), Environment())
+
+        assert evaluated is not None
+        self.assertEquals(evaluated.inspect(), '110')
+        self.assertEquals(len(tiering.promotions), 1)
+        self.assertFalse(tiering.promotions[0].compiled)
+
+    def test_compiled_tail_calls(self) -> None:
+        # Con umbral 1 el regresa c(n - 1) se ejecuta en el cuerpo compilado
+        source: str = '''
+            variable c = procedimiento(n) {
+                si (n == 0) {
+                    regresa 0;
+                }
+                regresa c(n - 1);
+            };
+            c(20000);
+        '''
+        evaluated = Tiering(threshold=1).run(Parser(Lexer(source)).parse_program(), Environment())
+
+        assert evaluated is not None
+        self.assertEquals(evaluated.inspect(), '0')
+
+    def test_hook_is_removed(self) -> None:
+        import lpp.evaluator as evaluator
+
+        Tiering().run(self._program(), Environment())
+
+        self.assertIsNone(evaluator.call_hook)
+
+    def _program(self) -> Program:
+        return Parser(Lexer(self._FIBONACCI)).parse_program()
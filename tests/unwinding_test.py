@@ -0,0 +1,58 @@
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from lpp.engine import Engine
+from lpp.evaluator import evaluate
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.parser import Parser
+from lpp.unwinding import evaluate_unwinding
+
+
+class UnwindingEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: Engine = Engine.UNWINDING
+
+
+class UnwindingTest(TestCase):
+
+    def test_same_results_as_evaluate(self) -> None:
+        # Casos en los que un Return o un Error se usa como valor
+        sources: List[str] = [
+            'variable x = si (verdadero) { regresa 5; }; 10;',
+            'variable x = si (verdadero) { regresa 5; }; x; 10;',
+            'variable f = procedimiento() { variable x = si (verdadero) { regresa 5; }; 10 }; f();',
+            'variable f = procedimiento() { variable x = si (verdadero) { regresa 5; }; x; 10 }; f();',
+            '(1 + verdadero) == 1;',
+            'variable x = 1 + verdadero; 5;',
+            'variable x = 1 + verdadero; x; 5;',
+            'variable f = procedimiento() { 1 + verdadero; 5 }; f(); 6;',
+            'variable f = procedimiento() { regresa si (verdadero) { regresa 1; }; }; f();',
+            'variable f = procedimiento() { si (verdadero) { x; 1 } }; variable y = f(); 7;',
+            'si (si (verdadero) { regresa 1; }) { 2 } si_no { 3 };',
+            'variable f = procedimiento(x) { x }; f(si (falso) { 1 } si_no { 1 + falso });',
+            'regresa 1 - verdadero; 5;',
+            'variable f = procedimiento() { variable x = si (verdadero) { regresa 5; }; x }; f();',
+            'variable f = procedimiento() { 1 + falso }; variable y = f(); y == y;',
+            'variable f = procedimiento() { si (verdadero) { regresa 1; } si_no { 2 } }; f() + 1;',
+        ]
+
+        for source in sources:
+            expected = self._inspect(evaluate(Parser(Lexer(source)).parse_program(), Environment()))
+            evaluated = self._inspect(evaluate_unwinding(Parser(Lexer(source)).parse_program(), Environment()))
+
+            self.assertEquals(evaluated, expected, source)
+
+    def _inspect(self, evaluated: Optional[Object]) -> Tuple[str, str]:
+        if evaluated is None:
+            return ('', '')
+
+        return (type(evaluated).__name__, evaluated.inspect())
@@ -0,0 +1,88 @@
+from typing import (
+    List,
+    Optional,
+)
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from lpp.ast import Program
+from lpp.compiler import (
+    CodeObject,
+    compile_program,
+    disassemble,
+    OpCode,
+)
+from lpp.engine import Engine
+from lpp.lexer import Lexer
+from lpp.object import (
+    Environment,
+    Object,
+)
+from lpp.parser import Parser
+from lpp.vm import VirtualMachine
+
+
+class BytecodeEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: Engine = Engine.BYTECODE
+
+
+class VirtualMachineTest(TestCase):
+
+    def test_instructions(self) -> None:
+        code = self._compile('1 + 2; verdadero;')
+
+        self.assertEquals(self._opcodes(code), [
+            OpCode.CONSTANT,
+            OpCode.CONSTANT,
+            OpCode.ADD,
+            OpCode.JUMP_IF_STOP,
+            OpCode.POP,
+            OpCode.TRUE,
+            OpCode.HALT,
+        ])
+        self.assertEquals([constant.inspect() for constant in code.constants], ['1', '2'])
+
+    def test_constants_are_shared(self) -> None:
+        code = self._compile('variable x = 5; x + 5 + x;')
+
+        self.assertEquals(len(code.constants), 2)
+
+    def test_disassemble(self) -> None:
+        code = self._compile('variable doble = procedimiento(x) { x * 2 };')
+
+        self.assertEquals(disassemble(code), '\n'.join([
+            '== <programa> ==',
+            '0000 FUNCTION        0 (<procedimiento>)',
+            '0002 SET_NAME        1 (doble)',
+            '0004 HALT',
+            '== <procedimiento>(x) ==',
+            '0000 GET_NAME        0 (x)',
+            '0002 CONSTANT        1 (2)',
+            '0004 MUL',
+            '0006 LEAVE',
+        ]))
+
+    def test_deep_recursion(self) -> None:
+        source: str = '''
+            variable cuenta = procedimiento(n) {
+                si (n == 0) {
+                    regresa 0;
+                }
+                regresa 1 + cuenta(n - 1);
+            };
+            cuenta(20000);
+        '''
+
+        evaluated: Optional[Object] = VirtualMachine(self._compile(source), Environment()).run()
+
+        assert evaluated is not None
+        self.assertEquals(evaluated.inspect(), '20000')
+
+    def _compile(self, source: str) -> CodeObject:
+        program: Program = Parser(Lexer(source)).parse_program()
+
+        return compile_program(program)
+
+    def _opcodes(self, code: CodeObject) -> List[OpCode]:
+        return [OpCode(code.instructions[position]) for position in range(0, len(code.instructions), 2)]